@@ -170,6 +170,8 @@ class ArgumentParserFacade:
             arg_type = Path
         elif argument.type == "int":
             arg_type = int
+        elif argument.type == "float":
+            arg_type = float
         elif argument.type == "felt":
             arg_type = Command.Argument.Type.felt
 
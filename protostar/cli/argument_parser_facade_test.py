@@ -69,6 +69,20 @@ def test_int_argument():
         parser.parse(["--x", "foo"])
 
 
+def test_float_argument():
+    app = CLIApp(
+        root_args=[Command.Argument(name="x", description="...", type="float")]
+    )
+    parser = ArgumentParserFacade(app)
+
+    result = parser.parse(["--x", "1.5"])
+
+    assert result.x == 1.5
+
+    with pytest.raises(SystemExit):
+        parser.parse(["--x", "foo"])
+
+
 def test_short_name_argument():
     app = CLIApp(
         root_args=[
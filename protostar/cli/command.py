@@ -14,6 +14,7 @@ InputAllowedType = Literal[
     "bool",
     "regexp",
     "int",  # only decimal!
+    "float",
     "felt",
 ]
 
@@ -2,6 +2,7 @@ from protostar.commands.build import BuildCommand
 from protostar.commands.declare import DeclareCommand
 from protostar.commands.deploy import DeployCommand
 from protostar.commands.format import FormatCommand
+from protostar.commands.history import HistoryCommand
 from protostar.commands.init import InitCommand
 from protostar.commands.install import InstallCommand
 from protostar.commands.migrate import MigrateCommand
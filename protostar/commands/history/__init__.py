@@ -0,0 +1 @@
+from .history_command import HistoryCommand
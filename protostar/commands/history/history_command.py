@@ -0,0 +1,157 @@
+import csv
+import json
+from logging import Logger
+from pathlib import Path
+from typing import List, Optional, Pattern
+
+from protostar.cli import Command
+from protostar.commands.test.run_history import (
+    RUN_HISTORY_FILE_NAME,
+    HistoryRun,
+    RunHistory,
+)
+from protostar.utils.log_color_provider import LogColorProvider
+from protostar.utils.table import format_table
+
+
+class HistoryCommand(Command):
+    def __init__(
+        self,
+        project_root_path: Path,
+        log_color_provider: LogColorProvider,
+        logger: Logger,
+    ) -> None:
+        super().__init__()
+        self._project_root_path = project_root_path
+        self._log_color_provider = log_color_provider
+        self._logger = logger
+
+    @property
+    def name(self) -> str:
+        return "history"
+
+    @property
+    def description(self) -> str:
+        return "Show test runs recorded by `protostar test` and export their results."
+
+    @property
+    def example(self) -> Optional[str]:
+        return "$ protostar history --export history.csv"
+
+    @property
+    def arguments(self) -> List[Command.Argument]:
+        return [
+            Command.Argument(
+                name="runs",
+                type="int",
+                description="Number of the most recent runs to show and export.",
+                default=20,
+            ),
+            Command.Argument(
+                name="export",
+                type="path",
+                description=(
+                    "Write results of test cases from the shown runs to a CSV file, "
+                    "with a row per test case and run, e.g. to plot trends "
+                    "of time and steps."
+                ),
+            ),
+            Command.Argument(
+                name="filter",
+                type="regexp",
+                description=(
+                    "Export only test cases with IDs (`<test suite path>::<test case name>`) "
+                    "matching the regexp."
+                ),
+            ),
+        ]
+
+    async def run(self, args):
+        self.history(
+            runs_count=args.runs, export_path=args.export, test_id_filter=args.filter
+        )
+
+    def history(
+        self,
+        runs_count: int = 20,
+        export_path: Optional[Path] = None,
+        test_id_filter: Optional[Pattern] = None,
+    ):
+        database_path = self._project_root_path / ".protostar" / RUN_HISTORY_FILE_NAME
+        if not database_path.exists():
+            self._logger.warning("No test runs recorded yet")
+            return
+
+        run_history = RunHistory(database_path)
+        try:
+            runs = run_history.get_runs(limit=runs_count)
+            print(self._format_runs_table(runs))
+            if export_path:
+                self._export(run_history, runs, export_path, test_id_filter)
+                self._logger.info(f"Results of test cases saved to {export_path}")
+        finally:
+            run_history.close()
+
+    @staticmethod
+    def _export(
+        run_history: RunHistory,
+        runs: List[HistoryRun],
+        export_path: Path,
+        test_id_filter: Optional[Pattern],
+    ):
+        with open(export_path, mode="w", encoding="utf-8", newline="") as export_file:
+            writer = csv.writer(export_file)
+            writer.writerow(
+                [
+                    "run_id",
+                    "started_at",
+                    "git_commit",
+                    "test_id",
+                    "status",
+                    "execution_time",
+                    "steps",
+                    "memory_holes",
+                    "builtins",
+                ]
+            )
+            for run, test_result in run_history.iter_test_results(runs, test_id_filter):
+                writer.writerow(
+                    [
+                        run.id,
+                        run.started_at,
+                        run.git_commit or "",
+                        test_result.test_id,
+                        test_result.status,
+                        _format_optional(test_result.execution_time),
+                        _format_optional(test_result.steps),
+                        _format_optional(test_result.memory_holes),
+                        json.dumps(test_result.builtins, sort_keys=True)
+                        if test_result.builtins is not None
+                        else "",
+                    ]
+                )
+
+    def _format_runs_table(self, runs: List[HistoryRun]) -> str:
+        header = ["run", "started at", "commit", "passed", "failed", "broken", "time"]
+        rows = [
+            [
+                str(run.id),
+                run.started_at,
+                run.formatted_git_commit,
+                str(run.passed_count),
+                str(run.failed_count),
+                str(run.broken_count),
+                f"{run.execution_time:.2f}s",
+            ]
+            for run in runs
+        ]
+        return format_table(
+            header,
+            rows,
+            left_aligned_columns_count=3,
+            local_log_color_provider=self._log_color_provider,
+        )
+
+
+def _format_optional(value: Optional[float]) -> str:
+    return "" if value is None else f"{value:g}"
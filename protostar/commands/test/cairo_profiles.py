@@ -0,0 +1,54 @@
+from pathlib import Path
+from typing import List
+
+from protostar.commands.test.test_suite import TestCase, get_test_suite_dir_name
+from protostar.starknet.cairo_profiler import CairoProfiler
+from protostar.utils.pprof import encode_pprof
+
+
+def get_cairo_profile_path(profile_dir: Path, test_case: TestCase) -> Path:
+    """
+    Returns the path of profile files of the test case, without an extension.
+    """
+    return (
+        profile_dir
+        / get_test_suite_dir_name(test_case.test_path)
+        / test_case.test_fn_name
+    )
+
+
+def write_cairo_profile(
+    profiler: CairoProfiler, profile_dir: Path, test_case: TestCase
+) -> Path:
+    """
+    Writes the profile of the test case as:
+    - ``.folded`` — collapsed stacks, e.g. for ``flamegraph.pl`` or speedscope,
+    - ``.pb.gz`` — a pprof profile, e.g. for ``go tool pprof``,
+    - ``.txt`` — inclusive and exclusive steps of each function.
+    """
+    profile_path = get_cairo_profile_path(profile_dir, test_case)
+    profile_path.parent.mkdir(parents=True, exist_ok=True)
+
+    Path(f"{profile_path}.folded").write_text(
+        profiler.to_collapsed_stacks(), encoding="utf-8"
+    )
+    Path(f"{profile_path}.pb.gz").write_bytes(
+        encode_pprof(profiler.samples, sample_type="steps", unit="count")
+    )
+    Path(f"{profile_path}.txt").write_text(
+        format_cairo_profile_summary(profiler), encoding="utf-8"
+    )
+    return profile_path
+
+
+def format_cairo_profile_summary(profiler: CairoProfiler) -> str:
+    lines: List[str] = [
+        f"Total steps: {profiler.total_steps}",
+        "",
+        f"{'inclusive':>12} {'exclusive':>12}  function",
+    ]
+    for function_steps in profiler.get_functions_steps():
+        lines.append(
+            f"{function_steps.inclusive:>12} {function_steps.exclusive:>12}  {function_steps.name}"
+        )
+    return "\n".join(lines) + "\n"
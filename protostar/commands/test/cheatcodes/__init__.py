@@ -7,10 +7,12 @@ from .expect_revert_cheatcode import ExpectRevertCheatcode
 from .given_cheatcode import GivenCheatcode
 from .load_cheatcode import LoadCheatcode
 from .mock_call_cheatcode import MockCallCheatcode
+from .parametrize_cheatcode import ParametrizeCheatcode
 from .prepare_cheatcode import PrepareCheatcode, PreparedContract
 from .reflect_cheatcode import ReflectCheatcode
 from .reject_cheatcode import RejectCheatcode
 from .roll_cheatcode import RollCheatcode
+from .settings_cheatcode import SettingsCheatcode, SettingsLearnedException
 from .start_prank_cheatcode import StartPrankCheatcode
 from .store_cheatcode import StoreCheatcode
 from .warp_cheatcode import WarpCheatcode
@@ -46,7 +46,10 @@ class DeclareCheatcode(Cheatcode):
         if len(args) > 0:
             raise KeywordOnlyArgumentCheatcodeException(self.name, ["config"])
 
-        declared_class = asyncio.run(self._declare_contract(Path(contract_path_str)))
+        declared_class = asyncio.run_coroutine_threadsafe(
+            coro=self._declare_contract(Path(contract_path_str)),
+            loop=self.loop,
+        ).result()
         assert declared_class
         class_hash = declared_class.class_hash
 
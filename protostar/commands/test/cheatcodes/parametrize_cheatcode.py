@@ -0,0 +1,87 @@
+from typing import Any, Dict, List, Mapping, Sequence
+
+from typing_extensions import Protocol
+
+from protostar.commands.test.test_config import TestConfig, TestMode
+from protostar.commands.test.test_environment_exceptions import CheatcodeException
+from protostar.starknet.cheatcode import Cheatcode
+
+ParametersRow = Dict[str, Any]
+
+
+class ParametrizeCallable(Protocol):
+    def __call__(self, rows: Sequence[Any]) -> None:
+        ...
+
+
+class ParametrizeCheatcode(Cheatcode):
+    def __init__(
+        self,
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+        test_config: TestConfig,
+        parameter_names: List[str],
+    ):
+        super().__init__(syscall_dependencies)
+        self.test_config = test_config
+        self.parameter_names = parameter_names
+
+    @property
+    def name(self) -> str:
+        return "parametrize"
+
+    def build(self) -> ParametrizeCallable:
+        return self.parametrize
+
+    def parametrize(self, rows: Sequence[Any]) -> None:
+        if self.test_config.mode is TestMode.INVARIANT:
+            raise CheatcodeException(self, "Invariant tests cannot be parametrized.")
+
+        if not self.parameter_names:
+            raise CheatcodeException(
+                self, "Only test cases with parameters can be parametrized."
+            )
+
+        if isinstance(rows, (str, bytes, Mapping)) or not isinstance(rows, Sequence):
+            raise CheatcodeException(
+                self, "Expected a list of argument tuples or dictionaries."
+            )
+
+        if len(rows) == 0:
+            raise CheatcodeException(self, "Expected at least one row of arguments.")
+
+        self.test_config.parameters_rows = [
+            *(self.test_config.parameters_rows or []),
+            *(self._to_parameters_row(index, row) for index, row in enumerate(rows)),
+        ]
+        self.test_config.mode = TestMode.PARAMETRIZED
+
+    def _to_parameters_row(self, index: int, row: Any) -> ParametersRow:
+        if isinstance(row, Mapping):
+            if set(row.keys()) != set(self.parameter_names):
+                raise CheatcodeException(
+                    self,
+                    f"Row #{index} must provide exactly the following arguments: "
+                    f"{', '.join(self.parameter_names)}.",
+                )
+            return {name: row[name] for name in self.parameter_names}
+
+        if len(self.parameter_names) == 1 and not (
+            isinstance(row, tuple) and len(row) == 1
+        ):
+            # A row of a single-parameter test case is the argument itself,
+            # which can be a tuple (a struct) or a list (an array) on its own.
+            row = (row,)
+
+        if not isinstance(row, (tuple, list)):
+            raise CheatcodeException(
+                self, f"Row #{index} must be a tuple or a dictionary of arguments."
+            )
+
+        if len(row) != len(self.parameter_names):
+            raise CheatcodeException(
+                self,
+                f"Row #{index} has {len(row)} arguments, "
+                f"but the test case expects {len(self.parameter_names)}: "
+                f"{', '.join(self.parameter_names)}.",
+            )
+        return dict(zip(self.parameter_names, row))
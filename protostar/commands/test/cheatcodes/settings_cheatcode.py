@@ -0,0 +1,80 @@
+from typing import Any, Optional
+
+from typing_extensions import Protocol
+
+from protostar.commands.test.fuzzing.fuzz_time_budget import FuzzTimeBudgetConfig
+from protostar.commands.test.test_environment_exceptions import (
+    CheatcodeException,
+    KeywordOnlyArgumentCheatcodeException,
+)
+from protostar.starknet.cheatcode import Cheatcode
+
+
+class SettingsCallable(Protocol):
+    def __call__(
+        self,
+        *,
+        time_budget: Optional[float] = None,
+        shrink_time_limit: Optional[float] = None,
+    ) -> None:
+        ...
+
+
+class SettingsCheatcode(Cheatcode):
+    def __init__(
+        self,
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+        time_budget_config: FuzzTimeBudgetConfig,
+    ):
+        super().__init__(syscall_dependencies)
+        self.time_budget_config = time_budget_config
+
+    @property
+    def name(self) -> str:
+        return "settings"
+
+    def build(self) -> SettingsCallable:
+        return self.settings
+
+    def settings(
+        self,
+        *args: Any,
+        time_budget: Optional[float] = None,
+        shrink_time_limit: Optional[float] = None,
+    ) -> None:
+        if len(args) > 0:
+            raise KeywordOnlyArgumentCheatcodeException(
+                self.name, ["time_budget", "shrink_time_limit"]
+            )
+
+        learned = False
+
+        for setting_name, value in [
+            ("time_budget", time_budget),
+            ("shrink_time_limit", shrink_time_limit),
+        ]:
+            if value is None:
+                continue
+
+            if not isinstance(value, (int, float)) or value < 0:
+                raise CheatcodeException(
+                    self,
+                    f"Setting {setting_name} must be a non-negative number of seconds.",
+                )
+
+            if getattr(self.time_budget_config, setting_name) != value:
+                setattr(self.time_budget_config, setting_name, value)
+                learned = True
+
+        if learned:
+            raise SettingsLearnedException
+
+
+class SettingsLearnedException(BaseException):
+    """
+    An exception raised from the ``settings`` cheatcode, indicating that fuzzing settings
+    have changed.
+
+    Similarly to ``StrategyLearnedException``, the expected behaviour is to let fuzzer catch this
+    exception and restart fuzzing with new settings.
+    """
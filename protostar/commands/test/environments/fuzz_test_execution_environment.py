@@ -1,17 +1,24 @@
+import asyncio
 import dataclasses
+import functools
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from pathlib import Path
+from typing import Any, Dict, List, Mapping, Optional
 
-from hypothesis import given, seed, settings
+from hypothesis import Phase, given, reject, seed, settings, target
 from hypothesis.database import ExampleDatabase, InMemoryExampleDatabase
 from hypothesis.errors import InvalidArgument
 from hypothesis.reporting import with_reporter
+from hypothesis.strategies import SearchStrategy
+from starkware.cairo.lang.compiler.ast.cairo_types import CairoType
 from starkware.starknet.business_logic.execution.objects import CallInfo
 
 from protostar.commands.test.cheatcodes import (
     AssumeCheatcode,
     GivenCheatcode,
     RejectCheatcode,
+    SettingsCheatcode,
+    SettingsLearnedException,
 )
 from protostar.commands.test.cheatcodes.expect_revert_cheatcode import (
     ExpectRevertContext,
@@ -24,9 +31,28 @@ from protostar.commands.test.environments.test_execution_environment import (
     TestExecutionResult,
 )
 from protostar.commands.test.fuzzing.exceptions import HypothesisRejectException
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
 from protostar.commands.test.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
 )
+from protostar.commands.test.fuzzing.fuzz_partitions import (
+    FuzzPartition,
+    FuzzPartitionCancelledException,
+    FuzzPartitionsCancellation,
+    can_run_in_forked_processes,
+    run_in_forked_processes,
+)
+from protostar.commands.test.fuzzing.fuzz_telemetry import (
+    FuzzTelemetry,
+    FuzzTelemetryExceptionMetadata,
+    FuzzTelemetryRecorder,
+)
+from protostar.commands.test.fuzzing.fuzz_time_budget import (
+    FuzzTimeBudget,
+    FuzzTimeBudgetConfig,
+    FuzzTimeBudgetExhaustedException,
+    FuzzTimeReport,
+)
 from protostar.commands.test.fuzzing.hypothesis.aio import to_thread, wrap_in_sync
 from protostar.commands.test.fuzzing.hypothesis.reporter import (
     HYPOTHESIS_VERBOSITY,
@@ -45,30 +71,58 @@ from protostar.commands.test.test_environment_exceptions import (
     ReportedException,
 )
 from protostar.commands.test.testing_seed import TestingSeed
+from protostar.starknet.cairo_coverage import CairoCoverage
+from protostar.starknet.cairo_memory_usage import CairoMemoryUsage
+from protostar.starknet.cairo_profiler import Stack
+from protostar.starknet.cheatable_execute_entry_point import (
+    CheatableExecuteEntryPoint,
+)
 from protostar.starknet.cheatcode import Cheatcode
 from protostar.starknet.hint_local import HintLocal
-from protostar.utils.abi import get_function_parameters
+from protostar.utils.abi import get_abi_structs, get_function_parameters
 from protostar.utils.hook import Hook
+from protostar.utils.tracing import TraceBatch, get_trace_recorder
+
+
+COVERAGE_TARGET_LABEL = "cairo branch coverage"
+EXAMPLES_PER_TRACE_BATCH = 20
 
 
 # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
 @dataclass
 class FuzzConfig:
     max_examples: int = 100
+    workers: int = 1
+    database_path: Optional[Path] = None
+    time_budget: Optional[float] = None
+    shrink_time_limit: Optional[float] = None
+    invariant_depth: int = 20
+    invariant_fail_on_revert: bool = False
+    show_output: bool = False
 
 
 @dataclass
 class FuzzTestExecutionResult(TestExecutionResult):
     fuzz_runs_count: int
+    fuzz_time_report: Optional[FuzzTimeReport] = None
+    fuzz_telemetry: Optional[FuzzTelemetry] = None
 
 
 class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
     def __init__(
         self,
         state: TestExecutionState,
+        example_database: Optional[ExampleDatabase] = None,
     ):
         super().__init__(state)
         self.initial_state = state
+        self.example_database = (
+            example_database
+            if example_database is not None
+            else InMemoryExampleDatabase()
+        )
+        self._fuzz_dictionary: Optional[FuzzDictionary] = None
+        self._cheatcode_factory: Optional[FuzzTestCaseCheatcodeFactory] = None
 
     async def invoke(self, function_name: str) -> FuzzTestExecutionResult:
         # TODO(mkaput): Raise broken test error if arguments mismatch given() cheatcode
@@ -79,21 +133,97 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
             parameters
         ), f"{self.__class__.__name__} expects at least one function parameter."
 
-        strategy_selector = StrategySelector(parameters)
+        return await self._run_fuzzing(
+            function_name, self._build_strategy_selector(parameters)
+        )
 
-        self.set_cheatcodes(
-            FuzzTestCaseCheatcodeFactory(
-                state=self.state,
-                expect_revert_context=self._expect_revert_context,
-                finish_hook=self._finish_hook,
-                strategy_selector=strategy_selector,
+    def _build_strategy_selector(
+        self, parameters: Dict[str, CairoType]
+    ) -> StrategySelector:
+        if self._fuzz_dictionary is None:
+            # Constants of the test contract and contracts prepared during setup seed the fuzzer.
+            carried_state = self.state.starknet.cheatable_state.cheatable_carried_state
+            self._fuzz_dictionary = FuzzDictionary.from_programs(
+                contract_class.program
+                for contract_class in carried_state.contract_definitions.values()
             )
+
+        return StrategySelector(
+            parameters,
+            dictionary=self._fuzz_dictionary,
+            structs=get_abi_structs(self.state.contract.abi),
+        )
+
+    async def _run_fuzzing(
+        self, function_name: str, strategy_selector: StrategySelector
+    ) -> FuzzTestExecutionResult:
+        time_budget_config = FuzzTimeBudgetConfig(
+            time_budget=self.state.config.fuzz_time_budget,
+            shrink_time_limit=self.state.config.fuzz_shrink_time_limit,
+        )
+
+        self._cheatcode_factory = FuzzTestCaseCheatcodeFactory(
+            state=self.state,
+            expect_revert_context=self._expect_revert_context,
+            finish_hook=self._finish_hook,
+            strategy_selector=strategy_selector,
+            time_budget_config=time_budget_config,
+        )
+        self.set_cheatcodes(self._cheatcode_factory)
+
+        partitions = FuzzPartition.split(
+            budget=self.state.config.fuzz_max_examples,
+            seed=TestingSeed.current(),
+            partitions_count=self.state.config.fuzz_workers
+            if can_run_in_forked_processes()
+            else 1,
         )
 
+        coverage = CairoCoverage()
+        self.set_coverage(coverage)
+        try:
+            with self.state.output_recorder.redirect("test"):
+                if len(partitions) == 1:
+                    return await self._fuzz(
+                        function_name=function_name,
+                        strategy_selector=strategy_selector,
+                        time_budget_config=time_budget_config,
+                        coverage=coverage,
+                        partition=partitions[0],
+                    )
+
+                return await self._fuzz_in_parallel(
+                    function_name=function_name,
+                    strategy_selector=strategy_selector,
+                    time_budget_config=time_budget_config,
+                    coverage=coverage,
+                    partitions=partitions,
+                )
+        finally:
+            self.set_coverage(None)
+
+    async def _fuzz(
+        self,
+        function_name: str,
+        strategy_selector: StrategySelector,
+        time_budget_config: FuzzTimeBudgetConfig,
+        coverage: CairoCoverage,
+        partition: FuzzPartition,
+        cancellation: Optional[FuzzPartitionsCancellation] = None,
+    ) -> FuzzTestExecutionResult:
         execution_resources: List[ExecutionResourcesSummary] = []
 
-        database = InMemoryExampleDatabase()
-        runs_counter = RunsCounter(budget=self.state.config.fuzz_max_examples)
+        database = self.example_database
+        runs_counter = RunsCounter(budget=partition.budget)
+        time_budget = FuzzTimeBudget(time_budget_config)
+        telemetry = FuzzTelemetryRecorder()
+        example_batch = TraceBatch(
+            get_trace_recorder(),
+            name=f"fuzz examples (partition {partition.index})",
+            category="fuzz",
+            batch_size=EXAMPLES_PER_TRACE_BATCH,
+        )
+        loop = asyncio.get_running_loop()
 
         # NOTE: Hypothesis' ``reporter`` global is a thread local variable.
         #   Because we are running Hypothesis from separate thread, and the test itself is
@@ -113,11 +243,24 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
                             execution_resources=execution_resources,
                             runs_counter=runs_counter,
                             strategy_selector=strategy_selector,
+                            loop=loop,
+                            partition=partition,
+                            cancellation=cancellation,
+                            time_budget=time_budget,
+                            coverage=coverage,
+                            telemetry=telemetry,
+                            example_batch=example_batch,
                         )
 
                         break
-                    except StrategyLearnedException:
+                    except (StrategyLearnedException, SettingsLearnedException):
+                        telemetry.record_strategy_restart()
                         continue
+                    except (
+                        FuzzPartitionCancelledException,
+                        FuzzTimeBudgetExhaustedException,
+                    ):
+                        break
                     except InvalidArgument as ex:
                         raise CheatcodeException("given", str(ex)) from ex
                 else:
@@ -129,20 +272,177 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
                     )
 
         try:
-            with self.state.output_recorder.redirect("test"):
-                await to_thread(test_thread)
+            await to_thread(test_thread)
         except HypothesisFailureSmugglingError as escape_err:
             escape_err.error.execution_info["fuzz_runs"] = runs_counter.count
+            if time_budget.is_enabled:
+                escape_err.error.execution_info.update(
+                    time_budget.report().to_execution_info()
+                )
             escape_err.error.metadata.append(
                 FuzzInputExceptionMetadata(escape_err.inputs)
             )
+            escape_err.error.metadata.append(
+                FuzzTelemetryExceptionMetadata(telemetry.report())
+            )
             raise escape_err.error
+        finally:
+            example_batch.finish()
 
         return FuzzTestExecutionResult(
             execution_resources=ExecutionResourcesSummary.sum(execution_resources),
             fuzz_runs_count=runs_counter.count,
+            fuzz_time_report=time_budget.report() if time_budget.is_enabled else None,
+            fuzz_telemetry=telemetry.report(),
+        )
+
+    async def _fuzz_in_parallel(
+        self,
+        function_name: str,
+        strategy_selector: StrategySelector,
+        time_budget_config: FuzzTimeBudgetConfig,
+        coverage: CairoCoverage,
+        partitions: List[FuzzPartition],
+    ) -> FuzzTestExecutionResult:
+        """
+        Runs each partition in a separate forked process, starting from the current state.
+        Partitions are cancelled as soon as one of them falsifies the test.
+        """
+        cancellation = FuzzPartitionsCancellation()
+        output_recorder = self.state.output_recorder
+        outputs_recorded_before_fork = set(output_recorder.captures)
+        # Steps and memory counted by partitions are sent back and added to the test case.
+        profiler = CheatableExecuteEntryPoint.profiler
+        profiler_samples_before_fork = dict(profiler.samples) if profiler else {}
+        memory_usage = CheatableExecuteEntryPoint.memory_usage
+        memory_usage_before_fork = memory_usage.copy() if memory_usage else None
+
+        def run_partition(partition: FuzzPartition):
+            trace_recorder = get_trace_recorder()
+            if trace_recorder:
+                trace_recorder.fork_process(f"fuzz partition {partition.index}")
+            loop = asyncio.new_event_loop()
+            try:
+                outcome = loop.run_until_complete(
+                    self._fuzz(
+                        function_name=function_name,
+                        strategy_selector=strategy_selector,
+                        time_budget_config=time_budget_config,
+                        coverage=coverage,
+                        partition=partition,
+                        cancellation=cancellation,
+                    )
+                )
+            except ReportedException as ex:
+                outcome = ex
+            finally:
+                loop.close()
+                if trace_recorder:
+                    trace_recorder.flush()
+
+            partition_captures = {
+                name: value
+                for name, value in output_recorder.get_captures().items()
+                if name not in outputs_recorded_before_fork
+            }
+            partition_measurements = PartitionMeasurements(
+                profiler_samples=profiler.get_samples_since(
+                    profiler_samples_before_fork
+                )
+                if profiler
+                else {},
+                memory_usage=memory_usage.subtract(memory_usage_before_fork)
+                if memory_usage and memory_usage_before_fork
+                else None,
+            )
+            return outcome, partition_captures, partition_measurements
+
+        partitions_outcomes = await to_thread(
+            run_in_forked_processes,
+            [functools.partial(run_partition, partition) for partition in partitions],
         )
 
+        fuzz_runs_count = 0
+        execution_resources: List[ExecutionResourcesSummary] = []
+        fuzz_time_reports: List[FuzzTimeReport] = []
+        fuzz_telemetries: List[FuzzTelemetry] = []
+        failures: Dict[int, ReportedException] = {}
+        for partition, partition_outcome in zip(partitions, partitions_outcomes):
+            if isinstance(partition_outcome, BaseException):
+                raise partition_outcome
+
+            outcome, partition_captures, partition_measurements = partition_outcome
+            for name, value in partition_captures.items():
+                output_recorder.record_captured(name, value)
+            if profiler:
+                profiler.add_samples(partition_measurements.profiler_samples)
+            if memory_usage and partition_measurements.memory_usage:
+                memory_usage.add(partition_measurements.memory_usage)
+
+            if isinstance(outcome, ReportedException):
+                failures[partition.index] = outcome
+                fuzz_runs = outcome.execution_info.get("fuzz_runs", 0)
+                assert isinstance(fuzz_runs, int)
+                fuzz_runs_count += fuzz_runs
+                telemetry_metadata = outcome.get_metadata_by_type(
+                    FuzzTelemetryExceptionMetadata
+                )
+                if telemetry_metadata is not None:
+                    fuzz_telemetries.append(telemetry_metadata.telemetry)
+            else:
+                fuzz_runs_count += outcome.fuzz_runs_count
+                if outcome.execution_resources is not None:
+                    execution_resources.append(outcome.execution_resources)
+                if outcome.fuzz_time_report is not None:
+                    fuzz_time_reports.append(outcome.fuzz_time_report)
+                if outcome.fuzz_telemetry is not None:
+                    fuzz_telemetries.append(outcome.fuzz_telemetry)
+
+        fuzz_telemetry = (
+            functools.reduce(FuzzTelemetry.merge, fuzz_telemetries)
+            if fuzz_telemetries
+            else None
+        )
+
+        if failures:
+            failure = failures.get(
+                cancellation.failed_partition_index,
+                next(iter(failures.values())),
+            )
+            if "fuzz_runs" in failure.execution_info:
+                failure.execution_info["fuzz_runs"] = fuzz_runs_count
+            if fuzz_telemetry is not None:
+                failure.metadata = [
+                    metadata
+                    for metadata in failure.metadata
+                    if not isinstance(metadata, FuzzTelemetryExceptionMetadata)
+                ]
+                failure.metadata.append(FuzzTelemetryExceptionMetadata(fuzz_telemetry))
+            raise failure
+
+        return FuzzTestExecutionResult(
+            execution_resources=ExecutionResourcesSummary.sum(execution_resources),
+            fuzz_runs_count=fuzz_runs_count,
+            # Partitions run in parallel, so the slowest one reflects the time spent.
+            fuzz_time_report=max(
+                fuzz_time_reports,
+                key=lambda report: report.fuzzing_time,
+                default=None,
+            ),
+            fuzz_telemetry=fuzz_telemetry,
+        )
+
+    # pylint: disable=no-self-use
+    def _get_given_strategies(
+        self, strategy_selector: StrategySelector
+    ) -> Mapping[str, SearchStrategy[Any]]:
+        return strategy_selector.given_strategies
+
+    async def _invoke_example(
+        self, function_name: str, inputs: Dict[str, Any]
+    ) -> Optional[ExecutionResourcesSummary]:
+        return await self.invoke_test_case(function_name, **inputs)
+
     def fork_state_for_test(self):
         """
         Some parts of execution state **must** be shared between fuzz test runs,
@@ -161,44 +461,96 @@ class FuzzTestExecutionEnvironment(TestExecutionEnvironment):
         execution_resources: List[ExecutionResourcesSummary],
         runs_counter: RunsCounter,
         strategy_selector: StrategySelector,
+        loop: asyncio.AbstractEventLoop,
+        partition: FuzzPartition,
+        cancellation: Optional[FuzzPartitionsCancellation],
+        time_budget: FuzzTimeBudget,
+        coverage: CairoCoverage,
+        telemetry: FuzzTelemetryRecorder,
+        example_batch: TraceBatch,
     ):
-        @seed(TestingSeed.current())
+        phases = tuple(Phase)
+        if time_budget.config.shrink_time_limit == 0:
+            phases = tuple(phase for phase in Phase if phase is not Phase.shrink)
+
+        @seed(partition.seed)
         @settings(
             database=database,
             deadline=None,
             max_examples=runs_counter.available_runs,
+            phases=phases,
             print_blob=False,
             report_multiple_bugs=False,
             verbosity=HYPOTHESIS_VERBOSITY,
         )
-        @given(**strategy_selector.given_strategies)
+        @given(**self._get_given_strategies(strategy_selector))
         async def test(**inputs: Any):
-            self.fork_state_for_test()
-
-            run_no = next(runs_counter)
-            with self.state.output_recorder.redirect(("test", run_no)):
-                with with_reporter(protostar_reporter):
-                    try:
-                        this_run_resources = await self.invoke_test_case(
-                            function_name, **inputs
-                        )
-                        if this_run_resources is not None:
-                            execution_resources.append(this_run_resources)
-                    except HypothesisRejectException as reject_ex:
-                        raise reject_ex.unsatisfied_assumption_exc
-                    except ReportedException as reported_ex:
-                        raise HypothesisFailureSmugglingError(
-                            error=reported_ex,
-                            inputs=inputs,
-                        ) from reported_ex
-
-        test.hypothesis.inner_test = wrap_in_sync(test.hypothesis.inner_test)  # type: ignore
+            if cancellation and cancellation.is_cancelled(partition.index):
+                raise FuzzPartitionCancelledException()
+
+            if time_budget.is_generation_exhausted():
+                raise FuzzTimeBudgetExhaustedException()
+
+            if time_budget.is_shrinking_exhausted():
+                remembered_failure = time_budget.get_remembered_failure(inputs)
+                if remembered_failure is not None:
+                    raise remembered_failure
+                reject()
+
+            telemetry.record_example()
+            with example_batch.item():
+                with telemetry.measure("fork"):
+                    self.fork_state_for_test()
+                coverage.reset()
+
+                run_no = partition.run_offset + next(runs_counter)
+                # Outputs of passing examples are dropped, so they are not saved to files.
+                with self.state.output_recorder.redirect(
+                    ("test", run_no), spill=self.state.config.fuzz_show_output
+                ):
+                    with with_reporter(protostar_reporter):
+                        try:
+                            with telemetry.measure("execution"):
+                                this_run_resources = await self._invoke_example(
+                                    function_name, inputs
+                                )
+                            if this_run_resources is not None:
+                                execution_resources.append(this_run_resources)
+                            # Hypothesis favours examples reaching more branches of Cairo code
+                            # and mutates them towards unexplored ones.
+                            target(
+                                float(coverage.edges_count),
+                                label=COVERAGE_TARGET_LABEL,
+                            )
+                            if not self.state.config.fuzz_show_output:
+                                self.state.output_recorder.drop(("test", run_no))
+                        except HypothesisRejectException as reject_ex:
+                            telemetry.record_rejection()
+                            raise reject_ex.unsatisfied_assumption_exc
+                        except ReportedException as reported_ex:
+                            if cancellation:
+                                cancellation.report_failure(partition.index)
+                            failure = HypothesisFailureSmugglingError(
+                                error=reported_ex,
+                                inputs=inputs,
+                            )
+                            time_budget.remember_failure(inputs, failure)
+                            telemetry.record_failure()
+                            raise failure from reported_ex
+
+        test.hypothesis.inner_test = wrap_in_sync(test.hypothesis.inner_test, loop)  # type: ignore
 
         # NOTE: The ``test`` function does not expect any arguments at this point,
         #   because the @given decorator provides all of them behind the scenes.
         test()
 
 
+@dataclass
+class PartitionMeasurements:
+    profiler_samples: Dict[Stack, int]
+    memory_usage: Optional[CairoMemoryUsage]
+
+
 @dataclass
 class HypothesisFailureSmugglingError(Exception):
     """
@@ -225,9 +577,11 @@ class FuzzTestCaseCheatcodeFactory(TestCaseCheatcodeFactory):
         expect_revert_context: ExpectRevertContext,
         finish_hook: Hook,
         strategy_selector: StrategySelector,
+        time_budget_config: FuzzTimeBudgetConfig,
     ):
         super().__init__(state, expect_revert_context, finish_hook)
         self.strategy_selector = strategy_selector
+        self.time_budget_config = time_budget_config
 
     def build_cheatcodes(
         self,
@@ -239,6 +593,7 @@ class FuzzTestCaseCheatcodeFactory(TestCaseCheatcodeFactory):
             RejectCheatcode(syscall_dependencies),
             AssumeCheatcode(syscall_dependencies),
             GivenCheatcode(syscall_dependencies, self.strategy_selector),
+            SettingsCheatcode(syscall_dependencies, self.time_budget_config),
         ]
 
     def build_hint_locals(self) -> List[HintLocal]:
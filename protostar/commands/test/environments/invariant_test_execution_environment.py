@@ -0,0 +1,132 @@
+from dataclasses import dataclass
+from typing import Any, Dict, List, Mapping, Optional
+
+from hypothesis.strategies import (
+    SearchStrategy,
+    builds,
+    fixed_dictionaries,
+    just,
+    lists,
+    one_of,
+)
+
+from protostar.commands.test.environments.fuzz_test_execution_environment import (
+    FuzzTestExecutionEnvironment,
+    FuzzTestExecutionResult,
+)
+from protostar.commands.test.fuzzing.exceptions import FuzzingError
+from protostar.commands.test.fuzzing.strategy_selector import StrategySelector
+from protostar.commands.test.starkware.execution_resources_summary import (
+    ExecutionResourcesSummary,
+)
+from protostar.commands.test.test_environment_exceptions import (
+    StarknetRevertableException,
+)
+from protostar.utils.abi import get_function_parameters, has_function_parameters
+
+HANDLER_PREFIX = "handler_"
+
+
+@dataclass(frozen=True)
+class HandlerCall:
+    handler_name: str
+    inputs: Dict[str, Any]
+
+    def __repr__(self) -> str:
+        arguments = ", ".join(f"{k}={v!r}" for k, v in self.inputs.items())
+        return f"{self.handler_name}({arguments})"
+
+
+class InvariantTestExecutionEnvironment(FuzzTestExecutionEnvironment):
+    """
+    Runs an ``invariant_`` function as a stateful fuzz test. Each example forks the state once,
+    calls a random sequence of ``handler_`` functions of the test suite on it, and checks
+    the invariant after the setup and after every call.
+
+    The sequence is a single fuzz input, so a failing sequence is shrunk (both in length and
+    handler arguments) like any other input. Arguments of each handler are fuzzed with their own
+    strategies, which the ``given`` cheatcode called inside that handler can change.
+
+    A reverted handler call doesn't change the state, so it is skipped together with
+    the following invariant check, unless ``invariant_fail_on_revert`` is set.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._handlers: Dict[str, StrategySelector] = {}
+
+    async def invoke(self, function_name: str) -> FuzzTestExecutionResult:
+        abi = self.state.contract.abi
+        assert not has_function_parameters(
+            abi, function_name
+        ), f"{self.__class__.__name__} expects no function parameters."
+
+        self._handlers = {
+            item["name"]: self._build_strategy_selector(
+                get_function_parameters(abi, item["name"])
+            )
+            for item in abi
+            if item["type"] == "function" and item["name"].startswith(HANDLER_PREFIX)
+        }
+        if not self._handlers:
+            raise FuzzingError(
+                f"Invariant test '{function_name}' requires at least one "
+                f"'{HANDLER_PREFIX}' function in the test suite."
+            )
+
+        return await self._run_fuzzing(function_name, StrategySelector({}))
+
+    def _get_given_strategies(
+        self, strategy_selector: StrategySelector
+    ) -> Mapping[str, SearchStrategy[Any]]:
+        handler_calls = one_of(
+            *(
+                builds(
+                    HandlerCall,
+                    handler_name=just(handler_name),
+                    inputs=fixed_dictionaries(dict(selector.given_strategies)),
+                )
+                for handler_name, selector in self._handlers.items()
+            )
+        )
+        return {
+            "steps": lists(
+                handler_calls,
+                min_size=1,
+                max_size=self.state.config.invariant_depth,
+            )
+        }
+
+    async def _invoke_example(
+        self, function_name: str, inputs: Dict[str, Any]
+    ) -> Optional[ExecutionResourcesSummary]:
+        assert self._cheatcode_factory is not None
+        invariant_strategy_selector = self._cheatcode_factory.strategy_selector
+        execution_resources: List[Optional[ExecutionResourcesSummary]] = [
+            await self.invoke_test_case(function_name)
+        ]
+
+        steps: List[HandlerCall] = inputs["steps"]
+        try:
+            for step in steps:
+                # The `given` cheatcode used in a handler learns strategies of this handler.
+                self._cheatcode_factory.strategy_selector = self._handlers[
+                    step.handler_name
+                ]
+                try:
+                    execution_resources.append(
+                        await self.invoke_test_case(step.handler_name, **step.inputs)
+                    )
+                except StarknetRevertableException:
+                    if self.state.config.invariant_fail_on_revert:
+                        raise
+                    continue
+                self._cheatcode_factory.strategy_selector = invariant_strategy_selector
+                execution_resources.append(await self.invoke_test_case(function_name))
+        finally:
+            self._cheatcode_factory.strategy_selector = invariant_strategy_selector
+
+        # All calls of the example are a single observation.
+        return ExecutionResourcesSummary.sum_executions(
+            resources for resources in execution_resources if resources is not None
+        )
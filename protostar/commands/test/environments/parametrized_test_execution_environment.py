@@ -0,0 +1,35 @@
+from typing import Any, Dict
+
+from protostar.commands.test.environments.test_execution_environment import (
+    TestCaseCheatcodeFactory,
+    TestExecutionEnvironment,
+    TestExecutionResult,
+)
+from protostar.commands.test.starkware.test_execution_state import TestExecutionState
+
+
+class ParametrizedTestExecutionEnvironment(TestExecutionEnvironment):
+    """
+    Runs a parametrized test case with a single row of explicit arguments.
+    Unlike fuzz tests, rows are not generated, so Hypothesis is not involved at all.
+    """
+
+    def __init__(self, state: TestExecutionState, arguments: Dict[str, Any]):
+        super().__init__(state)
+        self.arguments = arguments
+
+    async def invoke(self, function_name: str) -> TestExecutionResult:
+        self.set_cheatcodes(
+            TestCaseCheatcodeFactory(
+                state=self.state,
+                expect_revert_context=self._expect_revert_context,
+                finish_hook=self._finish_hook,
+            )
+        )
+
+        with self.state.output_recorder.redirect("test"):
+            return TestExecutionResult(
+                execution_resources=await self.invoke_test_case(
+                    function_name, **self.arguments
+                )
+            )
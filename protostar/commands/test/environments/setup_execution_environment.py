@@ -8,6 +8,7 @@ from protostar.commands.test.cheatcodes import (
     DeployContractCheatcode,
     LoadCheatcode,
     MockCallCheatcode,
+    ParametrizeCheatcode,
     PrepareCheatcode,
     ReflectCheatcode,
     RollCheatcode,
@@ -22,6 +23,7 @@ from protostar.starknet.cheatcode import Cheatcode
 from protostar.starknet.cheatcode_factory import CheatcodeFactory
 from protostar.starknet.execution_environment import ExecutionEnvironment
 from protostar.starknet.hint_local import HintLocal
+from protostar.utils.abi import get_function_parameters
 
 
 class SetupExecutionEnvironment(ExecutionEnvironment[None]):
@@ -37,6 +39,23 @@ class SetupExecutionEnvironment(ExecutionEnvironment[None]):
             await self.perform_invoke(function_name)
 
 
+class SetupCaseExecutionEnvironment(SetupExecutionEnvironment):
+    """
+    Runs the ``setup_`` hook of a single test case, after the test suite state has been forked
+    for this test case.
+    """
+
+    def __init__(self, state: TestExecutionState, test_fn_name: str):
+        super().__init__(state)
+        self._test_fn_name = test_fn_name
+
+    async def invoke(self, function_name: str):
+        self.set_cheatcodes(SetupCaseCheatcodeFactory(self.state, self._test_fn_name))
+
+        with self.state.output_recorder.redirect("setup case"):
+            await self.perform_invoke(function_name)
+
+
 class SetupCheatcodeFactory(CheatcodeFactory):
     def __init__(self, state: TestExecutionState):
         self._state = state
@@ -75,3 +94,27 @@ class SetupCheatcodeFactory(CheatcodeFactory):
             TestContextHintLocal(self._state.context),
             CairoStructHintLocal(),
         ]
+
+
+class SetupCaseCheatcodeFactory(SetupCheatcodeFactory):
+    def __init__(self, state: TestExecutionState, test_fn_name: str):
+        super().__init__(state)
+        self._test_fn_name = test_fn_name
+
+    def build_cheatcodes(
+        self,
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+        internal_calls: List[CallInfo],
+    ) -> List[Cheatcode]:
+        return [
+            *super().build_cheatcodes(syscall_dependencies, internal_calls),
+            ParametrizeCheatcode(
+                syscall_dependencies,
+                self._state.config,
+                list(
+                    get_function_parameters(
+                        self._state.contract.abi, self._test_fn_name
+                    ).keys()
+                ),
+            ),
+        ]
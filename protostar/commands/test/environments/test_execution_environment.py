@@ -67,7 +67,8 @@ class TestExecutionEnvironment(ExecutionEnvironment[TestExecutionResult]):
                 tx_info = await self.perform_invoke(function_name, *args, **kwargs)
                 execution_resources = (
                     ExecutionResourcesSummary.from_execution_resources(
-                        tx_info.call_info.execution_resources
+                        tx_info.call_info.execution_resources,
+                        approximate=self.state.config.fast_vm,
                     )
                 )
 
@@ -0,0 +1,107 @@
+from dataclasses import dataclass
+from typing import Iterable, List, Optional, Set, Tuple
+
+from starkware.cairo.lang.compiler.encode import decode_instruction
+from starkware.cairo.lang.compiler.identifier_definition import ConstDefinition
+from starkware.cairo.lang.compiler.instruction import Instruction
+from starkware.cairo.lang.compiler.program import Program
+from starkware.crypto.signature.signature import FIELD_PRIME
+
+MAX_FUZZ_DICTIONARY_SIZE = 4096
+
+BOUNDARY_BITS = (8, 16, 32, 64, 128, 251)
+
+
+@dataclass(frozen=True)
+class FuzzDictionary:
+    """
+    Felt values worth trying as fuzz inputs: constants found in tested programs and their
+    neighbours, together with common boundaries such as ``2**128``.
+
+    Values are ordered from the smallest absolute value (treating felts above ``FIELD_PRIME // 2``
+    as negative), so that Hypothesis shrinks dictionary values towards zero.
+    """
+
+    felts: Tuple[int, ...]
+
+    @classmethod
+    def from_programs(
+        cls, programs: Iterable[Program], max_size: int = MAX_FUZZ_DICTIONARY_SIZE
+    ) -> "FuzzDictionary":
+        constants: Set[int] = set()
+        for program in programs:
+            constants |= extract_program_constants(program)
+
+        felts = {0, 1, FIELD_PRIME - 1, FIELD_PRIME // 2, FIELD_PRIME // 2 + 1}
+        for bits in BOUNDARY_BITS:
+            felts |= {2**bits - 1, 2**bits}
+
+        for constant in sorted(constants, key=_felt_magnitude):
+            if len(felts) >= max_size:
+                break
+            felts |= {
+                (constant - 1) % FIELD_PRIME,
+                constant % FIELD_PRIME,
+                (constant + 1) % FIELD_PRIME,
+            }
+
+        return cls(felts=tuple(sorted(felts, key=_felt_magnitude)[:max_size]))
+
+    def get_integers(
+        self, min_value: Optional[int], max_value: Optional[int]
+    ) -> List[int]:
+        """
+        Returns dictionary values, both as felts and as signed integers,
+        which lie between given bounds (``None`` means unbounded).
+        """
+        integers: List[int] = []
+        for felt in self.felts:
+            for value in dict.fromkeys((to_signed_integer(felt), felt)):
+                if (min_value is None or min_value <= value) and (
+                    max_value is None or value <= max_value
+                ):
+                    integers.append(value)
+        return integers
+
+
+def extract_program_constants(program: Program) -> Set[int]:
+    """
+    Collects values of ``const`` identifiers and immediate operands of instructions (e.g. literals
+    which are compared, added or assigned). Immediates of jumps and calls are skipped, because these
+    are code offsets.
+    """
+    constants = {
+        definition.value
+        for definition in program.identifiers.as_dict().values()
+        if isinstance(definition, ConstDefinition)
+    }
+
+    data = program.data
+    index = 0
+    while index < len(data):
+        imm = data[index + 1] if index + 1 < len(data) else None
+        try:
+            instruction = decode_instruction(data[index], imm)
+        except (AssertionError, KeyError):
+            # Not an instruction, e.g. data placed with the `dw` directive.
+            index += 1
+            continue
+
+        if instruction.imm is not None:
+            if (
+                instruction.pc_update is Instruction.PcUpdate.REGULAR
+                and instruction.opcode is not Instruction.Opcode.CALL
+            ):
+                constants.add(instruction.imm)
+        index += instruction.size
+
+    return constants
+
+
+def to_signed_integer(felt: int) -> int:
+    return felt if felt <= FIELD_PRIME // 2 else felt - FIELD_PRIME
+
+
+def _felt_magnitude(felt: int) -> Tuple[int, int]:
+    felt = felt % FIELD_PRIME
+    return abs(to_signed_integer(felt)), felt
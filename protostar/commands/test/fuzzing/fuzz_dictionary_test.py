@@ -0,0 +1,55 @@
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
+from starkware.crypto.signature.signature import FIELD_PRIME
+
+from protostar.commands.test.fuzzing.fuzz_dictionary import (
+    FuzzDictionary,
+    extract_program_constants,
+)
+
+PROGRAM_CODE = """
+const MAGIC = 12345
+
+func check(x):
+    assert x = 777
+    return ()
+end
+
+func main():
+    check(MAGIC)
+    return ()
+end
+"""
+
+
+def test_extract_program_constants():
+    program = compile_cairo(PROGRAM_CODE, prime=FIELD_PRIME)
+
+    constants = extract_program_constants(program)
+
+    assert 12345 in constants
+    assert 777 in constants
+
+
+def test_dictionary_contains_neighbours_and_boundaries():
+    program = compile_cairo(PROGRAM_CODE, prime=FIELD_PRIME)
+
+    dictionary = FuzzDictionary.from_programs([program])
+
+    assert {12344, 12345, 12346, 776, 777, 778} <= set(dictionary.felts)
+    assert {0, 2**128 - 1, 2**128, FIELD_PRIME - 1} <= set(dictionary.felts)
+    assert dictionary.felts[0] == 0
+
+
+def test_dictionary_size_is_limited():
+    program = compile_cairo(PROGRAM_CODE, prime=FIELD_PRIME)
+
+    dictionary = FuzzDictionary.from_programs([program], max_size=4)
+
+    assert dictionary.felts == (0, 1, FIELD_PRIME - 1, 2**8 - 1)
+
+
+def test_get_integers_includes_signed_values_within_bounds():
+    dictionary = FuzzDictionary(felts=(0, 1, FIELD_PRIME - 1, 2**128))
+
+    assert dictionary.get_integers(-10, 10) == [0, 1, -1]
+    assert dictionary.get_integers(1, None) == [1, FIELD_PRIME - 1, 2**128]
@@ -0,0 +1,166 @@
+import hashlib
+import multiprocessing
+import os
+import sys
+import traceback
+from dataclasses import dataclass
+from multiprocessing import Value
+from multiprocessing.connection import Connection, wait
+from typing import Any, Callable, Dict, List, NoReturn
+
+from protostar.commands.test.testing_seed import Seed
+
+
+@dataclass(frozen=True)
+class FuzzPartition:
+    """
+    A part of fuzz test examples budget, which is run independently of other partitions.
+    """
+
+    index: int
+    budget: int
+    seed: Seed
+    run_offset: int
+    """
+    Runs of this partition are numbered starting after this offset,
+    so that outputs of different partitions do not collide.
+    """
+
+    @classmethod
+    def split(
+        cls, budget: int, seed: Seed, partitions_count: int
+    ) -> List["FuzzPartition"]:
+        partitions_count = max(1, min(partitions_count, budget))
+        partitions: List[FuzzPartition] = []
+        run_offset = 0
+        for index in range(partitions_count):
+            partition_budget = budget // partitions_count + (
+                1 if index < budget % partitions_count else 0
+            )
+            partitions.append(
+                cls(
+                    index=index,
+                    budget=partition_budget,
+                    seed=derive_partition_seed(seed, index),
+                    run_offset=run_offset,
+                )
+            )
+            run_offset += partition_budget
+        return partitions
+
+
+def derive_partition_seed(seed: Seed, partition_index: int) -> Seed:
+    """
+    The first partition uses the testing seed as is, so running a single partition
+    is equivalent to running fuzz test without partitioning.
+    """
+    if partition_index == 0:
+        return seed
+    digest = hashlib.sha256(f"{seed}:{partition_index}".encode()).digest()
+    return int.from_bytes(digest[:4], byteorder="little", signed=False)
+
+
+class FuzzPartitionCancelledException(BaseException):
+    """
+    Raised from a fuzz test example when another partition has found a falsifying example.
+    It is a ``BaseException``, so Hypothesis does not treat it as a test failure.
+    """
+
+
+class FuzzPartitionsCancellation:
+    """
+    A flag shared between forked processes, set by the first partition which falsifies a test.
+    """
+
+    def __init__(self):
+        self._failed_partition_index = Value("i", -1)
+
+    def report_failure(self, partition_index: int):
+        with self._failed_partition_index.get_lock():
+            if self._failed_partition_index.value == -1:
+                self._failed_partition_index.value = partition_index
+
+    @property
+    def failed_partition_index(self) -> int:
+        return self._failed_partition_index.value
+
+    def is_cancelled(self, partition_index: int) -> bool:
+        return self.failed_partition_index not in (-1, partition_index)
+
+
+def can_run_in_forked_processes() -> bool:
+    """
+    Forking without exec is unsupported in multithreaded processes on macOS, where system
+    frameworks may crash or deadlock in the child, so partitions are run only on Linux.
+    """
+    return sys.platform.startswith("linux") and hasattr(os, "fork")
+
+
+def run_in_forked_processes(tasks: List[Callable[[], Any]]) -> List[Any]:
+    """
+    Runs each task in a child process forked from the current one, so that all tasks start from
+    the (copy-on-write) memory of the current process.
+
+    Returns the task results, or exceptions raised by them, in the order of tasks.
+    Results must be picklable.
+
+    Test runner workers are daemonic pool processes, which cannot start ``multiprocessing``
+    children, therefore processes are forked directly. This function must be called from a thread
+    which does not run an event loop, because forked child continues in this thread only.
+
+    Other threads of the worker must be idle while forking, because locks held by them stay
+    locked in the child. The event loop thread awaits this function, and tasks must not use
+    objects shared with other processes, e.g. ``multiprocessing.Manager`` proxies. Locks of
+    ``logging`` are reinitialized in the child by Python itself.
+    """
+    readers: Dict[Connection, int] = {}
+    pids: List[int] = []
+    # Otherwise, children inherit buffered output and write it again.
+    sys.stdout.flush()
+    sys.stderr.flush()
+    for index, task in enumerate(tasks):
+        reader, writer = multiprocessing.Pipe(duplex=False)
+        pid = os.fork()
+        if pid == 0:
+            reader.close()
+            _run_forked_task(task, writer)
+        writer.close()
+        readers[reader] = index
+        pids.append(pid)
+
+    results: List[Any] = [None] * len(tasks)
+    try:
+        while readers:
+            for reader in wait(list(readers)):
+                assert isinstance(reader, Connection)
+                index = readers.pop(reader)
+                try:
+                    results[index] = reader.recv()
+                except EOFError:
+                    results[index] = ChildProcessError(
+                        f"Forked process #{index} exited without reporting a result."
+                    )
+                reader.close()
+    finally:
+        for pid in pids:
+            os.waitpid(pid, 0)
+    return results
+
+
+def _run_forked_task(task: Callable[[], Any], writer: Connection) -> NoReturn:
+    exit_code = 0
+    try:
+        try:
+            result = task()
+        except BaseException as ex:  # pylint: disable=broad-except
+            result = ex
+
+        try:
+            writer.send(result)
+        except Exception:  # pylint: disable=broad-except
+            writer.send(ChildProcessError(traceback.format_exc()))
+    except BaseException:  # pylint: disable=broad-except
+        exit_code = 1
+    finally:
+        # Skip any cleanup inherited from the parent process, e.g. `atexit` handlers.
+        os._exit(exit_code)  # pylint: disable=protected-access
@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from protostar.commands.test.fuzzing.fuzz_partitions import (
+    FuzzPartition,
+    FuzzPartitionsCancellation,
+    can_run_in_forked_processes,
+    run_in_forked_processes,
+)
+
+
+def test_split_partitions_whole_budget():
+    partitions = FuzzPartition.split(budget=10, seed=42, partitions_count=3)
+
+    assert [p.budget for p in partitions] == [4, 3, 3]
+    assert [p.run_offset for p in partitions] == [0, 4, 7]
+    assert [p.index for p in partitions] == [0, 1, 2]
+
+
+def test_split_does_not_create_empty_partitions():
+    assert len(FuzzPartition.split(budget=2, seed=42, partitions_count=8)) == 2
+    assert len(FuzzPartition.split(budget=0, seed=42, partitions_count=8)) == 1
+
+
+def test_partition_seeds_are_deterministic_and_distinct():
+    partitions = FuzzPartition.split(budget=100, seed=42, partitions_count=4)
+
+    assert partitions[0].seed == 42
+    assert len({p.seed for p in partitions}) == 4
+    assert partitions == FuzzPartition.split(budget=100, seed=42, partitions_count=4)
+
+
+def test_cancellation_does_not_cancel_failed_partition():
+    cancellation = FuzzPartitionsCancellation()
+    assert not cancellation.is_cancelled(0)
+
+    cancellation.report_failure(1)
+    cancellation.report_failure(2)
+
+    assert cancellation.failed_partition_index == 1
+    assert cancellation.is_cancelled(0)
+    assert not cancellation.is_cancelled(1)
+
+
+@pytest.mark.skipif(
+    not can_run_in_forked_processes(), reason="Forking is not supported."
+)
+def test_run_in_forked_processes():
+    def fail():
+        raise ValueError("foo")
+
+    results = run_in_forked_processes([os.getpid, lambda: 42, fail])
+
+    assert results[0] != os.getpid()
+    assert results[1] == 42
+    assert isinstance(results[2], ValueError)
@@ -0,0 +1,170 @@
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Optional, Union
+
+from typing_extensions import Literal
+
+from protostar.commands.test.test_environment_exceptions import ExceptionMetadata
+
+FuzzTelemetryPhase = Literal["execution", "fork"]
+
+
+@dataclass(frozen=True)
+class FuzzTelemetry:
+    """
+    Describes where the time of a single fuzz test was spent.
+
+    Time spent after the first failure is reported as shrinking time only. Generation time is
+    the remaining time of fuzzing, which was not spent on executing Cairo code or forking
+    the state, and it covers Hypothesis' data generation and example database replays.
+    """
+
+    examples_count: int
+    rejected_examples_count: int
+    strategy_restarts_count: int
+    total_time: float
+    generation_time: float
+    execution_time: float
+    fork_time: float
+    shrinking_time: float
+
+    @property
+    def examples_per_second(self) -> float:
+        if self.total_time <= 0:
+            return 0.0
+        return self.examples_count / self.total_time
+
+    @property
+    def rejected_examples_ratio(self) -> float:
+        if self.examples_count == 0:
+            return 0.0
+        return self.rejected_examples_count / self.examples_count
+
+    def merge(self, other: "FuzzTelemetry") -> "FuzzTelemetry":
+        """
+        Combines telemetry of fuzz partitions run in parallel. Time of phases is summed up, while
+        the total time is the time of the slowest partition, so that examples per second reflect
+        the throughput of all partitions.
+        """
+        return FuzzTelemetry(
+            examples_count=self.examples_count + other.examples_count,
+            rejected_examples_count=self.rejected_examples_count
+            + other.rejected_examples_count,
+            strategy_restarts_count=self.strategy_restarts_count
+            + other.strategy_restarts_count,
+            total_time=max(self.total_time, other.total_time),
+            generation_time=self.generation_time + other.generation_time,
+            execution_time=self.execution_time + other.execution_time,
+            fork_time=self.fork_time + other.fork_time,
+            shrinking_time=self.shrinking_time + other.shrinking_time,
+        )
+
+    def to_execution_info(self) -> Dict[str, str]:
+        execution_info = {
+            "examples_per_s": f"{self.examples_per_second:.1f}",
+            "rejected": f"{self.rejected_examples_ratio:.1%}",
+            "generation_time": f"{self.generation_time:.2f}s",
+            "execution_time": f"{self.execution_time:.2f}s",
+            "fork_time": f"{self.fork_time:.2f}s",
+        }
+        if self.shrinking_time > 0:
+            execution_info["shrinking_time"] = f"{self.shrinking_time:.2f}s"
+        if self.strategy_restarts_count > 0:
+            execution_info["strategy_restarts"] = str(self.strategy_restarts_count)
+        return execution_info
+
+    def to_dict(self) -> Dict[str, Union[int, float]]:
+        """
+        Machine-readable representation, with times in seconds.
+        """
+        return {
+            "examples": self.examples_count,
+            "rejected_examples": self.rejected_examples_count,
+            "strategy_restarts": self.strategy_restarts_count,
+            "examples_per_second": self.examples_per_second,
+            "rejected_examples_ratio": self.rejected_examples_ratio,
+            "total_time": self.total_time,
+            "generation_time": self.generation_time,
+            "execution_time": self.execution_time,
+            "fork_time": self.fork_time,
+            "shrinking_time": self.shrinking_time,
+        }
+
+
+@dataclass(frozen=True)
+class FuzzTelemetryExceptionMetadata(ExceptionMetadata):
+    telemetry: FuzzTelemetry
+
+    @property
+    def name(self) -> str:
+        return "fuzz telemetry"
+
+    def format(self) -> str:
+        return ", ".join(
+            f"{key}={value}"
+            for key, value in self.telemetry.to_execution_info().items()
+        )
+
+
+class FuzzTelemetryRecorder:
+    """
+    Collects fuzz telemetry of a single fuzzing partition. It is shared between the thread
+    running Hypothesis and the thread running test examples, which never run simultaneously.
+    """
+
+    def __init__(self, clock: Callable[[], float] = time.perf_counter):
+        self._clock = clock
+        self._started_at = clock()
+        self._first_failure_at: Optional[float] = None
+        self._phase_times: Dict[FuzzTelemetryPhase, float] = {
+            "execution": 0.0,
+            "fork": 0.0,
+        }
+        self.examples_count = 0
+        self.rejected_examples_count = 0
+        self.strategy_restarts_count = 0
+
+    @contextmanager
+    def measure(self, phase: FuzzTelemetryPhase):
+        started_at = self._clock()
+        try:
+            yield
+        finally:
+            # Everything after the first failure is accounted as shrinking.
+            if self._first_failure_at is None:
+                self._phase_times[phase] += self._clock() - started_at
+
+    def record_example(self):
+        self.examples_count += 1
+
+    def record_rejection(self):
+        self.rejected_examples_count += 1
+
+    def record_strategy_restart(self):
+        self.strategy_restarts_count += 1
+
+    def record_failure(self):
+        if self._first_failure_at is None:
+            self._first_failure_at = self._clock()
+
+    def report(self) -> FuzzTelemetry:
+        now = self._clock()
+        total_time = now - self._started_at
+        shrinking_time = (
+            now - self._first_failure_at if self._first_failure_at is not None else 0.0
+        )
+        execution_time = self._phase_times["execution"]
+        fork_time = self._phase_times["fork"]
+        return FuzzTelemetry(
+            examples_count=self.examples_count,
+            rejected_examples_count=self.rejected_examples_count,
+            strategy_restarts_count=self.strategy_restarts_count,
+            total_time=total_time,
+            generation_time=max(
+                0.0, total_time - shrinking_time - execution_time - fork_time
+            ),
+            execution_time=execution_time,
+            fork_time=fork_time,
+            shrinking_time=shrinking_time,
+        )
@@ -0,0 +1,105 @@
+from protostar.commands.test.fuzzing.fuzz_telemetry import (
+    FuzzTelemetry,
+    FuzzTelemetryRecorder,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_recorder_splits_time_into_phases():
+    clock = FakeClock()
+    recorder = FuzzTelemetryRecorder(clock=clock)
+
+    for _ in range(4):
+        recorder.record_example()
+        clock.now += 0.5
+        with recorder.measure("fork"):
+            clock.now += 0.25
+        with recorder.measure("execution"):
+            clock.now += 1.0
+    recorder.record_rejection()
+    recorder.record_strategy_restart()
+
+    telemetry = recorder.report()
+
+    assert telemetry.examples_count == 4
+    assert telemetry.rejected_examples_count == 1
+    assert telemetry.strategy_restarts_count == 1
+    assert telemetry.total_time == 7.0
+    assert telemetry.generation_time == 2.0
+    assert telemetry.fork_time == 1.0
+    assert telemetry.execution_time == 4.0
+    assert telemetry.shrinking_time == 0.0
+    assert telemetry.rejected_examples_ratio == 0.25
+    assert telemetry.examples_per_second == 4 / 7.0
+
+
+def test_time_after_first_failure_is_shrinking_time():
+    clock = FakeClock()
+    recorder = FuzzTelemetryRecorder(clock=clock)
+
+    with recorder.measure("execution"):
+        clock.now = 1.0
+        recorder.record_failure()
+    with recorder.measure("execution"):
+        clock.now = 3.0
+    recorder.record_failure()
+    clock.now = 4.0
+
+    telemetry = recorder.report()
+
+    assert telemetry.execution_time == 0.0
+    assert telemetry.generation_time == 1.0
+    assert telemetry.shrinking_time == 3.0
+
+
+def test_merge_sums_phases_of_parallel_partitions():
+    def make_telemetry(total_time: float) -> FuzzTelemetry:
+        return FuzzTelemetry(
+            examples_count=10,
+            rejected_examples_count=1,
+            strategy_restarts_count=1,
+            total_time=total_time,
+            generation_time=1.0,
+            execution_time=total_time - 1.0,
+            fork_time=0.0,
+            shrinking_time=0.0,
+        )
+
+    telemetry = make_telemetry(2.0).merge(make_telemetry(4.0))
+
+    assert telemetry.examples_count == 20
+    assert telemetry.rejected_examples_count == 2
+    assert telemetry.strategy_restarts_count == 2
+    assert telemetry.total_time == 4.0
+    assert telemetry.generation_time == 2.0
+    assert telemetry.execution_time == 4.0
+    assert telemetry.examples_per_second == 5.0
+
+
+def test_to_execution_info():
+    telemetry = FuzzTelemetry(
+        examples_count=100,
+        rejected_examples_count=5,
+        strategy_restarts_count=0,
+        total_time=2.0,
+        generation_time=0.25,
+        execution_time=1.5,
+        fork_time=0.25,
+        shrinking_time=0.0,
+    )
+
+    assert telemetry.to_execution_info() == {
+        "examples_per_s": "50.0",
+        "rejected": "5.0%",
+        "generation_time": "0.25s",
+        "execution_time": "1.50s",
+        "fork_time": "0.25s",
+    }
+    assert telemetry.to_dict()["rejected_examples_ratio"] == 0.05
@@ -0,0 +1,109 @@
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional
+
+
+@dataclass
+class FuzzTimeBudgetConfig:
+    time_budget: Optional[float] = None
+    """
+    Seconds after which no new examples are generated, unless a failure has already been found.
+    """
+
+    shrink_time_limit: Optional[float] = None
+    """
+    Seconds, counted from the first failure, after which shrinking stops
+    and the smallest failing example found so far is reported.
+    """
+
+
+@dataclass(frozen=True)
+class FuzzTimeReport:
+    time_budget: Optional[float]
+    shrink_time_limit: Optional[float]
+    fuzzing_time: float
+    shrinking_time: Optional[float]
+
+    def to_execution_info(self) -> Dict[str, str]:
+        execution_info = {"fuzz_time": f"{self.fuzzing_time:.2f}s"}
+        if self.time_budget is not None:
+            execution_info["time_budget"] = f"{self.time_budget:.2f}s"
+        if self.shrinking_time is not None:
+            execution_info["shrink_time"] = f"{self.shrinking_time:.2f}s"
+        if self.shrink_time_limit is not None:
+            execution_info["shrink_time_limit"] = f"{self.shrink_time_limit:.2f}s"
+        return execution_info
+
+
+class FuzzTimeBudgetExhaustedException(BaseException):
+    """
+    Raised from a fuzz test example when the time budget is exhausted.
+    It is a ``BaseException``, so Hypothesis does not treat it as a test failure.
+    """
+
+
+class FuzzTimeBudget:
+    """
+    Tracks time spent on fuzzing a single test case against configured budgets.
+
+    Hypothesis does not bound shrinking time, so once the shrink time limit is exhausted,
+    the fuzzer replays failures remembered by this object and rejects all other examples.
+    This way the shrinker quickly runs out of candidates, and the final replay of the smallest
+    example still fails as expected.
+    """
+
+    def __init__(
+        self,
+        config: FuzzTimeBudgetConfig,
+        clock: Callable[[], float] = time.perf_counter,
+    ):
+        self.config = config
+        self._clock = clock
+        self._started_at = clock()
+        self._first_failure_at: Optional[float] = None
+        self._failures: Dict[str, BaseException] = {}
+
+    @property
+    def is_enabled(self) -> bool:
+        return (
+            self.config.time_budget is not None
+            or self.config.shrink_time_limit is not None
+        )
+
+    def is_generation_exhausted(self) -> bool:
+        return (
+            self.config.time_budget is not None
+            and self._first_failure_at is None
+            and self._clock() - self._started_at >= self.config.time_budget
+        )
+
+    def is_shrinking_exhausted(self) -> bool:
+        return (
+            self.config.shrink_time_limit is not None
+            and self._first_failure_at is not None
+            and self._clock() - self._first_failure_at >= self.config.shrink_time_limit
+        )
+
+    def remember_failure(self, inputs: Dict[str, Any], failure: BaseException):
+        if self._first_failure_at is None:
+            self._first_failure_at = self._clock()
+        if self.config.shrink_time_limit is not None:
+            self._failures[_inputs_key(inputs)] = failure
+
+    def get_remembered_failure(self, inputs: Dict[str, Any]) -> Optional[BaseException]:
+        return self._failures.get(_inputs_key(inputs))
+
+    def report(self) -> FuzzTimeReport:
+        now = self._clock()
+        return FuzzTimeReport(
+            time_budget=self.config.time_budget,
+            shrink_time_limit=self.config.shrink_time_limit,
+            fuzzing_time=now - self._started_at,
+            shrinking_time=now - self._first_failure_at
+            if self._first_failure_at is not None
+            else None,
+        )
+
+
+def _inputs_key(inputs: Dict[str, Any]) -> str:
+    return repr(sorted(inputs.items()))
@@ -0,0 +1,99 @@
+from typing import List
+
+from protostar.commands.test.fuzzing.fuzz_time_budget import (
+    FuzzTimeBudget,
+    FuzzTimeBudgetConfig,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_disabled_budget_is_never_exhausted():
+    clock = FakeClock()
+    time_budget = FuzzTimeBudget(FuzzTimeBudgetConfig(), clock=clock)
+
+    clock.now = 1000.0
+
+    assert not time_budget.is_enabled
+    assert not time_budget.is_generation_exhausted()
+    assert not time_budget.is_shrinking_exhausted()
+
+
+def test_generation_is_exhausted_after_time_budget():
+    clock = FakeClock()
+    time_budget = FuzzTimeBudget(FuzzTimeBudgetConfig(time_budget=5), clock=clock)
+
+    clock.now = 4.9
+    assert not time_budget.is_generation_exhausted()
+
+    clock.now = 5.0
+    assert time_budget.is_generation_exhausted()
+
+
+def test_generation_is_not_exhausted_after_failure():
+    clock = FakeClock()
+    time_budget = FuzzTimeBudget(FuzzTimeBudgetConfig(time_budget=5), clock=clock)
+
+    clock.now = 1.0
+    time_budget.remember_failure({"a": 1}, RuntimeError())
+    clock.now = 10.0
+
+    assert not time_budget.is_generation_exhausted()
+
+
+def test_shrinking_is_exhausted_after_limit_since_first_failure():
+    clock = FakeClock()
+    time_budget = FuzzTimeBudget(FuzzTimeBudgetConfig(shrink_time_limit=2), clock=clock)
+
+    clock.now = 3.0
+    assert not time_budget.is_shrinking_exhausted()
+
+    time_budget.remember_failure({"a": 1}, RuntimeError())
+    clock.now = 4.0
+    time_budget.remember_failure({"a": 0}, RuntimeError())
+    assert not time_budget.is_shrinking_exhausted()
+
+    clock.now = 5.0
+    assert time_budget.is_shrinking_exhausted()
+
+
+def test_remembered_failures_are_matched_by_inputs():
+    failures: List[BaseException] = [RuntimeError("a"), RuntimeError("b")]
+    time_budget = FuzzTimeBudget(
+        FuzzTimeBudgetConfig(shrink_time_limit=2), clock=FakeClock()
+    )
+
+    time_budget.remember_failure({"a": 1, "b": 2}, failures[0])
+    time_budget.remember_failure({"a": 0, "b": 2}, failures[1])
+
+    assert time_budget.get_remembered_failure({"b": 2, "a": 1}) is failures[0]
+    assert time_budget.get_remembered_failure({"a": 0, "b": 2}) is failures[1]
+    assert time_budget.get_remembered_failure({"a": 2, "b": 2}) is None
+
+
+def test_report():
+    clock = FakeClock()
+    time_budget = FuzzTimeBudget(
+        FuzzTimeBudgetConfig(time_budget=10, shrink_time_limit=2), clock=clock
+    )
+
+    clock.now = 3.0
+    time_budget.remember_failure({"a": 1}, RuntimeError())
+    clock.now = 4.5
+
+    report = time_budget.report()
+
+    assert report.fuzzing_time == 4.5
+    assert report.shrinking_time == 1.5
+    assert report.to_execution_info() == {
+        "fuzz_time": "4.50s",
+        "time_budget": "10.00s",
+        "shrink_time": "1.50s",
+        "shrink_time_limit": "2.00s",
+    }
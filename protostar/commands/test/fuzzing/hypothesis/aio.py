@@ -2,7 +2,7 @@ import asyncio
 import contextvars
 import functools
 import inspect
-from typing import Callable, Awaitable, Any
+from typing import Callable, Awaitable, Any, Optional
 
 
 async def to_thread(func, *args, **kwargs):
@@ -25,14 +25,18 @@ async def to_thread(func, *args, **kwargs):
     return await loop.run_in_executor(None, func_call)
 
 
-def wrap_in_sync(func: Callable[..., Awaitable[Any]]):
+def wrap_in_sync(func: Callable[..., Awaitable[Any]], loop: asyncio.AbstractEventLoop):
     """
-    Return a sync wrapper around an async function executing it in separate event loop.
+    Return a sync wrapper around an async function executing it in given event loop.
 
-    Separate event loop is used, because Hypothesis engine is running in current executor
-    and is effectively blocking it.
+    Hypothesis engine is running in a separate thread (see :func:`to_thread`), and the event loop
+    which spawned it is awaiting the result, being free to run examples submitted from that
+    thread. This avoids creating (and leaking) a new event loop for each example.
 
-    Partially borrowed from pytest-asyncio.
+    Examples raise exceptions which are not subclasses of `Exception` to control the engine,
+    e.g. when the time budget is exhausted. On Python 3.7, such an exception raised by a task
+    escapes the event loop instead of being set on the task, so it is caught in the coroutine
+    and re-raised in the calling thread.
     """
 
     @functools.wraps(func)
@@ -40,16 +44,17 @@ def wrap_in_sync(func: Callable[..., Awaitable[Any]]):
         coro = func(*args, **kwargs)
         assert inspect.isawaitable(coro)
 
-        loop = asyncio.new_event_loop()
-        task = asyncio.ensure_future(coro, loop=loop)
-        try:
-            loop.run_until_complete(task)
-        except BaseException:
-            # run_until_complete doesn't get the result from exceptions
-            # that are not subclasses of `Exception`.
-            # Consume all exceptions to prevent asyncio's warning from logging.
-            if task.done() and not task.cancelled():
-                task.exception()
-            raise
+        future = asyncio.run_coroutine_threadsafe(_capture_exception(coro), loop=loop)
+        exception = future.result()
+        if exception is not None:
+            raise exception
 
     return inner
+
+
+async def _capture_exception(coro: Awaitable[Any]) -> Optional[BaseException]:
+    try:
+        await coro
+    except BaseException as ex:  # pylint: disable=broad-except
+        return ex
+    return None
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from protostar.commands.test.fuzzing.hypothesis.aio import to_thread, wrap_in_sync
+
+
+class ExampleInterruptedException(BaseException):
+    pass
+
+
+def test_base_exceptions_of_examples_are_raised_in_calling_thread():
+    async def example():
+        raise ExampleInterruptedException()
+
+    async def run_engine():
+        loop = asyncio.get_running_loop()
+        return await to_thread(wrap_in_sync(example, loop))
+
+    loop = asyncio.new_event_loop()
+    try:
+        with pytest.raises(ExampleInterruptedException):
+            loop.run_until_complete(run_engine())
+        # The loop survives and can run further test suites.
+        assert loop.run_until_complete(asyncio.sleep(0, result=1)) == 1
+    finally:
+        loop.close()
+
+
+def test_results_of_examples_are_discarded():
+    async def example(value):
+        return value
+
+    async def run_engine():
+        loop = asyncio.get_running_loop()
+        return await to_thread(wrap_in_sync(example, loop), 42)
+
+    loop = asyncio.new_event_loop()
+    try:
+        assert loop.run_until_complete(run_engine()) is None
+    finally:
+        loop.close()
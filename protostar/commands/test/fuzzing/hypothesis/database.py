@@ -0,0 +1,32 @@
+from pathlib import Path
+from typing import Optional
+
+from hypothesis.database import (
+    DirectoryBasedExampleDatabase,
+    ExampleDatabase,
+    InMemoryExampleDatabase,
+)
+
+from protostar.commands.test.test_suite import TestCase, get_test_suite_dir_name
+
+
+def create_example_database(
+    database_path: Optional[Path], test_case: TestCase
+) -> ExampleDatabase:
+    """
+    Creates Hypothesis example database for given test case. Examples saved on disk are replayed
+    first on the next run, so regressions are found immediately without shrinking again.
+
+    Hypothesis keys examples by test function, and all fuzz test cases are run through the same
+    function, therefore each test case gets its own database directory.
+    """
+    if database_path is None:
+        return InMemoryExampleDatabase()
+
+    return DirectoryBasedExampleDatabase(
+        str(database_path / get_test_case_database_key(test_case))
+    )
+
+
+def get_test_case_database_key(test_case: TestCase) -> Path:
+    return Path(get_test_suite_dir_name(test_case.test_path)) / test_case.test_fn_name
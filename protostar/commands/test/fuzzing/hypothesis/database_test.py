@@ -0,0 +1,41 @@
+from pathlib import Path
+
+from hypothesis.database import DirectoryBasedExampleDatabase, InMemoryExampleDatabase
+
+from protostar.commands.test.fuzzing.hypothesis.database import (
+    create_example_database,
+    get_test_case_database_key,
+)
+from protostar.commands.test.test_suite import TestCase
+
+
+def test_database_key_is_unique_per_test_case():
+    keys = {
+        get_test_case_database_key(TestCase(Path("tests/test_a.cairo"), "test_x")),
+        get_test_case_database_key(TestCase(Path("tests/test_a.cairo"), "test_y")),
+        get_test_case_database_key(TestCase(Path("other/test_a.cairo"), "test_x")),
+    }
+
+    assert len(keys) == 3
+
+
+def test_database_key_is_stable():
+    test_case = TestCase(Path("tests/test_a.cairo"), "test_x")
+
+    assert get_test_case_database_key(test_case) == get_test_case_database_key(
+        test_case
+    )
+
+
+def test_in_memory_database_is_used_without_path():
+    test_case = TestCase(Path("tests/test_a.cairo"), "test_x")
+
+    assert isinstance(create_example_database(None, test_case), InMemoryExampleDatabase)
+
+
+def test_directory_database_is_used_with_path(tmp_path: Path):
+    test_case = TestCase(Path("tests/test_a.cairo"), "test_x")
+
+    assert isinstance(
+        create_example_database(tmp_path, test_case), DirectoryBasedExampleDatabase
+    )
@@ -2,12 +2,17 @@ from types import SimpleNamespace
 from typing import Any
 
 from protostar.starknet.hint_local import HintLocal
+from .arrays import ArraysStrategyDescriptor
 from .felts import FeltsStrategyDescriptor
 from .integers import IntegersStrategyDescriptor
+from .structs import StructsStrategyDescriptor
+from .uint256 import Uint256StrategyDescriptor
 
 namespace = SimpleNamespace(
+    arrays=ArraysStrategyDescriptor,
     felts=FeltsStrategyDescriptor,
     integers=IntegersStrategyDescriptor,
+    uint256=Uint256StrategyDescriptor,
 )
 
 
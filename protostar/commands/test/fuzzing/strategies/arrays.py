@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Any, List, Optional
+
+from hypothesis.strategies import SearchStrategy, lists
+from starkware.cairo.lang.compiler.ast.cairo_types import (
+    CairoType,
+    TypeFelt,
+    TypePointer,
+)
+
+from protostar.commands.test.fuzzing.exceptions import SearchStrategyBuildError
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
+from protostar.commands.test.fuzzing.strategies.felts import FeltsStrategyDescriptor
+from protostar.commands.test.fuzzing.strategy_descriptor import (
+    StrategyDescriptor,
+    build_strategy_with_dictionary,
+)
+
+
+@dataclass
+class ArraysStrategyDescriptor(StrategyDescriptor):
+    """
+    Generates lists for ``(x_len, x)`` array parameters, StarkNet passes the length implicitly.
+    If ``elements`` are not given, arrays of felts are generated.
+    """
+
+    elements: Optional[StrategyDescriptor] = None
+    # NOTE: Keeping these names matching arguments of Hypothesis' ``lists`` strategy,
+    #   so that Hypothesis' exceptions (which contain these names) make sense for our users.
+    min_size: int = 0
+    max_size: Optional[int] = None
+
+    def build_strategy(self, cairo_type: CairoType) -> SearchStrategy[List[Any]]:
+        return self._build(cairo_type, dictionary=None)
+
+    def build_dictionary_strategy(
+        self, cairo_type: CairoType, dictionary: FuzzDictionary
+    ) -> Optional[SearchStrategy[List[Any]]]:
+        return self._build(cairo_type, dictionary)
+
+    def _build(
+        self, cairo_type: CairoType, dictionary: Optional[FuzzDictionary]
+    ) -> SearchStrategy[List[Any]]:
+        if not isinstance(cairo_type, TypePointer):
+            raise SearchStrategyBuildError(
+                "Strategy 'arrays' can only be applied to array parameters."
+            )
+
+        elements = self.elements
+        if elements is None:
+            if not isinstance(cairo_type.pointee, TypeFelt):
+                raise SearchStrategyBuildError(
+                    "Strategy 'arrays' requires 'elements' strategy "
+                    "for arrays of types other than felt."
+                )
+            elements = FeltsStrategyDescriptor()
+
+        return lists(
+            build_strategy_with_dictionary(elements, cairo_type.pointee, dictionary),
+            min_size=self.min_size,
+            max_size=self.max_size,
+        )
@@ -1,10 +1,12 @@
 from dataclasses import dataclass
+from typing import Optional
 
-from hypothesis.strategies import SearchStrategy, integers
+from hypothesis.strategies import SearchStrategy, integers, sampled_from
 from starkware.cairo.lang.compiler.ast.cairo_types import CairoType, TypeFelt
 from starkware.crypto.signature.signature import FIELD_PRIME
 
 from protostar.commands.test.fuzzing.exceptions import SearchStrategyBuildError
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
 from protostar.commands.test.fuzzing.strategy_descriptor import StrategyDescriptor
 
 
@@ -30,6 +32,13 @@ class FeltsStrategyDescriptor(StrategyDescriptor):
         min_felt = -max_felt
         return integers(min_value=min_felt, max_value=max_felt).map(to_felt)
 
+    def build_dictionary_strategy(
+        self, cairo_type: CairoType, dictionary: FuzzDictionary
+    ) -> Optional[SearchStrategy[int]]:
+        if not dictionary.felts:
+            return None
+        return sampled_from(dictionary.felts)
+
 
 def to_felt(value: int) -> int:
     return value % FIELD_PRIME
@@ -1,10 +1,11 @@
 from dataclasses import dataclass
 from typing import Optional
 
-from hypothesis.strategies import SearchStrategy, integers
+from hypothesis.strategies import SearchStrategy, integers, sampled_from
 from starkware.cairo.lang.compiler.ast.cairo_types import CairoType, TypeFelt
 
 from protostar.commands.test.fuzzing.exceptions import SearchStrategyBuildError
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
 from protostar.commands.test.fuzzing.strategy_descriptor import StrategyDescriptor
 
 
@@ -22,3 +23,11 @@ class IntegersStrategyDescriptor(StrategyDescriptor):
             )
 
         return integers(min_value=self.min_value, max_value=self.max_value)
+
+    def build_dictionary_strategy(
+        self, cairo_type: CairoType, dictionary: FuzzDictionary
+    ) -> Optional[SearchStrategy[int]]:
+        values = dictionary.get_integers(self.min_value, self.max_value)
+        if not values:
+            return None
+        return sampled_from(values)
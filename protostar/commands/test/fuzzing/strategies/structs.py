@@ -0,0 +1,45 @@
+from dataclasses import dataclass
+from typing import Any, Optional, Tuple
+
+from hypothesis.strategies import SearchStrategy, tuples
+from starkware.cairo.lang.compiler.ast.cairo_types import CairoType, TypeStruct
+
+from protostar.commands.test.fuzzing.exceptions import SearchStrategyBuildError
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
+from protostar.commands.test.fuzzing.strategy_descriptor import (
+    StrategyDescriptor,
+    build_strategy_with_dictionary,
+)
+
+
+@dataclass
+class StructsStrategyDescriptor(StrategyDescriptor):
+    """
+    Generates tuples of struct member values, ordered by member offsets.
+    Descriptors of members are inferred from the struct definition found in the ABI.
+    """
+
+    members: Tuple[Tuple[CairoType, StrategyDescriptor], ...]
+
+    def build_strategy(self, cairo_type: CairoType) -> SearchStrategy[Tuple[Any, ...]]:
+        return self._build(cairo_type, dictionary=None)
+
+    def build_dictionary_strategy(
+        self, cairo_type: CairoType, dictionary: FuzzDictionary
+    ) -> Optional[SearchStrategy[Tuple[Any, ...]]]:
+        return self._build(cairo_type, dictionary)
+
+    def _build(
+        self, cairo_type: CairoType, dictionary: Optional[FuzzDictionary]
+    ) -> SearchStrategy[Tuple[Any, ...]]:
+        if not isinstance(cairo_type, TypeStruct):
+            raise SearchStrategyBuildError(
+                "Strategy 'structs' can only be applied to struct parameters."
+            )
+
+        return tuples(
+            *(
+                build_strategy_with_dictionary(descriptor, member_type, dictionary)
+                for member_type, descriptor in self.members
+            )
+        )
@@ -0,0 +1,62 @@
+from dataclasses import dataclass
+from typing import Optional, Tuple
+
+from hypothesis.strategies import SearchStrategy, integers, sampled_from
+from starkware.cairo.lang.compiler.ast.cairo_types import CairoType, TypeStruct
+
+from protostar.commands.test.fuzzing.exceptions import SearchStrategyBuildError
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
+from protostar.commands.test.fuzzing.strategy_descriptor import StrategyDescriptor
+
+UINT256_MAX = 2**256 - 1
+
+
+@dataclass
+class Uint256StrategyDescriptor(StrategyDescriptor):
+    """
+    Generates valid ``Uint256`` values, i.e. both ``low`` and ``high`` are below ``2**128``.
+    Bounds apply to the whole 256-bit number.
+    """
+
+    min_value: Optional[int] = None
+    max_value: Optional[int] = None
+
+    def build_strategy(self, cairo_type: CairoType) -> SearchStrategy[Tuple[int, int]]:
+        self._check_cairo_type(cairo_type)
+        return integers(min_value=self._min_value, max_value=self._max_value).map(
+            to_uint256
+        )
+
+    def build_dictionary_strategy(
+        self, cairo_type: CairoType, dictionary: FuzzDictionary
+    ) -> Optional[SearchStrategy[Tuple[int, int]]]:
+        self._check_cairo_type(cairo_type)
+        values = dictionary.get_integers(self._min_value, self._max_value)
+        if self._min_value <= UINT256_MAX <= self._max_value:
+            values.append(UINT256_MAX)
+        if not values:
+            return None
+        return sampled_from(values).map(to_uint256)
+
+    @property
+    def _min_value(self) -> int:
+        return 0 if self.min_value is None else self.min_value
+
+    @property
+    def _max_value(self) -> int:
+        return UINT256_MAX if self.max_value is None else self.max_value
+
+    @staticmethod
+    def _check_cairo_type(cairo_type: CairoType):
+        if not is_uint256_type(cairo_type):
+            raise SearchStrategyBuildError(
+                "Strategy 'uint256' can only be applied to Uint256 parameters."
+            )
+
+
+def is_uint256_type(cairo_type: CairoType) -> bool:
+    return isinstance(cairo_type, TypeStruct) and cairo_type.scope.path[-1] == "Uint256"
+
+
+def to_uint256(value: int) -> Tuple[int, int]:
+    return value & (2**128 - 1), value >> 128
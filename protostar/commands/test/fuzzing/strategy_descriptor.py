@@ -1,9 +1,11 @@
 from abc import ABC, abstractmethod
-from typing import Any
+from typing import Any, Optional
 
-from hypothesis.strategies import SearchStrategy
+from hypothesis.strategies import SearchStrategy, one_of
 from starkware.cairo.lang.compiler.ast.cairo_types import CairoType
 
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
+
 
 class StrategyDescriptor(ABC):
     """
@@ -13,3 +15,31 @@ class StrategyDescriptor(ABC):
     @abstractmethod
     def build_strategy(self, cairo_type: CairoType) -> SearchStrategy[Any]:
         ...
+
+    # pylint: disable=unused-argument,no-self-use
+    def build_dictionary_strategy(
+        self, cairo_type: CairoType, dictionary: FuzzDictionary
+    ) -> Optional[SearchStrategy[Any]]:
+        """
+        Builds a strategy which samples values of the dictionary accepted by this descriptor,
+        or returns ``None`` if the descriptor does not benefit from the dictionary.
+        """
+        return None
+
+
+def build_strategy_with_dictionary(
+    descriptor: StrategyDescriptor,
+    cairo_type: CairoType,
+    dictionary: Optional[FuzzDictionary],
+) -> SearchStrategy[Any]:
+    strategy = descriptor.build_strategy(cairo_type)
+    if dictionary is None:
+        return strategy
+
+    dictionary_strategy = descriptor.build_dictionary_strategy(cairo_type, dictionary)
+    if dictionary_strategy is None:
+        return strategy
+
+    # NOTE: The plain strategy goes first, because Hypothesis shrinks towards
+    #   the first alternative.
+    return one_of(strategy, dictionary_strategy)
@@ -1,29 +1,51 @@
 from contextlib import contextmanager
-from typing import Dict, Any, Generator, Mapping
+from typing import Dict, Any, Generator, Mapping, Optional
 
 from hypothesis.strategies import SearchStrategy
-from starkware.cairo.lang.compiler.ast.cairo_types import CairoType, TypeFelt
+from starkware.cairo.lang.compiler.ast.cairo_types import (
+    CairoType,
+    TypeFelt,
+    TypePointer,
+    TypeStruct,
+)
+from starkware.cairo.lang.compiler.identifier_definition import StructDefinition
 
 from protostar.commands.test.fuzzing.exceptions import (
     FuzzingError,
     SearchStrategyBuildError,
 )
-from protostar.commands.test.fuzzing.strategies import FeltsStrategyDescriptor
-from protostar.commands.test.fuzzing.strategy_descriptor import StrategyDescriptor
+from protostar.commands.test.fuzzing.fuzz_dictionary import FuzzDictionary
+from protostar.commands.test.fuzzing.strategies import (
+    ArraysStrategyDescriptor,
+    FeltsStrategyDescriptor,
+    StructsStrategyDescriptor,
+    Uint256StrategyDescriptor,
+)
+from protostar.commands.test.fuzzing.strategies.uint256 import is_uint256_type
+from protostar.commands.test.fuzzing.strategy_descriptor import (
+    StrategyDescriptor,
+    build_strategy_with_dictionary,
+)
 
 
 class StrategySelector:
-    def __init__(self, parameters: Dict[str, CairoType]):
+    def __init__(
+        self,
+        parameters: Dict[str, CairoType],
+        dictionary: Optional[FuzzDictionary] = None,
+        structs: Optional[Mapping[str, StructDefinition]] = None,
+    ):
         # NOTE: We store each parameter info property in separate dict in order to optimise
         #   ``given_strategies`` property.
         self._parameters = parameters
+        self._dictionary = dictionary
         self._descriptors: Dict[str, StrategyDescriptor] = {}
         self._strategies: Dict[str, SearchStrategy[Any]] = {}
 
         for param, cairo_type in parameters.items():
             with wrap_search_strategy_build_error(param):
-                descriptor = infer_strategy_from_cairo_type(cairo_type)
-                strategy = descriptor.build_strategy(cairo_type)
+                descriptor = infer_strategy_from_cairo_type(cairo_type, structs)
+                strategy = self._build_strategy(descriptor, cairo_type)
 
             self._descriptors[param] = descriptor
             self._strategies[param] = strategy
@@ -46,7 +68,7 @@ class StrategySelector:
 
         with wrap_search_strategy_build_error(param):
             cairo_type = self._parameters[param]
-            strategy = descriptor.build_strategy(cairo_type=cairo_type)
+            strategy = self._build_strategy(descriptor, cairo_type)
 
         self._descriptors[param] = descriptor
         self._strategies[param] = strategy
@@ -56,11 +78,53 @@ class StrategySelector:
         if param not in self._parameters:
             raise FuzzingError(f"Unknown fuzzing parameter '{param}'.")
 
-
-def infer_strategy_from_cairo_type(cairo_type: CairoType) -> StrategyDescriptor:
+    def _build_strategy(
+        self, descriptor: StrategyDescriptor, cairo_type: CairoType
+    ) -> SearchStrategy[Any]:
+        return build_strategy_with_dictionary(descriptor, cairo_type, self._dictionary)
+
+
+def infer_strategy_from_cairo_type(
+    cairo_type: CairoType,
+    structs: Optional[Mapping[str, StructDefinition]] = None,
+    is_nested: bool = False,
+) -> StrategyDescriptor:
+    """
+    :param structs: Struct definitions from the ABI of the test contract, by struct name.
+    :param is_nested: Whether the type is a member of another type. StarkNet only accepts arrays
+        as top-level parameters.
+    """
     if isinstance(cairo_type, TypeFelt):
         return FeltsStrategyDescriptor()
 
+    if isinstance(cairo_type, TypeStruct):
+        if is_uint256_type(cairo_type):
+            return Uint256StrategyDescriptor()
+
+        struct_name = cairo_type.scope.path[-1]
+        if structs is not None and struct_name in structs:
+            members = sorted(
+                structs[struct_name].members.values(), key=lambda member: member.offset
+            )
+            return StructsStrategyDescriptor(
+                members=tuple(
+                    (
+                        member.cairo_type,
+                        infer_strategy_from_cairo_type(
+                            member.cairo_type, structs, is_nested=True
+                        ),
+                    )
+                    for member in members
+                )
+            )
+
+    if isinstance(cairo_type, TypePointer) and not is_nested:
+        return ArraysStrategyDescriptor(
+            elements=infer_strategy_from_cairo_type(
+                cairo_type.pointee, structs, is_nested=True
+            )
+        )
+
     raise SearchStrategyBuildError(f"Type {cairo_type.format()} cannot be fuzzed.")
 
 
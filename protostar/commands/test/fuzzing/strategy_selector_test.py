@@ -7,14 +7,26 @@ from hypothesis.strategies import SearchStrategy, integers
 from starkware.cairo.lang.compiler.ast.cairo_types import (
     TypeFelt,
     TypePointer,
+    TypeStruct,
+    TypeTuple,
     CairoType,
 )
+from starkware.cairo.lang.compiler.identifier_definition import (
+    MemberDefinition,
+    StructDefinition,
+)
+from starkware.cairo.lang.compiler.scoped_name import ScopedName
 
 from protostar.commands.test.fuzzing.exceptions import (
     FuzzingError,
     SearchStrategyBuildError,
 )
-from protostar.commands.test.fuzzing.strategies import FeltsStrategyDescriptor
+from protostar.commands.test.fuzzing.strategies import (
+    ArraysStrategyDescriptor,
+    FeltsStrategyDescriptor,
+    StructsStrategyDescriptor,
+    Uint256StrategyDescriptor,
+)
 from protostar.commands.test.fuzzing.strategy_descriptor import StrategyDescriptor
 from protostar.commands.test.fuzzing.strategy_selector import (
     StrategySelector,
@@ -22,20 +34,24 @@ from protostar.commands.test.fuzzing.strategy_selector import (
 )
 
 
+def struct_type(name: str) -> TypeStruct:
+    return TypeStruct(scope=ScopedName.from_string(name), is_fully_resolved=True)
+
+
 @dataclass
 class StubStrategyDescriptor(StrategyDescriptor):
     def build_strategy(self, cairo_type: CairoType) -> SearchStrategy[Any]:
         return integers()
 
 
-def test_pointer_parameter():
+def test_pointer_to_pointer_parameter():
     with pytest.raises(
         FuzzingError,
         match=re.escape(
             "Parameter 'x' cannot be fuzzed: " "Type felt* cannot be fuzzed."
         ),
     ):
-        StrategySelector({"x": TypePointer(TypeFelt())})
+        StrategySelector({"x": TypePointer(TypePointer(TypeFelt()))})
 
 
 def test_learn():
@@ -63,8 +79,62 @@ def test_infer_strategy_from_cairo_type_felt():
     assert infer_strategy_from_cairo_type(TypeFelt()) == FeltsStrategyDescriptor()
 
 
-def test_infer_strategy_from_cairo_type_pointer():
+def test_infer_strategy_from_cairo_type_array():
+    assert infer_strategy_from_cairo_type(
+        TypePointer(TypeFelt())
+    ) == ArraysStrategyDescriptor(elements=FeltsStrategyDescriptor())
+
+
+def test_infer_strategy_from_cairo_type_pointer_to_pointer():
     with pytest.raises(
         SearchStrategyBuildError, match=re.escape("Type felt* cannot be fuzzed.")
     ):
-        infer_strategy_from_cairo_type(TypePointer(TypeFelt()))
+        infer_strategy_from_cairo_type(TypePointer(TypePointer(TypeFelt())))
+
+
+def test_infer_strategy_from_cairo_type_uint256():
+    assert (
+        infer_strategy_from_cairo_type(struct_type("Uint256"))
+        == Uint256StrategyDescriptor()
+    )
+
+
+def test_infer_strategy_from_cairo_type_struct():
+    point_type = struct_type("Point")
+    structs = {
+        "Point": StructDefinition(
+            full_name=ScopedName.from_string("Point"),
+            members={
+                "y": MemberDefinition(offset=1, cairo_type=TypeFelt()),
+                "x": MemberDefinition(offset=0, cairo_type=struct_type("Uint256")),
+            },
+            size=3,
+        )
+    }
+
+    assert infer_strategy_from_cairo_type(
+        TypePointer(point_type), structs
+    ) == ArraysStrategyDescriptor(
+        elements=StructsStrategyDescriptor(
+            members=(
+                (struct_type("Uint256"), Uint256StrategyDescriptor()),
+                (TypeFelt(), FeltsStrategyDescriptor()),
+            )
+        )
+    )
+
+
+def test_infer_strategy_from_cairo_type_unknown_struct():
+    with pytest.raises(
+        SearchStrategyBuildError, match=re.escape("Type Point cannot be fuzzed.")
+    ):
+        infer_strategy_from_cairo_type(struct_type("Point"))
+
+
+def test_infer_strategy_from_cairo_type_tuple():
+    with pytest.raises(SearchStrategyBuildError, match="cannot be fuzzed."):
+        infer_strategy_from_cairo_type(
+            TypeTuple.from_members(
+                [TypeTuple.Item(name=None, typ=TypeFelt())], location=None
+            )
+        )
@@ -0,0 +1,34 @@
+import json
+from pathlib import Path
+from typing import Optional
+
+from protostar.commands.test.reporters.test_result_reporter import (
+    CapturedOutputsWriter,
+    TestResultReporter,
+    serialize_test_result,
+)
+from protostar.commands.test.test_results import TestResult
+
+
+class JsonLinesReporter(TestResultReporter):
+    """
+    Writes a JSON object per test result. Each line is flushed immediately,
+    so the report can be followed with ``tail -f`` and survives an interrupted run.
+    """
+
+    def __init__(
+        self, report_path: Path, outputs_writer: Optional[CapturedOutputsWriter] = None
+    ):
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(  # pylint: disable=consider-using-with
+            report_path, mode="w", encoding="utf-8"
+        )
+        self._outputs_writer = outputs_writer
+
+    def report(self, test_result: TestResult) -> None:
+        record = serialize_test_result(test_result, self._outputs_writer)
+        self._file.write(json.dumps(record, default=str) + "\n")
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.close()
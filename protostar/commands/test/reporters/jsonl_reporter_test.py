@@ -0,0 +1,126 @@
+import json
+from pathlib import Path
+
+from protostar.commands.test.fuzzing.fuzz_telemetry import FuzzTelemetry
+from protostar.commands.test.reporters.jsonl_reporter import JsonLinesReporter
+from protostar.commands.test.reporters.test_result_reporter import (
+    CapturedOutputsWriter,
+)
+from protostar.commands.test.starkware.execution_resources_summary import (
+    CountStatistic,
+    ExecutionResourcesSummary,
+)
+from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_memory_usage import TestCaseMemoryUsage
+from protostar.commands.test.test_results import (
+    BrokenTestSuiteResult,
+    FailedParametrizedTestCaseResult,
+    PassedFuzzTestCaseResult,
+    PassedTestCaseResult,
+)
+
+
+def load_records(report_path: Path):
+    return [json.loads(line) for line in report_path.read_text().splitlines()]
+
+
+def test_reporting_results(tmp_path: Path):
+    report_path = tmp_path / "report.jsonl"
+    reporter = JsonLinesReporter(
+        report_path, CapturedOutputsWriter(tmp_path / "outputs")
+    )
+
+    reporter.report(
+        PassedFuzzTestCaseResult(
+            file_path=Path("tests/test_main.cairo"),
+            test_case_name="test_fuzz",
+            captured_stdout={("test", 0): "", "setup": "setup output"},
+            execution_time=1.5,
+            execution_resources=ExecutionResourcesSummary(n_steps=CountStatistic(10)),
+            fuzz_runs_count=2,
+            fuzz_time_report=None,
+            fuzz_telemetry=FuzzTelemetry(
+                examples_count=2,
+                rejected_examples_count=0,
+                strategy_restarts_count=0,
+                total_time=1.0,
+                generation_time=0.2,
+                execution_time=0.7,
+                fork_time=0.1,
+                shrinking_time=0.0,
+            ),
+        )
+    )
+    # Written before the reporter is closed.
+    assert len(load_records(report_path)) == 1
+
+    reporter.report(
+        FailedParametrizedTestCaseResult(
+            file_path=Path("tests/test_main.cairo"),
+            test_case_name="test_rows",
+            captured_stdout={},
+            execution_time=0.5,
+            exception=ReportedException("boom"),
+            row_index=1,
+            rows_count=3,
+        )
+    )
+    reporter.report(
+        BrokenTestSuiteResult(
+            file_path=Path("tests/test_broken.cairo"),
+            test_case_names=["test_a", "test_b"],
+            exception=ValueError("\x1b[31mbroken\x1b[39m"),
+        )
+    )
+    reporter.close()
+
+    [passed, failed, broken] = load_records(report_path)
+    assert passed["type"] == "passed"
+    assert passed["execution_time"] == 1.5
+    assert passed["execution_resources"] == {
+        "steps": 10,
+        "memory_holes": 0,
+        "builtins": {},
+    }
+    assert passed["fuzz"]["runs"] == 2
+    assert passed["fuzz"]["telemetry"]["examples"] == 2
+    assert list(passed["captured_output"]) == ["setup"]
+    assert Path(passed["captured_output"]["setup"]).read_text() == "setup output"
+
+    assert failed["type"] == "failed"
+    assert (failed["row_index"], failed["rows_count"]) == (1, 3)
+    assert failed["exception_type"] == "ReportedException"
+    assert "boom" in failed["message"]
+
+    assert broken["test_cases"] == ["test_a", "test_b"]
+    assert broken["message"] == "broken"
+
+
+def test_reporting_memory_usage(tmp_path: Path):
+    report_path = tmp_path / "report.jsonl"
+    reporter = JsonLinesReporter(report_path)
+
+    reporter.report(
+        PassedTestCaseResult(
+            file_path=Path("tests/test_main.cairo"),
+            test_case_name="test_main",
+            captured_stdout={},
+            execution_time=0.5,
+            execution_resources=ExecutionResourcesSummary(
+                n_memory_holes=CountStatistic(3)
+            ),
+            memory_usage=TestCaseMemoryUsage(
+                python_peak=2048, rss_delta=None, vm_segments=12, vm_cells=300
+            ),
+        )
+    )
+    reporter.close()
+
+    [passed] = load_records(report_path)
+    assert passed["memory"] == {
+        "python_peak": 2048,
+        "rss_delta": None,
+        "vm_segments": 12,
+        "vm_cells": 300,
+        "memory_holes": 3,
+    }
@@ -0,0 +1,117 @@
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from xml.sax.saxutils import escape, quoteattr
+
+from protostar.commands.test.reporters.test_result_reporter import (
+    CapturedOutputsWriter,
+    TestResultReporter,
+    serialize_test_result,
+)
+from protostar.commands.test.test_results import TestResult
+
+
+class JUnitXmlReporter(TestResultReporter):
+    """
+    Writes results in the JUnit XML format understood by CI servers.
+
+    Results arrive in the order of completion, not grouped by test suites, so every result
+    is written as a separate ``<testsuite>`` element named after its test suite file.
+    CI servers merge elements of the same name. Only the closing ``</testsuites>`` tag
+    is written on ``close``.
+    """
+
+    def __init__(
+        self, report_path: Path, outputs_writer: Optional[CapturedOutputsWriter] = None
+    ):
+        report_path.parent.mkdir(parents=True, exist_ok=True)
+        self._file = open(  # pylint: disable=consider-using-with
+            report_path, mode="w", encoding="utf-8"
+        )
+        self._outputs_writer = outputs_writer
+        self._file.write('<?xml version="1.0" encoding="UTF-8"?>\n<testsuites>\n')
+        self._file.flush()
+
+    def report(self, test_result: TestResult) -> None:
+        record = serialize_test_result(test_result, self._outputs_writer)
+        self._file.write(_format_test_suite(record))
+        self._file.flush()
+
+    def close(self) -> None:
+        self._file.write("</testsuites>\n")
+        self._file.close()
+
+
+def _format_test_suite(record: Dict[str, Any]) -> str:
+    result_type = record["type"]
+    test_case_names: List[str] = (
+        record["test_cases"] if result_type == "broken" else [record["test_case"]]
+    )
+    lines = [
+        f"  <testsuite name={quoteattr(record['file'])} tests=\"{len(test_case_names)}\""
+        f' failures="{int(result_type == "failed")}"'
+        f' errors="{len(test_case_names) if result_type == "broken" else 0}">'
+    ]
+    properties = _get_properties(record)
+    if properties:
+        lines.append("    <properties>")
+        lines.extend(
+            f"      <property name={quoteattr(name)} value={quoteattr(str(value))}/>"
+            for name, value in properties.items()
+        )
+        lines.append("    </properties>")
+
+    for test_case_name in test_case_names:
+        lines.append(
+            f"    <testcase name={quoteattr(test_case_name)}"
+            f" classname={quoteattr(record['file'])}"
+            f" file={quoteattr(record['file'])}"
+            f' time="{record.get("execution_time", 0.0):.3f}">'
+        )
+        if result_type == "failed":
+            lines.append(
+                f"      <failure message={quoteattr(record['exception_type'])}>"
+                f"{escape(record['message'])}</failure>"
+            )
+        elif result_type == "broken":
+            details = record.get("traceback") or record["message"]
+            lines.append(
+                f"      <error message={quoteattr(record['message'])}"
+                f" type={quoteattr(record['exception_type'])}>{escape(details)}</error>"
+            )
+        captured_output: Dict[str, str] = record.get("captured_output", {})
+        if captured_output:
+            attachments = "\n".join(
+                f"[[ATTACHMENT|{path}]]" for path in captured_output.values()
+            )
+            lines.append(f"      <system-out>{escape(attachments)}</system-out>")
+        lines.append("    </testcase>")
+
+    lines.append("  </testsuite>\n")
+    return "\n".join(lines)
+
+
+def _get_properties(record: Dict[str, Any]) -> Dict[str, Any]:
+    properties: Dict[str, Any] = {}
+    resources = dict(record.get("execution_resources") or {})
+    resources.update(resources.pop("builtins", {}))
+    for name, value in resources.items():
+        if isinstance(value, dict):
+            # Resources of fuzz tests are statistics over all examples.
+            for statistic_name, statistic_value in value.items():
+                properties[f"resources.{name}.{statistic_name}"] = statistic_value
+        else:
+            properties[f"resources.{name}"] = value
+    for name, value in (record.get("memory") or {}).items():
+        if isinstance(value, dict):
+            for statistic_name, statistic_value in value.items():
+                properties[f"memory.{name}.{statistic_name}"] = statistic_value
+        elif value is not None:
+            properties[f"memory.{name}"] = value
+    fuzz = record.get("fuzz") or {}
+    for name, value in fuzz.items():
+        if name == "telemetry":
+            for telemetry_name, telemetry_value in (value or {}).items():
+                properties[f"fuzz.{telemetry_name}"] = telemetry_value
+        elif value is not None:
+            properties[f"fuzz.{name}"] = value
+    return properties
@@ -0,0 +1,103 @@
+from pathlib import Path
+from xml.etree import ElementTree
+
+from protostar.commands.test.reporters.junit_reporter import JUnitXmlReporter
+from protostar.commands.test.reporters.test_result_reporter import (
+    CapturedOutputsWriter,
+)
+from protostar.commands.test.starkware.execution_resources_summary import (
+    CountStatistic,
+    ExecutionResourcesSummary,
+)
+from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_results import (
+    FailedTestCaseResult,
+    PassedParametrizedTestCaseResult,
+    PassedTestCaseResult,
+    UnexpectedBrokenTestSuiteResult,
+)
+
+
+def test_reporting_results(tmp_path: Path):
+    report_path = tmp_path / "report.xml"
+    reporter = JUnitXmlReporter(
+        report_path, CapturedOutputsWriter(tmp_path / "outputs")
+    )
+
+    reporter.report(
+        PassedTestCaseResult(
+            file_path=Path("tests/test_main.cairo"),
+            test_case_name="test_passed",
+            captured_stdout={"test": "<output>"},
+            execution_time=1.25,
+            execution_resources=ExecutionResourcesSummary(
+                n_steps=CountStatistic(10),
+                builtin_name_to_count_map={"range_check_builtin": CountStatistic(2)},
+            ),
+        )
+    )
+    reporter.report(
+        FailedTestCaseResult(
+            file_path=Path("tests/test_main.cairo"),
+            test_case_name="test_failed",
+            captured_stdout={},
+            execution_time=0.5,
+            exception=ReportedException("a < b"),
+        )
+    )
+    reporter.report(
+        UnexpectedBrokenTestSuiteResult(
+            file_path=Path("tests/test_broken.cairo"),
+            test_case_names=["test_a", "test_b"],
+            exception=ValueError("broken"),
+            traceback="Traceback",
+        )
+    )
+    reporter.close()
+
+    [passed, failed, broken] = ElementTree.parse(report_path).getroot()
+
+    properties = {
+        prop.get("name"): prop.get("value") for prop in passed.iter("property")
+    }
+    assert properties["resources.steps"] == "10"
+    assert properties["resources.range_check_builtin"] == "2"
+    [passed_test_case] = passed.iter("testcase")
+    assert passed_test_case.get("name") == "test_passed"
+    assert passed_test_case.get("time") == "1.250"
+    attachment = passed_test_case.findtext("system-out")
+    assert attachment.startswith("[[ATTACHMENT|")
+    assert Path(attachment[len("[[ATTACHMENT|") : -2]).read_text() == "<output>"
+
+    assert failed.get("failures") == "1"
+    assert "a < b" in failed.find("testcase/failure").text
+
+    assert broken.get("errors") == "2"
+    assert [test_case.get("name") for test_case in broken.iter("testcase")] == [
+        "test_a",
+        "test_b",
+    ]
+    assert broken.find("testcase/error").text == "Traceback"
+
+
+def test_reporting_parametrized_rows_under_row_names(tmp_path: Path):
+    report_path = tmp_path / "report.xml"
+    reporter = JUnitXmlReporter(
+        report_path, CapturedOutputsWriter(tmp_path / "outputs")
+    )
+
+    reporter.report(
+        PassedParametrizedTestCaseResult(
+            file_path=Path("tests/test_main.cairo"),
+            test_case_name="test_rows[a=1, b=2]",
+            captured_stdout={},
+            execution_time=0.1,
+            execution_resources=None,
+            row_index=0,
+            rows_count=2,
+        )
+    )
+    reporter.close()
+
+    [suite] = ElementTree.parse(report_path).getroot()
+    assert suite.find("testcase").get("name") == "test_rows[a=1, b=2]"
@@ -0,0 +1,153 @@
+import re
+from abc import ABC, abstractmethod
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from protostar.commands.test.test_output_recorder import OutputName
+from protostar.commands.test.test_results import (
+    BrokenTestSuiteResult,
+    FailedTestCaseResult,
+    FuzzResult,
+    ParametrizedRowResult,
+    PassedTestCaseResult,
+    TestCaseResult,
+    TestResult,
+    TimedTestResult,
+    UnexpectedBrokenTestSuiteResult,
+)
+from protostar.commands.test.test_suite import get_test_suite_dir_name
+
+_ANSI_ESCAPE_SEQUENCE = re.compile(r"\x1b\[[0-9;]*m")
+_UNSAFE_FILE_NAME_CHARACTERS = re.compile(r"[^\w.,=\[\]-]")
+
+
+class TestResultReporter(ABC):
+    """
+    Writes test results to a file as soon as they arrive, so that nothing is held in memory
+    until the end of the run.
+    """
+
+    @abstractmethod
+    def report(self, test_result: TestResult) -> None:
+        ...
+
+    @abstractmethod
+    def close(self) -> None:
+        ...
+
+
+class CapturedOutputsWriter:
+    """
+    Writes outputs captured by test cases to separate files, which reports refer to,
+    instead of embedding outputs in reports.
+    """
+
+    def __init__(self, outputs_dir: Path):
+        self.outputs_dir = outputs_dir
+        self._last_result: Optional[TestCaseResult] = None
+        self._last_paths: Dict[str, Path] = {}
+
+    def write(self, test_case_result: TestCaseResult) -> Dict[str, Path]:
+        """Returns paths of non-empty outputs. Outputs of each result are written only once."""
+        # Reporters handle results one by one, so remembering the last result is enough.
+        if test_case_result is self._last_result:
+            return self._last_paths
+
+        paths: Dict[str, Path] = {}
+        suite_dir = self.outputs_dir / get_test_suite_dir_name(
+            test_case_result.file_path
+        )
+        for output_name, output in test_case_result.captured_stdout.items():
+            if not output:
+                continue
+            name = _format_output_file_name(output_name)
+            path = suite_dir / _UNSAFE_FILE_NAME_CHARACTERS.sub(
+                "_", f"{test_case_result.test_case_name}.{name}.txt"
+            )
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(output, encoding="utf-8")
+            paths[name] = path
+
+        self._last_result = test_case_result
+        self._last_paths = paths
+        return paths
+
+
+def serialize_test_result(
+    test_result: TestResult, outputs_writer: Optional[CapturedOutputsWriter] = None
+) -> Dict[str, Any]:
+    """
+    Machine-readable representation of a test result, with times in seconds.
+    """
+    record: Dict[str, Any] = {
+        "type": get_test_result_type(test_result),
+        "file": str(test_result.file_path),
+    }
+
+    if isinstance(test_result, TestCaseResult):
+        record["test_case"] = test_result.test_case_name
+    if isinstance(test_result, TimedTestResult):
+        record["execution_time"] = test_result.execution_time
+    if isinstance(test_result, PassedTestCaseResult):
+        record["execution_resources"] = (
+            test_result.execution_resources.to_dict()
+            if test_result.execution_resources
+            else None
+        )
+    if (
+        isinstance(test_result, (PassedTestCaseResult, FailedTestCaseResult))
+        and test_result.memory_usage
+    ):
+        record["memory"] = test_result.memory_usage.to_dict()
+        if record.get("execution_resources"):
+            record["memory"]["memory_holes"] = record["execution_resources"][
+                "memory_holes"
+            ]
+    if isinstance(test_result, FailedTestCaseResult):
+        record["message"] = strip_ansi(str(test_result.exception))
+        record["exception_type"] = type(test_result.exception).__name__
+        record["execution_info"] = test_result.exception.execution_info
+    if isinstance(test_result, FuzzResult):
+        time_report = test_result.fuzz_time_report
+        record["fuzz"] = {
+            "runs": test_result.fuzz_runs_count,
+            "telemetry": test_result.fuzz_telemetry.to_dict()
+            if test_result.fuzz_telemetry
+            else None,
+            "fuzzing_time": time_report.fuzzing_time if time_report else None,
+            "shrinking_time": time_report.shrinking_time if time_report else None,
+        }
+    if isinstance(test_result, ParametrizedRowResult):
+        record["row_index"] = test_result.row_index
+        record["rows_count"] = test_result.rows_count
+    if isinstance(test_result, BrokenTestSuiteResult):
+        record["test_cases"] = test_result.test_case_names
+        record["message"] = strip_ansi(str(test_result.exception))
+        record["exception_type"] = type(test_result.exception).__name__
+    if isinstance(test_result, UnexpectedBrokenTestSuiteResult):
+        record["traceback"] = test_result.traceback
+    if isinstance(test_result, TestCaseResult) and outputs_writer:
+        record["captured_output"] = {
+            name: str(path) for name, path in outputs_writer.write(test_result).items()
+        }
+    return record
+
+
+def get_test_result_type(test_result: TestResult) -> str:
+    if isinstance(test_result, PassedTestCaseResult):
+        return "passed"
+    if isinstance(test_result, FailedTestCaseResult):
+        return "failed"
+    if isinstance(test_result, BrokenTestSuiteResult):
+        return "broken"
+    raise NotImplementedError("Unreachable")
+
+
+def strip_ansi(text: str) -> str:
+    return _ANSI_ESCAPE_SEQUENCE.sub("", text)
+
+
+def _format_output_file_name(output_name: OutputName) -> str:
+    if isinstance(output_name, str):
+        return output_name
+    return f"{output_name[0]}-{output_name[1]}"
@@ -0,0 +1,221 @@
+import json
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+from protostar.commands.test.reporters.test_result_reporter import TestResultReporter
+from protostar.commands.test.test_results import PassedTestCaseResult, TestResult
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.log_color_provider import (
+    LogColorProvider,
+    SupportedColorName,
+    log_color_provider,
+)
+from protostar.utils.table import format_table
+
+RESOURCES_SNAPSHOT_FILE_NAME = "resources-snapshot.json"
+RESOURCES_SNAPSHOT_SEED = 1
+"""
+Seed of fuzz tests run with ``--resources-snapshot`` or ``--check-snapshot``, so that their
+resources are computed from the same examples in every run.
+"""
+
+ResourceValue = Union[int, float]
+TestResources = Dict[str, Any]
+"""
+Resources of a single test case, e.g.
+``{"steps": 120, "memory_holes": 3, "builtins": {"range_check_builtin": 2}}``.
+Resources of fuzz tests are ``{"mean": ..., "max": ...}`` objects instead of numbers.
+"""
+
+
+@dataclass(frozen=True)
+class ResourceDiff:
+    test_id: str
+    resource: str
+    snapshot_value: ResourceValue
+    current_value: ResourceValue
+    is_regression: bool
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change, or ``None`` if the resource wasn't used before."""
+        if self.snapshot_value == 0:
+            return None
+        return (self.current_value - self.snapshot_value) / self.snapshot_value
+
+
+@dataclass(frozen=True)
+class ResourcesSnapshotComparison:
+    diffs: List[ResourceDiff]
+    new_test_ids: List[str]
+
+    @property
+    def regressions(self) -> List[ResourceDiff]:
+        return [diff for diff in self.diffs if diff.is_regression]
+
+
+class ResourcesSnapshot:
+    """
+    Execution resources of passing test cases, keyed by ``<test suite path>::<test case name>``.
+    The snapshot is meant to be committed, so the file is written with sorted keys
+    and only entries of test cases which have been run are updated.
+    """
+
+    def __init__(self, tests_resources: Optional[Dict[str, TestResources]] = None):
+        self.tests_resources: Dict[str, TestResources] = tests_resources or {}
+
+    @classmethod
+    def from_passed_test_case_results(
+        cls, results: Iterable[PassedTestCaseResult], project_root_path: Path
+    ) -> "ResourcesSnapshot":
+        tests_resources: Dict[str, TestResources] = {}
+        for result in results:
+            if result.execution_resources is None:
+                continue
+            test_id = get_test_id(
+                result.file_path, result.test_case_name, project_root_path
+            )
+            tests_resources[test_id] = result.execution_resources.to_dict()
+        return cls(tests_resources)
+
+    @classmethod
+    def load(cls, path: Path) -> "ResourcesSnapshot":
+        if not path.exists():
+            raise ProtostarException(
+                f"Resources snapshot {path} doesn't exist",
+                details="Run `protostar test --resources-snapshot` to create it.",
+            )
+        try:
+            return cls(json.loads(path.read_text(encoding="utf-8")))
+        except json.JSONDecodeError as ex:
+            raise ProtostarException(
+                f"Resources snapshot {path} is not a valid JSON file", details=str(ex)
+            ) from ex
+
+    def save(self, path: Path):
+        path.write_text(
+            json.dumps(self.tests_resources, indent=2, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+
+    def updated_with(self, other: "ResourcesSnapshot") -> "ResourcesSnapshot":
+        return ResourcesSnapshot({**self.tests_resources, **other.tests_resources})
+
+    def compare(
+        self, current: "ResourcesSnapshot", tolerance: float = 0.0
+    ) -> ResourcesSnapshotComparison:
+        """
+        Compares resources of test cases present in both snapshots. A resource regresses when
+        it grows by more than ``tolerance``, given as a fraction of the snapshot value.
+        Resources collected with and without ``--fast-vm`` are not compared.
+        """
+        diffs: List[ResourceDiff] = []
+        new_test_ids: List[str] = []
+        for test_id, current_resources in sorted(current.tests_resources.items()):
+            snapshot_resources = self.tests_resources.get(test_id)
+            if snapshot_resources is None:
+                new_test_ids.append(test_id)
+                continue
+            if snapshot_resources.get("approximate", False) != current_resources.get(
+                "approximate", False
+            ):
+                continue
+
+            snapshot_values = _flatten_resources(snapshot_resources)
+            current_values = _flatten_resources(current_resources)
+            for resource in sorted(set(snapshot_values) | set(current_values)):
+                snapshot_value = snapshot_values.get(resource, 0)
+                current_value = current_values.get(resource, 0)
+                if snapshot_value == current_value:
+                    continue
+                diffs.append(
+                    ResourceDiff(
+                        test_id=test_id,
+                        resource=resource,
+                        snapshot_value=snapshot_value,
+                        current_value=current_value,
+                        is_regression=current_value > snapshot_value * (1 + tolerance),
+                    )
+                )
+        return ResourcesSnapshotComparison(diffs=diffs, new_test_ids=new_test_ids)
+
+
+class ResourcesSnapshotRecorder(TestResultReporter):
+    """
+    Collects execution resources as results arrive, so that passing results
+    don't have to be kept until the end of the run.
+    """
+
+    def __init__(self, project_root_path: Path):
+        self._project_root_path = project_root_path
+        self.snapshot = ResourcesSnapshot()
+
+    def report(self, test_result: TestResult) -> None:
+        if isinstance(test_result, PassedTestCaseResult):
+            self.snapshot.tests_resources.update(
+                ResourcesSnapshot.from_passed_test_case_results(
+                    [test_result], self._project_root_path
+                ).tests_resources
+            )
+
+    def close(self) -> None:
+        pass
+
+
+def get_test_id(file_path: Path, test_case_name: str, project_root_path: Path) -> str:
+    try:
+        file_path = file_path.resolve().relative_to(project_root_path.resolve())
+    except ValueError:
+        pass
+    return f"{file_path.as_posix()}::{test_case_name}"
+
+
+def format_resources_diff_table(
+    diffs: List[ResourceDiff],
+    local_log_color_provider: LogColorProvider = log_color_provider,
+) -> str:
+    header = ["test case", "resource", "snapshot", "current", "change"]
+    rows = [
+        [
+            diff.test_id,
+            diff.resource,
+            _format_value(diff.snapshot_value),
+            _format_value(diff.current_value),
+            "new" if diff.change is None else f"{diff.change:+.1%}",
+        ]
+        for diff in diffs
+    ]
+    rows_colors: List[SupportedColorName] = [
+        "RED" if diff.is_regression else "GREEN" for diff in diffs
+    ]
+    return format_table(
+        header,
+        rows,
+        left_aligned_columns_count=2,
+        rows_colors=rows_colors,
+        local_log_color_provider=local_log_color_provider,
+    )
+
+
+def _flatten_resources(resources: TestResources) -> Dict[str, ResourceValue]:
+    flattened: Dict[str, ResourceValue] = {}
+    for name in ["steps", "memory_holes"]:
+        _flatten_value(flattened, name, resources.get(name, 0))
+    for builtin_name, value in resources.get("builtins", {}).items():
+        _flatten_value(flattened, builtin_name, value)
+    return flattened
+
+
+def _flatten_value(
+    flattened: Dict[str, ResourceValue], name: str, value: Union[ResourceValue, dict]
+):
+    if isinstance(value, dict):
+        for key, item in value.items():
+            flattened[f"{name} ({key})"] = item
+    else:
+        flattened[name] = value
+
+
+def _format_value(value: ResourceValue) -> str:
+    return f"{value:g}" if isinstance(value, float) else str(value)
@@ -0,0 +1,189 @@
+from pathlib import Path
+
+from protostar.commands.test.resources_snapshot import (
+    ResourcesSnapshot,
+    ResourcesSnapshotRecorder,
+    format_resources_diff_table,
+)
+from protostar.commands.test.starkware.execution_resources_summary import (
+    CountSeriesStatistic,
+    CountStatistic,
+    ExecutionResourcesSummary,
+)
+from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_results import (
+    FailedTestCaseResult,
+    PassedTestCaseResult,
+)
+from protostar.utils.log_color_provider import LogColorProvider
+
+
+def make_passed_result(
+    project_root_path: Path, test_case_name: str, resources: ExecutionResourcesSummary
+) -> PassedTestCaseResult:
+    return PassedTestCaseResult(
+        file_path=project_root_path / "tests" / "test_main.cairo",
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=0.1,
+        execution_resources=resources,
+    )
+
+
+def test_serializes_resources_of_passed_test_cases(tmp_path: Path):
+    snapshot = ResourcesSnapshot.from_passed_test_case_results(
+        [
+            make_passed_result(
+                tmp_path,
+                "test_transfer",
+                ExecutionResourcesSummary(
+                    n_steps=CountStatistic(100),
+                    n_memory_holes=CountStatistic(3),
+                    builtin_name_to_count_map={
+                        "range_check_builtin": CountStatistic(2)
+                    },
+                ),
+            ),
+            make_passed_result(
+                tmp_path,
+                "test_fuzz",
+                ExecutionResourcesSummary(
+                    n_steps=CountSeriesStatistic([10, 20, 30]),
+                    n_memory_holes=CountStatistic(0),
+                ),
+            ),
+        ],
+        project_root_path=tmp_path,
+    )
+
+    assert snapshot.tests_resources == {
+        "tests/test_main.cairo::test_transfer": {
+            "steps": 100,
+            "memory_holes": 3,
+            "builtins": {"range_check_builtin": 2},
+        },
+        "tests/test_main.cairo::test_fuzz": {
+            "steps": {"mean": 20.0, "max": 30},
+            "memory_holes": 0,
+            "builtins": {},
+        },
+    }
+
+
+def test_saving_and_loading(tmp_path: Path):
+    snapshot = ResourcesSnapshot(
+        {"a.cairo::test_a": {"steps": 1, "memory_holes": 0, "builtins": {}}}
+    )
+    snapshot.save(tmp_path / "snapshot.json")
+
+    assert (
+        ResourcesSnapshot.load(tmp_path / "snapshot.json").tests_resources
+        == snapshot.tests_resources
+    )
+
+
+def test_updating_keeps_test_cases_which_were_not_run():
+    snapshot = ResourcesSnapshot(
+        {
+            "a.cairo::test_a": {"steps": 1},
+            "a.cairo::test_b": {"steps": 2},
+        }
+    ).updated_with(ResourcesSnapshot({"a.cairo::test_b": {"steps": 3}}))
+
+    assert snapshot.tests_resources == {
+        "a.cairo::test_a": {"steps": 1},
+        "a.cairo::test_b": {"steps": 3},
+    }
+
+
+def test_comparison_respects_tolerance():
+    snapshot = ResourcesSnapshot(
+        {
+            "a.cairo::test_a": {"steps": 100, "builtins": {"pedersen_builtin": 1}},
+            "a.cairo::test_b": {"steps": {"mean": 10, "max": 20}},
+        }
+    )
+    current = ResourcesSnapshot(
+        {
+            "a.cairo::test_a": {"steps": 104, "builtins": {"pedersen_builtin": 2}},
+            "a.cairo::test_b": {"steps": {"mean": 9, "max": 20}},
+            "a.cairo::test_c": {"steps": 1},
+        }
+    )
+
+    comparison = snapshot.compare(current, tolerance=0.05)
+
+    assert [(diff.test_id, diff.resource) for diff in comparison.regressions] == [
+        ("a.cairo::test_a", "pedersen_builtin")
+    ]
+    assert [(diff.test_id, diff.resource) for diff in comparison.diffs] == [
+        ("a.cairo::test_a", "pedersen_builtin"),
+        ("a.cairo::test_a", "steps"),
+        ("a.cairo::test_b", "steps (mean)"),
+    ]
+    assert comparison.new_test_ids == ["a.cairo::test_c"]
+
+
+def test_mean_and_max_of_fuzz_tests_are_compared():
+    snapshot = ResourcesSnapshot(
+        {"a.cairo::test_fuzz": {"steps": {"mean": 10, "max": 20}}}
+    )
+    current = ResourcesSnapshot(
+        {"a.cairo::test_fuzz": {"steps": {"mean": 10, "max": 30}}}
+    )
+
+    comparison = snapshot.compare(current)
+
+    [regression] = comparison.regressions
+    assert regression.resource == "steps (max)"
+
+
+def test_approximate_resources_are_not_compared_with_exact_ones():
+    snapshot = ResourcesSnapshot({"a.cairo::test_a": {"steps": 100}})
+    current = ResourcesSnapshot(
+        {"a.cairo::test_a": {"steps": 200, "approximate": True}}
+    )
+
+    assert not snapshot.compare(current).diffs
+
+
+def test_formatting_diff_table():
+    snapshot = ResourcesSnapshot({"a.cairo::test_a": {"steps": 100, "memory_holes": 0}})
+    current = ResourcesSnapshot({"a.cairo::test_a": {"steps": 150, "memory_holes": 2}})
+    color_provider = LogColorProvider()
+    color_provider.is_ci_mode = True
+
+    table = format_resources_diff_table(
+        snapshot.compare(current).diffs, local_log_color_provider=color_provider
+    )
+
+    assert table.splitlines() == [
+        "test case        resource      snapshot  current  change",
+        "a.cairo::test_a  memory_holes         0        2     new",
+        "a.cairo::test_a  steps              100      150  +50.0%",
+    ]
+
+
+def test_recording_resources_of_passed_test_cases_as_they_arrive(tmp_path: Path):
+    recorder = ResourcesSnapshotRecorder(tmp_path)
+
+    recorder.report(
+        make_passed_result(
+            tmp_path,
+            "test_passed",
+            ExecutionResourcesSummary(n_steps=CountStatistic(10)),
+        )
+    )
+    recorder.report(
+        FailedTestCaseResult(
+            file_path=tmp_path / "tests" / "test_main.cairo",
+            test_case_name="test_failed",
+            captured_stdout={},
+            execution_time=0.1,
+            exception=ReportedException(),
+        )
+    )
+
+    assert list(recorder.snapshot.tests_resources) == [
+        "tests/test_main.cairo::test_passed"
+    ]
@@ -0,0 +1,397 @@
+import json
+import sqlite3
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Pattern, Tuple
+
+from git.exc import GitError
+from git.repo import Repo
+
+from protostar.commands.test.reporters.test_result_reporter import (
+    TestResultReporter,
+    get_test_result_type,
+)
+from protostar.commands.test.resources_snapshot import get_test_id
+from protostar.commands.test.test_results import (
+    BrokenTestSuiteResult,
+    PassedTestCaseResult,
+    TestCaseResult,
+    TestResult,
+    TimedTestResult,
+)
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.log_color_provider import (
+    LogColorProvider,
+    SupportedColorName,
+    log_color_provider,
+)
+from protostar.utils.table import format_table
+
+RUN_HISTORY_FILE_NAME = "run-history.sqlite"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started_at TEXT NOT NULL,
+    git_commit TEXT,
+    git_dirty INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS runs_git_commit ON runs (git_commit);
+CREATE TABLE IF NOT EXISTS test_results (
+    run_id INTEGER NOT NULL REFERENCES runs (id),
+    test_id TEXT NOT NULL,
+    status TEXT NOT NULL,
+    execution_time REAL,
+    steps REAL,
+    memory_holes REAL,
+    builtins TEXT,
+    PRIMARY KEY (run_id, test_id)
+);
+"""
+
+
+@dataclass(frozen=True)
+class GitRevision:
+    commit: str
+    dirty: bool
+
+
+@dataclass(frozen=True)
+class HistoryRun:
+    id: int
+    started_at: str
+    git_commit: Optional[str]
+    git_dirty: bool
+    passed_count: int
+    failed_count: int
+    broken_count: int
+    execution_time: float
+
+    @property
+    def formatted_git_commit(self) -> str:
+        if self.git_commit is None:
+            return "-"
+        return self.git_commit[:8] + ("*" if self.git_dirty else "")
+
+
+@dataclass(frozen=True)
+class HistoryTestResult:
+    test_id: str
+    status: str
+    execution_time: Optional[float] = None
+    steps: Optional[float] = None
+    """
+    The mean number of steps for fuzz tests.
+    """
+    memory_holes: Optional[float] = None
+    builtins: Optional[Dict[str, Any]] = None
+
+
+@dataclass(frozen=True)
+class HistoryDelta:
+    test_id: str
+    baseline_value: float
+    current_value: float
+
+    @property
+    def change(self) -> Optional[float]:
+        if self.baseline_value == 0:
+            return None
+        return (self.current_value - self.baseline_value) / self.baseline_value
+
+
+class RunHistory:
+    """
+    Results of test runs stored in a local SQLite database, tagged with the git commit
+    checked out during the run, so that changes of test cases can be tracked over time.
+    """
+
+    def __init__(self, database_path: Path):
+        database_path.parent.mkdir(parents=True, exist_ok=True)
+        self._connection = sqlite3.connect(str(database_path))
+        self._connection.executescript(_SCHEMA)
+
+    def close(self):
+        self._connection.close()
+
+    def add_run(self, git_revision: Optional[GitRevision]) -> int:
+        with self._connection:
+            cursor = self._connection.execute(
+                "INSERT INTO runs (started_at, git_commit, git_dirty) VALUES (?, ?, ?)",
+                (
+                    datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    git_revision.commit if git_revision else None,
+                    int(git_revision.dirty) if git_revision else 0,
+                ),
+            )
+        run_id = cursor.lastrowid
+        assert run_id is not None
+        return run_id
+
+    def add_test_result(self, run_id: int, test_result: HistoryTestResult):
+        """Committed by ``commit``, so that a run doesn't wait for a disk write per result."""
+        self._connection.execute(
+            "INSERT OR REPLACE INTO test_results "
+            "(run_id, test_id, status, execution_time, steps, memory_holes, builtins) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                run_id,
+                test_result.test_id,
+                test_result.status,
+                test_result.execution_time,
+                test_result.steps,
+                test_result.memory_holes,
+                json.dumps(test_result.builtins, sort_keys=True)
+                if test_result.builtins is not None
+                else None,
+            ),
+        )
+
+    def commit(self):
+        self._connection.commit()
+
+    def get_runs(self, limit: int) -> List[HistoryRun]:
+        """Returns the most recent runs, starting from the oldest one."""
+        rows = self._connection.execute(
+            """
+            SELECT
+                runs.id,
+                runs.started_at,
+                runs.git_commit,
+                runs.git_dirty,
+                COUNT(CASE WHEN test_results.status = 'passed' THEN 1 END),
+                COUNT(CASE WHEN test_results.status = 'failed' THEN 1 END),
+                COUNT(CASE WHEN test_results.status = 'broken' THEN 1 END),
+                COALESCE(SUM(test_results.execution_time), 0)
+            FROM runs LEFT JOIN test_results ON test_results.run_id = runs.id
+            GROUP BY runs.id
+            ORDER BY runs.id DESC
+            LIMIT ?
+            """,
+            (limit,),
+        ).fetchall()
+        return [
+            HistoryRun(
+                id=run_id,
+                started_at=started_at,
+                git_commit=git_commit,
+                git_dirty=bool(git_dirty),
+                passed_count=passed_count,
+                failed_count=failed_count,
+                broken_count=broken_count,
+                execution_time=execution_time,
+            )
+            for (
+                run_id,
+                started_at,
+                git_commit,
+                git_dirty,
+                passed_count,
+                failed_count,
+                broken_count,
+                execution_time,
+            ) in reversed(rows)
+        ]
+
+    def get_test_results(self, run_id: int) -> Dict[str, HistoryTestResult]:
+        rows = self._connection.execute(
+            "SELECT test_id, status, execution_time, steps, memory_holes, builtins "
+            "FROM test_results WHERE run_id = ?",
+            (run_id,),
+        )
+        return {row[0]: _history_test_result_from_row(row) for row in rows.fetchall()}
+
+    def iter_test_results(
+        self, runs: List[HistoryRun], test_id_filter: Optional[Pattern]
+    ) -> Iterator[Tuple[HistoryRun, HistoryTestResult]]:
+        for run in runs:
+            for test_id, test_result in sorted(self.get_test_results(run.id).items()):
+                if test_id_filter is None or test_id_filter.search(test_id):
+                    yield run, test_result
+
+    def find_run_id(
+        self, ref: str, project_root_path: Path, before_run_id: Optional[int] = None
+    ) -> int:
+        """
+        Finds a run by its ID or the latest run of a commit pointed by a git revision,
+        e.g. ``main`` or ``HEAD~3``. Pass ``before_run_id`` to skip the run in progress
+        and the runs recorded after it.
+        """
+        bound_condition, bound_parameters = (
+            (" AND id < ?", (before_run_id,)) if before_run_id is not None else ("", ())
+        )
+        if ref.isdigit():
+            row = self._connection.execute(
+                "SELECT id FROM runs WHERE id = ?" + bound_condition,
+                (int(ref), *bound_parameters),
+            ).fetchone()
+            if row is None:
+                raise ProtostarException(f"Run {ref} is not recorded in the history")
+            return row[0]
+
+        commit = resolve_git_commit(project_root_path, ref)
+        row = self._connection.execute(
+            "SELECT id FROM runs WHERE git_commit = ?"
+            + bound_condition
+            + " ORDER BY id DESC LIMIT 1",
+            (commit, *bound_parameters),
+        ).fetchone()
+        if row is None:
+            raise ProtostarException(
+                f"No run of commit {commit[:8]} ({ref}) is recorded in the history",
+                details="Check out the commit and run `protostar test` to record it.",
+            )
+        return row[0]
+
+
+class RunHistoryRecorder(TestResultReporter):
+    """Adds results to the run history as they arrive."""
+
+    def __init__(self, run_history: RunHistory, run_id: int, project_root_path: Path):
+        self.run_history = run_history
+        self.run_id = run_id
+        self._project_root_path = project_root_path
+
+    def report(self, test_result: TestResult) -> None:
+        for history_test_result in to_history_test_results(
+            test_result, self._project_root_path
+        ):
+            self.run_history.add_test_result(self.run_id, history_test_result)
+
+    def close(self) -> None:
+        self.run_history.commit()
+
+
+def to_history_test_results(
+    test_result: TestResult, project_root_path: Path
+) -> List[HistoryTestResult]:
+    status = get_test_result_type(test_result)
+    if isinstance(test_result, BrokenTestSuiteResult):
+        return [
+            HistoryTestResult(
+                test_id=get_test_id(
+                    test_result.file_path, test_case_name, project_root_path
+                ),
+                status=status,
+            )
+            for test_case_name in test_result.test_case_names
+        ]
+
+    assert isinstance(test_result, TestCaseResult)
+    resources: Dict[str, Any] = {}
+    if (
+        isinstance(test_result, PassedTestCaseResult)
+        and test_result.execution_resources
+    ):
+        resources = test_result.execution_resources.to_dict()
+    return [
+        HistoryTestResult(
+            test_id=get_test_id(
+                test_result.file_path, test_result.test_case_name, project_root_path
+            ),
+            status=status,
+            execution_time=test_result.execution_time
+            if isinstance(test_result, TimedTestResult)
+            else None,
+            steps=_get_mean(resources.get("steps")),
+            memory_holes=_get_mean(resources.get("memory_holes")),
+            builtins=resources.get("builtins"),
+        )
+    ]
+
+
+def get_git_revision(project_root_path: Path) -> Optional[GitRevision]:
+    try:
+        repo = Repo(project_root_path, search_parent_directories=True)
+        return GitRevision(commit=repo.head.commit.hexsha, dirty=repo.is_dirty())
+    except (GitError, ValueError):
+        # Not a repository, or a repository without commits.
+        return None
+
+
+def resolve_git_commit(project_root_path: Path, ref: str) -> str:
+    try:
+        repo = Repo(project_root_path, search_parent_directories=True)
+        return repo.git.rev_parse("--verify", f"{ref}^{{commit}}")
+    except GitError as ex:
+        raise ProtostarException(
+            f"{ref} is neither a run ID nor a git revision", details=str(ex)
+        ) from ex
+
+
+def compare_test_results(
+    baseline: Dict[str, HistoryTestResult],
+    current: Dict[str, HistoryTestResult],
+    metric: str,
+) -> List[HistoryDelta]:
+    """
+    Returns changes of ``"execution_time"`` or ``"steps"`` of test cases present in both runs,
+    starting from the biggest absolute change.
+    """
+    deltas: List[HistoryDelta] = []
+    for test_id, current_result in current.items():
+        baseline_result = baseline.get(test_id)
+        if baseline_result is None:
+            continue
+        baseline_value = getattr(baseline_result, metric)
+        current_value = getattr(current_result, metric)
+        if baseline_value is None or current_value is None:
+            continue
+        if baseline_value == current_value:
+            continue
+        deltas.append(HistoryDelta(test_id, baseline_value, current_value))
+    return sorted(
+        deltas,
+        key=lambda delta: (
+            -abs(delta.current_value - delta.baseline_value),
+            delta.test_id,
+        ),
+    )
+
+
+def format_history_deltas_table(
+    deltas: List[HistoryDelta],
+    value_formatter=str,
+    local_log_color_provider: LogColorProvider = log_color_provider,
+) -> str:
+    header = ["test case", "baseline", "current", "change"]
+    rows = [
+        [
+            delta.test_id,
+            value_formatter(delta.baseline_value),
+            value_formatter(delta.current_value),
+            "new" if delta.change is None else f"{delta.change:+.1%}",
+        ]
+        for delta in deltas
+    ]
+    rows_colors: List[SupportedColorName] = [
+        "RED" if delta.current_value > delta.baseline_value else "GREEN"
+        for delta in deltas
+    ]
+    return format_table(
+        header,
+        rows,
+        rows_colors=rows_colors,
+        local_log_color_provider=local_log_color_provider,
+    )
+
+
+def _get_mean(value: Any) -> Optional[float]:
+    if value is None:
+        return None
+    if isinstance(value, dict):
+        return value["mean"]
+    return value
+
+
+def _history_test_result_from_row(row: tuple) -> HistoryTestResult:
+    test_id, status, execution_time, steps, memory_holes, builtins = row
+    return HistoryTestResult(
+        test_id=test_id,
+        status=status,
+        execution_time=execution_time,
+        steps=steps,
+        memory_holes=memory_holes,
+        builtins=json.loads(builtins) if builtins is not None else None,
+    )
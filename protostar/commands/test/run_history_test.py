@@ -0,0 +1,180 @@
+from pathlib import Path
+
+import pytest
+from git.repo import Repo
+
+from protostar.commands.test.run_history import (
+    HistoryTestResult,
+    RunHistory,
+    RunHistoryRecorder,
+    compare_test_results,
+    format_history_deltas_table,
+    get_git_revision,
+)
+from protostar.commands.test.starkware.execution_resources_summary import (
+    CountSeriesStatistic,
+    CountStatistic,
+    ExecutionResourcesSummary,
+)
+from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_results import (
+    BrokenTestSuiteResult,
+    FailedTestCaseResult,
+    PassedParametrizedTestCaseResult,
+    PassedTestCaseResult,
+)
+from protostar.protostar_exception import ProtostarException
+from protostar.utils.create_and_commit_sample_file import create_and_commit_sample_file
+from protostar.utils.log_color_provider import LogColorProvider
+
+
+@pytest.fixture(name="run_history")
+def run_history_fixture(tmp_path: Path):
+    run_history = RunHistory(tmp_path / ".protostar" / "run-history.sqlite")
+    yield run_history
+    run_history.close()
+
+
+def test_recording_results(run_history: RunHistory, tmp_path: Path):
+    run_id = run_history.add_run(git_revision=None)
+    recorder = RunHistoryRecorder(run_history, run_id, project_root_path=tmp_path)
+    test_suite_path = tmp_path / "tests" / "test_main.cairo"
+
+    recorder.report(
+        PassedTestCaseResult(
+            file_path=test_suite_path,
+            test_case_name="test_passed",
+            captured_stdout={},
+            execution_time=0.5,
+            execution_resources=ExecutionResourcesSummary(
+                n_steps=CountSeriesStatistic([10, 20]),
+                builtin_name_to_count_map={"range_check_builtin": CountStatistic(2)},
+            ),
+        )
+    )
+    recorder.report(
+        PassedParametrizedTestCaseResult(
+            file_path=test_suite_path,
+            test_case_name="test_rows[a=1]",
+            captured_stdout={},
+            execution_time=0.1,
+            execution_resources=None,
+            row_index=1,
+            rows_count=2,
+        )
+    )
+    recorder.report(
+        FailedTestCaseResult(
+            file_path=test_suite_path,
+            test_case_name="test_failed",
+            captured_stdout={},
+            execution_time=0.25,
+            exception=ReportedException(),
+        )
+    )
+    recorder.report(
+        BrokenTestSuiteResult(
+            file_path=tmp_path / "tests" / "test_broken.cairo",
+            test_case_names=["test_a", "test_b"],
+            exception=ValueError(),
+        )
+    )
+    recorder.close()
+
+    [run] = run_history.get_runs(limit=10)
+    assert (run.id, run.passed_count, run.failed_count, run.broken_count) == (
+        run_id,
+        2,
+        1,
+        2,
+    )
+    assert run.execution_time == pytest.approx(0.85)
+    assert run.formatted_git_commit == "-"
+
+    results = run_history.get_test_results(run_id)
+    assert sorted(results) == [
+        "tests/test_broken.cairo::test_a",
+        "tests/test_broken.cairo::test_b",
+        "tests/test_main.cairo::test_failed",
+        "tests/test_main.cairo::test_passed",
+        "tests/test_main.cairo::test_rows[a=1]",
+    ]
+    assert results["tests/test_main.cairo::test_passed"] == HistoryTestResult(
+        test_id="tests/test_main.cairo::test_passed",
+        status="passed",
+        execution_time=0.5,
+        steps=15,
+        memory_holes=0,
+        builtins={"range_check_builtin": 2},
+    )
+
+
+def test_comparing_results():
+    baseline = {
+        "a": HistoryTestResult("a", "passed", execution_time=1.0, steps=100),
+        "b": HistoryTestResult("b", "passed", execution_time=1.0, steps=100),
+        "c": HistoryTestResult("c", "passed", execution_time=1.0, steps=100),
+    }
+    current = {
+        "a": HistoryTestResult("a", "passed", execution_time=3.0, steps=100),
+        "b": HistoryTestResult("b", "passed", execution_time=0.5, steps=90),
+        "d": HistoryTestResult("d", "passed", execution_time=9.0, steps=100),
+    }
+
+    deltas = compare_test_results(baseline, current, "execution_time")
+
+    assert [delta.test_id for delta in deltas] == ["a", "b"]
+    assert deltas[0].change == 2.0
+    assert [
+        delta.test_id for delta in compare_test_results(baseline, current, "steps")
+    ] == ["b"]
+
+    log_color_provider = LogColorProvider()
+    log_color_provider.is_ci_mode = True
+    assert format_history_deltas_table(
+        deltas, lambda value: f"{value:.2f}s", log_color_provider
+    ).split("\n") == [
+        "test case  baseline  current   change",
+        "a             1.00s    3.00s  +200.0%",
+        "b             1.00s    0.50s   -50.0%",
+    ]
+
+
+def test_finding_runs_by_id_and_git_revision(run_history: RunHistory, tmp_path: Path):
+    repo = Repo.init(tmp_path)
+    create_and_commit_sample_file(repo, tmp_path)
+    git_revision = get_git_revision(tmp_path)
+    assert git_revision is not None
+    assert git_revision.commit == repo.head.commit.hexsha
+
+    first_run_id = run_history.add_run(git_revision)
+    second_run_id = run_history.add_run(git_revision)
+
+    assert run_history.find_run_id(str(first_run_id), tmp_path) == first_run_id
+    assert run_history.find_run_id("HEAD", tmp_path) == second_run_id
+    with pytest.raises(ProtostarException):
+        run_history.find_run_id("42", tmp_path)
+    with pytest.raises(ProtostarException):
+        run_history.find_run_id("no-such-branch", tmp_path)
+
+
+def test_comparing_with_checked_out_commit_skips_run_in_progress(
+    run_history: RunHistory, tmp_path: Path
+):
+    repo = Repo.init(tmp_path)
+    create_and_commit_sample_file(repo, tmp_path)
+    git_revision = get_git_revision(tmp_path)
+
+    previous_run_id = run_history.add_run(git_revision)
+    current_run_id = run_history.add_run(git_revision)
+
+    assert (
+        run_history.find_run_id("HEAD", tmp_path, before_run_id=current_run_id)
+        == previous_run_id
+    )
+    with pytest.raises(ProtostarException):
+        run_history.find_run_id(
+            str(current_run_id), tmp_path, before_run_id=current_run_id
+        )
+    with pytest.raises(ProtostarException):
+        run_history.find_run_id("HEAD", tmp_path, before_run_id=previous_run_id)
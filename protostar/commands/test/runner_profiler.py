@@ -0,0 +1,170 @@
+import cProfile
+import io
+import pstats
+import shutil
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from uuid import uuid4
+
+from typing_extensions import Literal
+
+RunnerPhase = Literal["compile", "setup", "execution", "ipc"]
+RUNNER_PHASES: List[RunnerPhase] = ["compile", "setup", "execution", "ipc"]
+
+WORKERS_PROFILES_DIR_NAME = "workers"
+THREAD_PROFILE_SUFFIX = "-thread-"
+
+
+class RunnerProfiler:
+    """
+    Profiles the test runner of a single worker with ``cProfile``, separately for each phase:
+    - ``compile`` — compiling the test suite,
+    - ``setup`` — deploying the test contract and running ``__setup__``,
+    - ``execution`` — running test cases, including their ``setup_`` hooks,
+    - ``ipc`` — sending test results to the main process.
+
+    Phases can be nested, e.g. sending a result happens while test cases are run.
+    Time of a nested phase is excluded from the outer one.
+
+    ``cProfile`` profiles only the current thread. Contract calls run the Cairo VM, hints and
+    cheatcodes in executor threads, which are profiled with ``profile_thread``. Generating
+    fuzz examples in the Hypothesis thread is not included.
+    """
+
+    def __init__(self):
+        self._profiles: Dict[RunnerPhase, cProfile.Profile] = {}
+        self._threads_profiles: Dict[Tuple[RunnerPhase, int], cProfile.Profile] = {}
+        self._active_phases: List[RunnerPhase] = []
+        self._phases_thread_id: Optional[int] = None
+        self._thread_local = threading.local()
+
+    @contextmanager
+    def phase(self, phase: RunnerPhase):
+        if self._active_phases:
+            self._profiles[self._active_phases[-1]].disable()
+
+        profile = self._profiles.get(phase)
+        if profile is None:
+            profile = cProfile.Profile()
+            self._profiles[phase] = profile
+
+        self._active_phases.append(phase)
+        self._phases_thread_id = threading.get_ident()
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._active_phases.pop()
+            if self._active_phases:
+                self._profiles[self._active_phases[-1]].enable()
+
+    @contextmanager
+    def profile_thread(self):
+        """
+        Profiles code run in the current thread as a part of the active phase.
+        The thread which entered the phase is already profiled, and nested uses are no-ops.
+        """
+        if (
+            not self._active_phases
+            or threading.get_ident() == self._phases_thread_id
+            or getattr(self._thread_local, "is_profiling", False)
+        ):
+            yield
+            return
+
+        key = (self._active_phases[-1], threading.get_ident())
+        profile = self._threads_profiles.get(key)
+        if profile is None:
+            profile = cProfile.Profile()
+            self._threads_profiles[key] = profile
+
+        self._thread_local.is_profiling = True
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            self._thread_local.is_profiling = False
+
+    def dump(self, profile_dir: Path):
+        workers_dir = profile_dir / WORKERS_PROFILES_DIR_NAME
+        workers_dir.mkdir(parents=True, exist_ok=True)
+        dump_id = uuid4().hex
+        for phase, profile in self._profiles.items():
+            profile.dump_stats(str(workers_dir / f"{phase}-{dump_id}.pstats"))
+        for index, ((phase, _), profile) in enumerate(self._threads_profiles.items()):
+            file_name = f"{phase}-{dump_id}{THREAD_PROFILE_SUFFIX}{index}.pstats"
+            profile.dump_stats(str(workers_dir / file_name))
+
+
+def clear_runner_profiles(profile_dir: Path):
+    shutil.rmtree(profile_dir / WORKERS_PROFILES_DIR_NAME, ignore_errors=True)
+
+
+def merge_runner_profiles(profile_dir: Path, top_functions_count: int = 30) -> Path:
+    """
+    Merges stats dumped by all workers into:
+    - ``runner.pstats`` — all phases,
+    - ``runner-<phase>.pstats`` — a single phase,
+    - ``runner.txt`` — time spent in each phase and functions with the highest cumulative time.
+
+    Returns the path of the text summary.
+    """
+    profile_dir.mkdir(parents=True, exist_ok=True)
+    workers_dir = profile_dir / WORKERS_PROFILES_DIR_NAME
+    phases_stats: Dict[RunnerPhase, pstats.Stats] = {}
+    phases_times: Dict[RunnerPhase, float] = {}
+    for phase in RUNNER_PHASES:
+        paths = sorted(workers_dir.glob(f"{phase}-*.pstats"))
+        phase_stats = _load_stats(paths)
+        if phase_stats is not None:
+            phase_stats.dump_stats(str(profile_dir / f"runner-{phase}.pstats"))
+            phases_stats[phase] = phase_stats
+            # Threads run while the worker waits for them, so only workers' own time counts.
+            workers_stats = _load_stats(
+                [path for path in paths if THREAD_PROFILE_SUFFIX not in path.name]
+            )
+            phases_times[phase] = (
+                _get_total_time(workers_stats) if workers_stats is not None else 0.0
+            )
+
+    summary_path = profile_dir / "runner.txt"
+    total_stats = _load_stats(
+        [profile_dir / f"runner-{phase}.pstats" for phase in phases_stats]
+    )
+    if total_stats is None:
+        summary_path.write_text("No test suites were profiled.\n", encoding="utf-8")
+        return summary_path
+    total_stats.dump_stats(str(profile_dir / "runner.pstats"))
+
+    summary = io.StringIO()
+    summary.write("Time spent in phases, summed across workers:\n")
+    for phase, phase_time in phases_times.items():
+        summary.write(f"  {phase:<10} {phase_time:10.3f}s\n")
+    summary.write(f"  {'total':<10} {sum(phases_times.values()):10.3f}s\n")
+
+    for phase, phase_stats in phases_stats.items():
+        summary.write(f"\n=== {phase} ===\n")
+        phase_stats.stream = summary  # type: ignore
+        phase_stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(
+            top_functions_count
+        )
+
+    summary_path.write_text(summary.getvalue(), encoding="utf-8")
+    return summary_path
+
+
+def _load_stats(paths: List[Path]) -> Optional[pstats.Stats]:
+    if not paths:
+        return None
+    stats = pstats.Stats(str(paths[0]))
+    for path in paths[1:]:
+        stats.add(str(path))
+    return stats
+
+
+def _get_total_time(stats: pstats.Stats) -> float:
+    return stats.total_tt  # type: ignore
@@ -0,0 +1,113 @@
+import pstats
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+from protostar.commands.test.runner_profiler import (
+    RunnerProfiler,
+    clear_runner_profiles,
+    merge_runner_profiles,
+)
+
+
+def compile_suite():
+    return sum(range(100))
+
+
+def send_result():
+    return sum(range(10))
+
+
+def execute_test_case():
+    send_result()
+
+
+def get_profiled_function_names(path: Path):
+    stats = pstats.Stats(str(path))
+    return {function_name for _, _, function_name in stats.stats}  # type: ignore
+
+
+def test_profiles_phases_separately(tmp_path: Path):
+    profiler = RunnerProfiler()
+
+    with profiler.phase("compile"):
+        compile_suite()
+    with profiler.phase("execution"):
+        with profiler.phase("ipc"):
+            send_result()
+        execute_test_case()
+    profiler.dump(tmp_path)
+    merge_runner_profiles(tmp_path)
+
+    assert "compile_suite" in get_profiled_function_names(
+        tmp_path / "runner-compile.pstats"
+    )
+    assert "compile_suite" not in get_profiled_function_names(
+        tmp_path / "runner-execution.pstats"
+    )
+    assert "execute_test_case" in get_profiled_function_names(
+        tmp_path / "runner-execution.pstats"
+    )
+    assert "send_result" in get_profiled_function_names(tmp_path / "runner-ipc.pstats")
+    assert not (tmp_path / "runner-setup.pstats").exists()
+
+
+def run_vm():
+    return sum(range(100))
+
+
+def test_profiles_threads_in_active_phase(tmp_path: Path):
+    profiler = RunnerProfiler()
+
+    def run_in_thread():
+        with profiler.profile_thread():
+            run_vm()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        executor.submit(run_in_thread).result()
+        with profiler.phase("execution"):
+            executor.submit(run_in_thread).result()
+    profiler.dump(tmp_path)
+    summary_path = merge_runner_profiles(tmp_path)
+
+    stats = pstats.Stats(str(tmp_path / "runner-execution.pstats"))
+    run_vm_calls = [
+        function_stats[1]
+        for (_, _, function_name), function_stats in stats.stats.items()  # type: ignore
+        if function_name == "run_vm"
+    ]
+    assert run_vm_calls == [1]
+    assert "run_vm" in summary_path.read_text(encoding="utf-8")
+
+
+def test_merges_stats_of_all_workers(tmp_path: Path):
+    for _ in range(2):
+        profiler = RunnerProfiler()
+        with profiler.phase("compile"):
+            compile_suite()
+        profiler.dump(tmp_path)
+
+    summary_path = merge_runner_profiles(tmp_path)
+
+    stats = pstats.Stats(str(tmp_path / "runner.pstats"))
+    compile_suite_stats = [
+        function_stats
+        for (_, _, function_name), function_stats in stats.stats.items()  # type: ignore
+        if function_name == "compile_suite"
+    ]
+    assert compile_suite_stats[0][1] == 2
+    summary = summary_path.read_text(encoding="utf-8")
+    assert "compile" in summary
+    assert "compile_suite" in summary
+
+
+def test_clearing_profiles_removes_stats_of_previous_runs(tmp_path: Path):
+    profiler = RunnerProfiler()
+    with profiler.phase("setup"):
+        compile_suite()
+    profiler.dump(tmp_path)
+
+    clear_runner_profiles(tmp_path)
+    summary_path = merge_runner_profiles(tmp_path)
+
+    assert not (tmp_path / "runner.pstats").exists()
+    assert "No test suites were profiled" in summary_path.read_text(encoding="utf-8")
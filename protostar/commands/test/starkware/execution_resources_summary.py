@@ -1,9 +1,9 @@
 import dataclasses
-import statistics
+import math
 from abc import ABC, abstractmethod
 from collections import defaultdict
 from dataclasses import dataclass, field
-from typing import Dict, List, Iterable, Optional
+from typing import Any, Dict, Iterable, Optional
 from typing_extensions import Self
 
 from starkware.cairo.lang.vm.cairo_pie import ExecutionResources
@@ -21,7 +21,7 @@ class Statistic(ABC):
     def add_observation(self, other: "Statistic") -> "CountSeriesStatistic":
         self_series = CountSeriesStatistic.from_statistic(self)
         other_series = CountSeriesStatistic.from_statistic(other)
-        return CountSeriesStatistic(self_series.series + other_series.series)
+        return self_series.merge(other_series)
 
 
 @dataclass
@@ -35,25 +35,107 @@ class CountStatistic(Statistic):
         return bool(self.value)
 
 
-@dataclass
 class CountSeriesStatistic(Statistic):
-    series: List[int] = field(default_factory=list)
+    """
+    Streaming summary of a series of non-negative counts, which uses bounded memory regardless of
+    the number of observations, and merges with other summaries without replaying them.
+
+    Count, mean, variance, min and max are exact. The median is exact as long as the series has
+    at most ``MAX_EXACT_VALUES`` distinct values; above that, values are grouped into logarithmic
+    bins, and the median is accurate within ``RELATIVE_ACCURACY``.
+    """
+
+    MAX_EXACT_VALUES = 128
+    RELATIVE_ACCURACY = 0.01
+    _GAMMA = (1 + RELATIVE_ACCURACY) / (1 - RELATIVE_ACCURACY)
+
+    def __init__(self, series: Iterable[int] = ()):
+        self.count = 0
+        self.total = 0
+        self.total_of_squares = 0
+        self.min: Optional[int] = None
+        self.max: Optional[int] = None
+        self._bins: Dict[int, int] = {}
+        """Counts by value, or by a logarithmic bin index when ``_binned``."""
+        self._binned = False
+
+        for value in series:
+            self._add(value, 1)
 
     def __str__(self) -> str:
-        if not self.series:
+        if self.count == 0:
             return "0"
 
-        if len(self.series) == 1:
-            return str(self.series[0])
+        if self.count == 1:
+            return str(self.min)
 
-        mean_v = round(statistics.mean(self.series), 2)
-        median_v = statistics.median(self.series)
-        min_v = min(self.series)
-        max_v = max(self.series)
+        mean_v = round(self.mean, 2)
+        median_v = self.median
+        min_v = self.min
+        max_v = self.max
         return f"μ: {mean_v:g}, Md: {median_v:g}, min: {min_v:g}, max: {max_v:g}"
 
     def __bool__(self) -> bool:
-        return bool(self.series)
+        return self.count > 0
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, CountSeriesStatistic):
+            return NotImplemented
+        return self._state() == other._state()
+
+    def __repr__(self) -> str:
+        return (
+            f"{self.__class__.__name__}(count={self.count}, mean={self.mean}, "
+            f"min={self.min}, max={self.max})"
+        )
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.count if self.count else 0.0
+
+    @property
+    def variance(self) -> float:
+        """Population variance."""
+        if self.count == 0:
+            return 0.0
+        return (self.count * self.total_of_squares - self.total**2) / self.count**2
+
+    @property
+    def median(self) -> float:
+        if self.count == 0:
+            return 0.0
+
+        middle_positions = (
+            {self.count // 2}
+            if self.count % 2
+            else {self.count // 2 - 1, self.count // 2}
+        )
+        middle_values = []
+        position = 0
+        for key in sorted(self._bins):
+            bin_count = self._bins[key]
+            for middle_position in sorted(middle_positions):
+                if position <= middle_position < position + bin_count:
+                    middle_values.append(self._bin_value(key))
+            position += bin_count
+        return sum(middle_values) / len(middle_values)
+
+    def merge(self, other: "CountSeriesStatistic") -> "CountSeriesStatistic":
+        result = CountSeriesStatistic()
+        for source in (self, other):
+            result.count += source.count
+            result.total += source.total
+            result.total_of_squares += source.total_of_squares
+            result.min = _optional_min(result.min, source.min)
+            result.max = _optional_max(result.max, source.max)
+        result._binned = self._binned or other._binned
+        for source in (self, other):
+            for key, bin_count in source._bins.items():
+                if result._binned and not source._binned:
+                    key = self._bin_index(key)
+                result._bins[key] = result._bins.get(key, 0) + bin_count
+        result._bin_if_needed()
+        return result
 
     @classmethod
     def from_statistic(cls, statistic: Statistic) -> Self:
@@ -68,15 +150,93 @@ class CountSeriesStatistic(Statistic):
 
         raise TypeError("Unknown statistic type.")
 
+    def _add(self, value: int, count: int):
+        self.count += count
+        self.total += value * count
+        self.total_of_squares += value * value * count
+        self.min = _optional_min(self.min, value)
+        self.max = _optional_max(self.max, value)
+        key = self._bin_index(value) if self._binned else value
+        self._bins[key] = self._bins.get(key, 0) + count
+        self._bin_if_needed()
+
+    def _bin_if_needed(self):
+        if self._binned or len(self._bins) <= self.MAX_EXACT_VALUES:
+            return
+        bins: Dict[int, int] = {}
+        for value, count in self._bins.items():
+            key = self._bin_index(value)
+            bins[key] = bins.get(key, 0) + count
+        self._bins = bins
+        self._binned = True
+
+    @classmethod
+    def _bin_index(cls, value: int) -> int:
+        if value <= 0:
+            return 0
+        return math.ceil(math.log(value, cls._GAMMA)) + 1
+
+    def _bin_value(self, key: int) -> float:
+        if not self._binned:
+            return key
+        if key == 0:
+            return 0
+        return 2 * self._GAMMA ** (key - 1) / (self._GAMMA + 1)
+
+    def _state(self):
+        return (
+            self.count,
+            self.total,
+            self.total_of_squares,
+            self.min,
+            self.max,
+            self._binned,
+            self._bins,
+        )
+
+
+def _statistic_to_json(statistic: Statistic) -> Any:
+    if isinstance(statistic, CountStatistic):
+        return statistic.value
+    series = CountSeriesStatistic.from_statistic(statistic)
+    return {"mean": round(series.mean, 2), "max": series.max or 0}
+
+
+def _add_counts(lhs: Statistic, rhs: Statistic) -> CountStatistic:
+    assert isinstance(lhs, CountStatistic) and isinstance(
+        rhs, CountStatistic
+    ), "Only resources of single observations can be added."
+    return CountStatistic(lhs.value + rhs.value)
+
+
+def _optional_min(lhs: Optional[int], rhs: Optional[int]) -> Optional[int]:
+    if lhs is None:
+        return rhs
+    if rhs is None:
+        return lhs
+    return min(lhs, rhs)
+
+
+def _optional_max(lhs: Optional[int], rhs: Optional[int]) -> Optional[int]:
+    if lhs is None:
+        return rhs
+    if rhs is None:
+        return lhs
+    return max(lhs, rhs)
+
 
 @dataclass
 class ExecutionResourcesSummary:
     n_steps: Statistic = field(default_factory=CountStatistic)
     n_memory_holes: Statistic = field(default_factory=CountStatistic)
     builtin_name_to_count_map: Dict[str, Statistic] = field(default_factory=dict)
+    # Resources collected with `--fast-vm`, which doesn't account memory holes.
+    approximate: bool = False
 
     @classmethod
-    def from_execution_resources(cls, execution_resources: ExecutionResources):
+    def from_execution_resources(
+        cls, execution_resources: ExecutionResources, approximate: bool = False
+    ):
         return cls(
             n_steps=CountStatistic(execution_resources.n_steps),
             n_memory_holes=CountStatistic(execution_resources.n_memory_holes),
@@ -84,6 +244,7 @@ class ExecutionResourcesSummary:
                 k: CountStatistic(v)
                 for k, v in execution_resources.builtin_instance_counter.items()
             },
+            approximate=approximate,
         )
 
     def add_observation(self, other: Self) -> Self:
@@ -99,8 +260,46 @@ class ExecutionResourcesSummary:
             n_steps=self.n_steps.add_observation(other.n_steps),
             n_memory_holes=self.n_memory_holes.add_observation(other.n_memory_holes),
             builtin_name_to_count_map=dict(builtin_name_to_count_map),
+            approximate=self.approximate or other.approximate,
         )
 
+    def add_execution(self, other: Self) -> Self:
+        """
+        Adds resources of another execution within the same observation, e.g. of the next call
+        made by the same fuzz example. Both summaries must hold a single observation.
+        """
+        builtin_name_to_count_map: Dict[str, Statistic] = {}
+        for source in [self.builtin_name_to_count_map, other.builtin_name_to_count_map]:
+            for k, v in source.items():
+                builtin_name_to_count_map[k] = _add_counts(
+                    builtin_name_to_count_map.get(k, CountStatistic()), v
+                )
+
+        return dataclasses.replace(
+            self,
+            n_steps=_add_counts(self.n_steps, other.n_steps),
+            n_memory_holes=_add_counts(self.n_memory_holes, other.n_memory_holes),
+            builtin_name_to_count_map=builtin_name_to_count_map,
+            approximate=self.approximate or other.approximate,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Machine-readable representation. Statistics of many observations, e.g. of fuzz tests,
+        are represented by their mean and max.
+        """
+        result: Dict[str, Any] = {
+            "steps": _statistic_to_json(self.n_steps),
+            "memory_holes": _statistic_to_json(self.n_memory_holes),
+            "builtins": {
+                name: _statistic_to_json(statistic)
+                for name, statistic in sorted(self.builtin_name_to_count_map.items())
+            },
+        }
+        if self.approximate:
+            result["approximate"] = True
+        return result
+
     @staticmethod
     def sum(
         items: Iterable["ExecutionResourcesSummary"],
@@ -112,3 +311,15 @@ class ExecutionResourcesSummary:
             else:
                 result = result.add_observation(item)
         return result
+
+    @staticmethod
+    def sum_executions(
+        items: Iterable["ExecutionResourcesSummary"],
+    ) -> Optional["ExecutionResourcesSummary"]:
+        result = None
+        for item in items:
+            if result is None:
+                result = item
+            else:
+                result = result.add_execution(item)
+        return result
@@ -35,6 +35,39 @@ def test_count_series_statistic_bool():
     assert bool(CountSeriesStatistic([1]))
 
 
+def test_count_series_statistic_moments():
+    statistic = CountSeriesStatistic([1, 6, 3, 2, 6, 2])
+
+    assert statistic.count == 6
+    assert statistic.mean == pytest.approx(20 / 6)
+    assert statistic.variance == pytest.approx(3.888888)
+    assert statistic.min == 1
+    assert statistic.max == 6
+    assert statistic.median == 2.5
+
+
+def test_count_series_statistic_uses_bounded_memory():
+    statistic = CountSeriesStatistic(range(100_000))
+
+    # pylint: disable=protected-access
+    assert len(statistic._bins) < 2000
+    assert statistic.count == 100_000
+    assert statistic.min == 0
+    assert statistic.max == 99_999
+    assert statistic.mean == pytest.approx(49_999.5)
+    assert statistic.median == pytest.approx(
+        50_000, rel=CountSeriesStatistic.RELATIVE_ACCURACY
+    )
+
+
+def test_count_series_statistic_merge_equals_observing_all_values():
+    values = [(i * 7919) % 100_003 for i in range(10_000)]
+
+    assert CountSeriesStatistic(values[:3000]).merge(
+        CountSeriesStatistic(values[3000:])
+    ) == CountSeriesStatistic(values)
+
+
 def test_count_series_statistic_from_count_series_statistic():
     css = CountSeriesStatistic([1, 2])
     assert CountSeriesStatistic.from_statistic(css) is css
@@ -175,3 +208,81 @@ def test_execution_resources_summary_add_observation_is_associative():
     assert ers_a.add_observation(ers_b).add_observation(ers_c) == ers_a.add_observation(
         ers_b.add_observation(ers_c)
     )
+
+
+def test_execution_resources_summary_add_observation_keeps_approximate():
+    assert (
+        ExecutionResourcesSummary(approximate=True)
+        .add_observation(ExecutionResourcesSummary())
+        .approximate
+    )
+    assert (
+        ExecutionResourcesSummary()
+        .add_observation(ExecutionResourcesSummary(approximate=True))
+        .approximate
+    )
+    assert (
+        not ExecutionResourcesSummary()
+        .add_observation(ExecutionResourcesSummary())
+        .approximate
+    )
+
+
+def test_execution_resources_summary_add_execution():
+    lhs = ExecutionResourcesSummary(
+        n_steps=CountStatistic(1),
+        n_memory_holes=CountStatistic(2),
+        builtin_name_to_count_map={"foo": CountStatistic(1), "bar": CountStatistic(1)},
+    )
+
+    rhs = ExecutionResourcesSummary(
+        n_steps=CountStatistic(2),
+        n_memory_holes=CountStatistic(3),
+        builtin_name_to_count_map={"foo": CountStatistic(2), "moo": CountStatistic(1)},
+        approximate=True,
+    )
+
+    assert lhs.add_execution(rhs) == ExecutionResourcesSummary(
+        n_steps=CountStatistic(3),
+        n_memory_holes=CountStatistic(5),
+        builtin_name_to_count_map={
+            "foo": CountStatistic(3),
+            "bar": CountStatistic(1),
+            "moo": CountStatistic(1),
+        },
+        approximate=True,
+    )
+
+
+def test_execution_resources_summary_sum_executions():
+    assert ExecutionResourcesSummary.sum_executions([]) is None
+    assert ExecutionResourcesSummary.sum_executions(
+        [
+            ExecutionResourcesSummary(n_steps=CountStatistic(1)),
+            ExecutionResourcesSummary(n_steps=CountStatistic(2)),
+            ExecutionResourcesSummary(n_steps=CountStatistic(3)),
+        ]
+    ) == ExecutionResourcesSummary(n_steps=CountStatistic(6))
+
+
+def test_execution_resources_summary_add_execution_of_many_observations():
+    with pytest.raises(AssertionError):
+        ExecutionResourcesSummary().add_execution(
+            ExecutionResourcesSummary(n_steps=CountSeriesStatistic([1, 2]))
+        )
+
+
+def test_execution_resources_summary_to_dict():
+    summary = ExecutionResourcesSummary(
+        n_steps=CountSeriesStatistic([10, 20, 40]),
+        n_memory_holes=CountStatistic(3),
+        builtin_name_to_count_map={"range_check_builtin": CountStatistic(2)},
+        approximate=True,
+    )
+
+    assert summary.to_dict() == {
+        "steps": {"mean": 23.33, "max": 40},
+        "memory_holes": 3,
+        "builtins": {"range_check_builtin": 2},
+        "approximate": True,
+    }
@@ -12,6 +12,7 @@ from protostar.commands.test.test_output_recorder import OutputRecorder
 from protostar.starknet.execution_state import ExecutionState
 from protostar.starknet.forkable_starknet import ForkableStarknet
 from protostar.utils.starknet_compilation import StarknetCompiler
+from protostar.utils.tracing import trace_span
 
 
 @dataclass
@@ -28,8 +29,10 @@ class TestExecutionState(ExecutionState):
         test_suite_definition: ContractClass,
         test_config: TestConfig,
     ) -> Self:
-        starknet = await ForkableStarknet.empty()
-        contract = await starknet.deploy(contract_class=test_suite_definition)
+        with trace_span("ForkableStarknet.empty", "setup"):
+            starknet = await ForkableStarknet.empty()
+        with trace_span("deploy test contract", "setup"):
+            contract = await starknet.deploy(contract_class=test_suite_definition)
         assert test_suite_definition.abi is not None
         starknet.cheatable_state.cheatable_carried_state.class_hash_to_contract_abi_map[
             0
@@ -41,7 +44,7 @@ class TestExecutionState(ExecutionState):
             config=test_config,
             context=TestContext(),
             contract=contract,
-            output_recorder=OutputRecorder(),
+            output_recorder=OutputRecorder(spill_dir=test_config.outputs_spill_dir),
             stopwatch=Stopwatch(),
             starknet=starknet,
             starknet_compiler=starknet_compiler,
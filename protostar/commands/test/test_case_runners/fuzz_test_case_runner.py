@@ -7,6 +7,9 @@ from protostar.commands.test.environments.fuzz_test_execution_environment import
 from protostar.commands.test.fuzzing.fuzz_input_exception_metadata import (
     FuzzInputExceptionMetadata,
 )
+from protostar.commands.test.fuzzing.fuzz_telemetry import (
+    FuzzTelemetryExceptionMetadata,
+)
 from protostar.commands.test.test_case_runners.test_case_runner import TestCaseRunner
 from protostar.commands.test.test_environment_exceptions import ReportedException
 from protostar.commands.test.test_results import (
@@ -40,7 +43,11 @@ class FuzzTestCaseRunner(TestCaseRunner[FuzzTestExecutionResult]):
         )
         return PassedFuzzTestCaseResult.from_passed_test_case_result(
             passed_test_case_result,
-            fuzz_result=FuzzResult(fuzz_runs_count=execution_result.fuzz_runs_count),
+            fuzz_result=FuzzResult(
+                fuzz_runs_count=execution_result.fuzz_runs_count,
+                fuzz_time_report=execution_result.fuzz_time_report,
+                fuzz_telemetry=execution_result.fuzz_telemetry,
+            ),
         )
 
     def _map_reported_exception_to_failed_test_result(
@@ -69,6 +76,16 @@ class FuzzTestCaseRunner(TestCaseRunner[FuzzTestExecutionResult]):
         if fuzz_input:
             fuzz_runs_count = reported_exception.execution_info["fuzz_runs"]
             assert isinstance(fuzz_runs_count, int)
-            return FuzzResult(fuzz_runs_count=fuzz_runs_count)
+            telemetry_metadata = reported_exception.get_metadata_by_type(
+                FuzzTelemetryExceptionMetadata
+            )
+            # Time report of a failed fuzz test is a part of the execution info.
+            return FuzzResult(
+                fuzz_runs_count=fuzz_runs_count,
+                fuzz_time_report=None,
+                fuzz_telemetry=telemetry_metadata.telemetry
+                if telemetry_metadata
+                else None,
+            )
 
         return None
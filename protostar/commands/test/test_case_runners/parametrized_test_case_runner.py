@@ -0,0 +1,84 @@
+from protostar.commands.test.environments.parametrized_test_execution_environment import (
+    ParametrizedTestExecutionEnvironment,
+)
+from protostar.commands.test.environments.test_execution_environment import (
+    TestExecutionResult,
+)
+from protostar.commands.test.test_case_runners.test_case_runner import TestCaseRunner
+from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_results import (
+    FailedParametrizedTestCaseResult,
+    FailedTestCaseResult,
+    PassedParametrizedTestCaseResult,
+    PassedTestCaseResult,
+)
+
+
+class ParametrizedTestCaseRunner(TestCaseRunner[TestExecutionResult]):
+    """
+    Runs a single row of a parametrized test case and reports it as a separate result,
+    e.g. ``test_transfer[amount=1, recipient=2]``.
+    """
+
+    def __init__(
+        self,
+        parametrized_test_execution_environment: ParametrizedTestExecutionEnvironment,
+        row_index: int,
+        rows_count: int,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        self._parametrized_test_execution_environment = (
+            parametrized_test_execution_environment
+        )
+        self._row_index = row_index
+        self._rows_count = rows_count
+
+    @property
+    def row_name(self) -> str:
+        arguments = ", ".join(
+            f"{name}={value!r}"
+            for name, value in self._parametrized_test_execution_environment.arguments.items()
+        )
+        return f"{self._test_case.test_fn_name}[{arguments}]"
+
+    async def _run_test_case(self) -> TestExecutionResult:
+        return await self._parametrized_test_execution_environment.invoke(
+            self._test_case.test_fn_name
+        )
+
+    def _map_execution_result_to_passed_test_result(
+        self,
+        execution_result: TestExecutionResult,
+        execution_metadata: TestCaseRunner.ExecutionMetadata,
+    ) -> PassedTestCaseResult:
+        passed_test_case_result = super()._map_execution_result_to_passed_test_result(
+            execution_result, execution_metadata
+        )
+        return PassedParametrizedTestCaseResult(
+            file_path=passed_test_case_result.file_path,
+            test_case_name=self.row_name,
+            captured_stdout=passed_test_case_result.captured_stdout,
+            execution_resources=passed_test_case_result.execution_resources,
+            execution_time=passed_test_case_result.execution_time,
+            row_index=self._row_index,
+            rows_count=self._rows_count,
+        )
+
+    def _map_reported_exception_to_failed_test_result(
+        self,
+        reported_exception: ReportedException,
+        execution_metadata: TestCaseRunner.ExecutionMetadata,
+    ) -> FailedTestCaseResult:
+        failed_test_case_result = super()._map_reported_exception_to_failed_test_result(
+            reported_exception, execution_metadata
+        )
+        return FailedParametrizedTestCaseResult(
+            file_path=failed_test_case_result.file_path,
+            test_case_name=self.row_name,
+            captured_stdout=failed_test_case_result.captured_stdout,
+            exception=failed_test_case_result.exception,
+            execution_time=failed_test_case_result.execution_time,
+            row_index=self._row_index,
+            rows_count=self._rows_count,
+        )
@@ -1,13 +1,27 @@
+from typing import Iterator
+
 from protostar.commands.test.environments.fuzz_test_execution_environment import (
     FuzzTestExecutionEnvironment,
 )
+from protostar.commands.test.environments.invariant_test_execution_environment import (
+    InvariantTestExecutionEnvironment,
+)
+from protostar.commands.test.environments.parametrized_test_execution_environment import (
+    ParametrizedTestExecutionEnvironment,
+)
 from protostar.commands.test.environments.test_execution_environment import (
     TestExecutionEnvironment,
 )
+from protostar.commands.test.fuzzing.hypothesis.database import (
+    create_example_database,
+)
 from protostar.commands.test.starkware.test_execution_state import TestExecutionState
 from protostar.commands.test.test_case_runners.fuzz_test_case_runner import (
     FuzzTestCaseRunner,
 )
+from protostar.commands.test.test_case_runners.parametrized_test_case_runner import (
+    ParametrizedTestCaseRunner,
+)
 from protostar.commands.test.test_case_runners.standard_test_case_runner import (
     StandardTestCaseRunner,
 )
@@ -24,7 +38,23 @@ class TestCaseRunnerFactory:
         if self._state.config.mode is TestMode.FUZZ:
             return FuzzTestCaseRunner(
                 fuzz_test_execution_environment=FuzzTestExecutionEnvironment(
-                    self._state
+                    self._state,
+                    example_database=create_example_database(
+                        self._state.config.fuzz_database_path, test_case
+                    ),
+                ),
+                test_case=test_case,
+                output_recorder=self._state.output_recorder,
+                stopwatch=self._state.stopwatch,
+            )
+
+        if self._state.config.mode is TestMode.INVARIANT:
+            return FuzzTestCaseRunner(
+                fuzz_test_execution_environment=InvariantTestExecutionEnvironment(
+                    self._state,
+                    example_database=create_example_database(
+                        self._state.config.fuzz_database_path, test_case
+                    ),
                 ),
                 test_case=test_case,
                 output_recorder=self._state.output_recorder,
@@ -40,3 +70,22 @@ class TestCaseRunnerFactory:
             )
 
         raise NotImplementedError(f"Unreachable")
+
+    def make_parametrized_rows(self, test_case: TestCase) -> Iterator[TestCaseRunner]:
+        """
+        Yields a runner for each row of a parametrized test case. All rows start from
+        the same state, which is forked lazily, right before running a row.
+        """
+        rows = self._state.config.parameters_rows or []
+        for row_index, arguments in enumerate(rows):
+            row_state = self._state.fork()
+            yield ParametrizedTestCaseRunner(
+                parametrized_test_execution_environment=ParametrizedTestExecutionEnvironment(
+                    row_state, arguments=arguments
+                ),
+                row_index=row_index,
+                rows_count=len(rows),
+                test_case=test_case,
+                output_recorder=row_state.output_recorder,
+                stopwatch=row_state.stopwatch,
+            )
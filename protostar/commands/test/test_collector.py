@@ -299,12 +299,15 @@ class TestCollector:
         ],
         test_path: Path,
     ) -> Iterable[TestCase]:
-        test_prefix = "test_"
+        test_prefixes = ["test_", "invariant_"]
         setup_prefix = "setup_"
 
         fn_names = set(self._starknet_compiler.get_function_names(preprocessed))
         for test_fn_name in fn_names:
-            if test_fn_name.startswith(test_prefix):
+            for test_prefix in test_prefixes:
+                if not test_fn_name.startswith(test_prefix):
+                    continue
+
                 base_name = test_fn_name[len(test_prefix) :]
 
                 setup_fn_name = setup_prefix + base_name
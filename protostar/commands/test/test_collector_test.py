@@ -166,6 +166,29 @@ def test_finding_setup_case_function(
     )
 
 
+def test_collecting_invariant_functions(
+    starknet_compiler: StarknetCompiler, project_root: Path
+):
+    def get_function_names(_) -> List[str]:
+        return ["invariant_balance", "handler_deposit", "setup_balance"]
+
+    cast(
+        MagicMock, starknet_compiler.get_function_names
+    ).side_effect = get_function_names
+    test_collector = TestCollector(starknet_compiler)
+
+    test_path = project_root / "foo" / "test_foo.cairo"
+    [suite] = test_collector.collect([str(test_path)]).test_suites
+
+    assert suite.test_cases == [
+        TestCase(
+            test_path=test_path,
+            test_fn_name="invariant_balance",
+            setup_fn_name="setup_balance",
+        )
+    ]
+
+
 def test_collecting_from_directory_globs(starknet_compiler, project_root):
     test_collector = TestCollector(starknet_compiler)
 
@@ -1,14 +1,43 @@
 # pylint: disable=too-many-arguments
 
+import shutil
+import tempfile
+from contextlib import contextmanager
 from logging import Logger
 from pathlib import Path
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from protostar.cli.activity_indicator import ActivityIndicator
 from protostar.cli.command import Command
 from protostar.commands.test.environments.fuzz_test_execution_environment import (
     FuzzConfig,
 )
+from protostar.commands.test.fuzzing.fuzz_partitions import can_run_in_forked_processes
+from protostar.commands.test.reporters.jsonl_reporter import JsonLinesReporter
+from protostar.commands.test.reporters.junit_reporter import JUnitXmlReporter
+from protostar.commands.test.reporters.test_result_reporter import (
+    CapturedOutputsWriter,
+    TestResultReporter,
+)
+from protostar.commands.test.resources_snapshot import (
+    RESOURCES_SNAPSHOT_FILE_NAME,
+    RESOURCES_SNAPSHOT_SEED,
+    ResourcesSnapshot,
+    ResourcesSnapshotRecorder,
+    format_resources_diff_table,
+)
+from protostar.commands.test.run_history import (
+    RUN_HISTORY_FILE_NAME,
+    RunHistory,
+    RunHistoryRecorder,
+    compare_test_results,
+    format_history_deltas_table,
+    get_git_revision,
+)
+from protostar.commands.test.runner_profiler import (
+    clear_runner_profiles,
+    merge_runner_profiles,
+)
 from protostar.commands.test.test_collector import TestCollector
 from protostar.commands.test.test_collector_summary_formatter import (
     format_test_collector_summary,
@@ -21,6 +50,7 @@ from protostar.commands.test.testing_live_logger import TestingLiveLogger
 from protostar.commands.test.testing_seed import TestingSeed
 from protostar.commands.test.testing_summary import TestingSummary
 from protostar.compiler import ProjectCairoPathBuilder
+from protostar.protostar_exception import ProtostarException
 from protostar.utils.compiler.pass_managers import (
     StarknetPassManagerFactory,
     TestCollectorPassManagerFactory,
@@ -28,6 +58,16 @@ from protostar.utils.compiler.pass_managers import (
 from protostar.utils.log_color_provider import LogColorProvider
 from protostar.utils.protostar_directory import ProtostarDirectory
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
+from protostar.utils.tracing import (
+    TraceRecorder,
+    get_trace_recorder,
+    merge_trace_parts,
+    set_trace_recorder,
+    trace_span,
+)
+
+
+COMPARED_TEST_CASES_COUNT = 10
 
 
 class TestCommand(Command):
@@ -112,6 +152,15 @@ A glob or globs to a directory or a test suite, for example:
                 type="bool",
                 description="Exit immediately on first broken or failed test.",
             ),
+            Command.Argument(
+                name="show-output",
+                type="bool",
+                description=(
+                    "Keep outputs of passing fuzz examples, which are dropped by default. "
+                    "Long outputs are cut in the middle either way, and saved in full "
+                    "in a temporary file."
+                ),
+            ),
             Command.Argument(
                 name="seed",
                 type="int",
@@ -127,12 +176,167 @@ A glob or globs to a directory or a test suite, for example:
                     "without finding any counter-example, falsification will terminate."
                 ),
             ),
+            Command.Argument(
+                name="fuzz-time-budget",
+                type="float",
+                description=(
+                    "Stop generating new examples of a fuzz test after this many seconds. "
+                    "Can be overridden per test with the `settings` cheatcode."
+                ),
+            ),
+            Command.Argument(
+                name="fuzz-shrink-time-limit",
+                type="float",
+                description=(
+                    "Stop shrinking a failing example of a fuzz test after this many seconds "
+                    "and report the smallest one found so far. "
+                    "Can be overridden per test with the `settings` cheatcode."
+                ),
+            ),
+            Command.Argument(
+                name="fuzz-workers",
+                type="int",
+                default=1,
+                description=(
+                    "Split examples of each fuzz test between this many processes, "
+                    "which start from the state after setup and use seeds derived from "
+                    "the testing seed. Supported only on Linux."
+                ),
+            ),
+            Command.Argument(
+                name="invariant-depth",
+                type="int",
+                default=20,
+                description=(
+                    "Maximum number of handler calls made in a single example "
+                    "of an invariant test."
+                ),
+            ),
+            Command.Argument(
+                name="invariant-fail-on-revert",
+                type="bool",
+                description=(
+                    "Fail invariant tests when a handler reverts. By default, "
+                    "reverted handler calls are skipped."
+                ),
+            ),
+            Command.Argument(
+                name="report-junit",
+                type="path",
+                description=(
+                    "Write results to a JUnit XML file as they arrive, with execution "
+                    "resources and fuzzing statistics as properties. Captured outputs are "
+                    "saved in `.protostar/test-outputs` and attached to test cases."
+                ),
+            ),
+            Command.Argument(
+                name="report-jsonl",
+                type="path",
+                description=(
+                    "Write a JSON object per result to a JSON Lines file as results arrive, "
+                    "with timings, execution resources, fuzzing statistics and paths "
+                    "of captured outputs saved in `.protostar/test-outputs`."
+                ),
+            ),
             Command.Argument(
                 name="report-slowest-tests",
                 type="int",
                 description="Print slowest tests at the end.",
                 default=0,
             ),
+            Command.Argument(
+                name="profile",
+                type="bool",
+                description=(
+                    "Count Cairo VM steps of each test case per function, including calls to "
+                    "other contracts, and save them in `.protostar/profile` as collapsed stacks "
+                    "(`.folded`), pprof (`.pb.gz`) and text (`.txt`) files."
+                ),
+            ),
+            Command.Argument(
+                name="profile-runner",
+                type="bool",
+                description=(
+                    "Profile Python code of the test runner with cProfile, separately for "
+                    "compiling test suites, setting them up, executing test cases and sending "
+                    "results between processes. Stats of all workers are merged and saved in "
+                    "`.protostar/profile-runner` as `.pstats` files and a text summary."
+                ),
+            ),
+            Command.Argument(
+                name="report-memory",
+                type="bool",
+                description=(
+                    "Report memory used by each test case: the peak size of Python objects "
+                    "traced with tracemalloc, the growth of the worker's resident set size, "
+                    "and Cairo memory segments and cells, including calls to other contracts. "
+                    "Tracing Python allocations slows down tests considerably."
+                ),
+            ),
+            Command.Argument(
+                name="resources-snapshot",
+                type="bool",
+                description=(
+                    f"Save execution resources of passing test cases in `{RESOURCES_SNAPSHOT_FILE_NAME}` "
+                    "in the project root, which is meant to be committed. "
+                    "Entries of test cases which weren't run are kept. Fuzz tests use "
+                    "a fixed seed, unless `--seed` is given, and no fuzzing database."
+                ),
+            ),
+            Command.Argument(
+                name="check-snapshot",
+                type="bool",
+                description=(
+                    "Fail if any execution resource of a passing test case grew compared to "
+                    f"`{RESOURCES_SNAPSHOT_FILE_NAME}` by more than `--snapshot-tolerance`, "
+                    "and print a table of changed resources."
+                ),
+            ),
+            Command.Argument(
+                name="snapshot-tolerance",
+                type="float",
+                description=(
+                    "Allowed growth of each execution resource checked by `--check-snapshot`, "
+                    "in percent."
+                ),
+                default=0.0,
+            ),
+            Command.Argument(
+                name="trace-file",
+                type="path",
+                description=(
+                    "Record a timeline of the run in the Chrome Trace Event format, which can be "
+                    "opened in Perfetto or `chrome://tracing`. Each worker gets its own track "
+                    "with spans of compilation, setup, test cases, batches of fuzz examples and "
+                    "sending results."
+                ),
+            ),
+            Command.Argument(
+                name="no-history",
+                type="bool",
+                description=(
+                    "Don't record results of the run in the run history, which is stored in "
+                    f"`.protostar/{RUN_HISTORY_FILE_NAME}` and read by `protostar history`."
+                ),
+            ),
+            Command.Argument(
+                name="compare",
+                type="str",
+                description=(
+                    "Print test cases whose time and steps changed the most since a run "
+                    "from the run history, given by its ID or a git revision, "
+                    "e.g. `main`, in which case the latest run of that commit is used."
+                ),
+            ),
+            Command.Argument(
+                name="fast-vm",
+                type="bool",
+                description=(
+                    "Run contracts compiled from the project in a trusted mode, which skips "
+                    "the secure run verification and doesn't record the execution trace. "
+                    "Reported resources are approximate and don't include memory holes."
+                ),
+            ),
         ]
 
     async def run(self, args) -> TestingSummary:
@@ -147,7 +351,26 @@ A glob or globs to a directory or a test suite, for example:
             seed=args.seed,
             # TODO(mkaput): Remove this.
             fuzz_max_examples=args.fuzz_max_examples,
+            fuzz_workers=args.fuzz_workers,
+            fuzz_time_budget=args.fuzz_time_budget,
+            fuzz_shrink_time_limit=args.fuzz_shrink_time_limit,
+            invariant_depth=args.invariant_depth,
+            invariant_fail_on_revert=args.invariant_fail_on_revert,
             slowest_tests_to_report_count=args.report_slowest_tests,
+            fast_vm=args.fast_vm,
+            profile=args.profile,
+            profile_runner=args.profile_runner,
+            report_memory=args.report_memory,
+            resources_snapshot=args.resources_snapshot,
+            check_snapshot=args.check_snapshot,
+            snapshot_tolerance=args.snapshot_tolerance,
+            trace_file=args.trace_file,
+            report_junit=args.report_junit,
+            report_jsonl=args.report_jsonl,
+            show_output=args.show_output,
+            keep_passed_results=False,
+            record_history=not args.no_history,
+            compare_with=args.compare,
         )
         summary.assert_all_passed()
         return summary
@@ -165,7 +388,26 @@ A glob or globs to a directory or a test suite, for example:
         seed: Optional[int] = None,
         # TODO(mkaput): Remove this.
         fuzz_max_examples: int = 100,
+        fuzz_workers: int = 1,
+        fuzz_time_budget: Optional[float] = None,
+        fuzz_shrink_time_limit: Optional[float] = None,
+        invariant_depth: int = 20,
+        invariant_fail_on_revert: bool = False,
         slowest_tests_to_report_count: int = 0,
+        fast_vm: bool = False,
+        profile: bool = False,
+        profile_runner: bool = False,
+        report_memory: bool = False,
+        resources_snapshot: bool = False,
+        check_snapshot: bool = False,
+        snapshot_tolerance: float = 0.0,
+        trace_file: Optional[Path] = None,
+        report_junit: Optional[Path] = None,
+        report_jsonl: Optional[Path] = None,
+        show_output: bool = False,
+        keep_passed_results: bool = True,
+        record_history: bool = False,
+        compare_with: Optional[str] = None,
     ) -> TestingSummary:
         include_paths = [
             str(path)
@@ -181,10 +423,57 @@ A glob or globs to a directory or a test suite, for example:
             if safe_collecting
             else TestCollectorPassManagerFactory
         )
-        with TestingSeed(seed) as testing_seed:
+        profile_path = (
+            self._project_root_path / ".protostar" / "profile" if profile else None
+        )
+        runner_profile_path = (
+            self._project_root_path / ".protostar" / "profile-runner"
+            if profile_runner
+            else None
+        )
+        if runner_profile_path:
+            clear_runner_profiles(runner_profile_path)
+        # Full outputs are kept until the next run, because results refer to them.
+        outputs_spill_dir = self._project_root_path / ".protostar" / "spilled-outputs"
+        shutil.rmtree(outputs_spill_dir, ignore_errors=True)
+        if compare_with is not None and not record_history:
+            raise ProtostarException("`--compare` can't be used with `--no-history`")
+        # Resources of fuzz tests depend on generated examples, which are reproducible only
+        # with the same seed and without examples replayed from the fuzzing database.
+        reproducible_fuzzing = resources_snapshot or check_snapshot
+        if reproducible_fuzzing:
+            if seed is None:
+                seed = RESOURCES_SNAPSHOT_SEED
+            if fuzz_time_budget is not None:
+                self._logger.warning(
+                    "Resources of fuzz tests stopped by `--fuzz-time-budget` "
+                    "may differ between runs"
+                )
+        if fuzz_workers > 1 and not can_run_in_forked_processes():
+            self._logger.warning(
+                "`--fuzz-workers` is supported only on Linux, fuzz tests run in a single process"
+            )
+
+        with self._record_trace(trace_file), self._report_test_results(
+            report_junit, report_jsonl
+        ) as reporters, self._record_run_history(
+            record_history
+        ) as run_history_recorder, TestingSeed(
+            seed
+        ) as testing_seed:
+            baseline_run_id = (
+                run_history_recorder.run_history.find_run_id(
+                    compare_with,
+                    self._project_root_path,
+                    before_run_id=run_history_recorder.run_id,
+                )
+                if run_history_recorder and compare_with is not None
+                else None
+            )
+            trace_recorder = get_trace_recorder()
             with ActivityIndicator(
                 self._log_color_provider.colorize("GRAY", "Collecting tests")
-            ):
+            ), trace_span("collect tests", "collection"):
                 test_collector_result = TestCollector(
                     StarknetCompiler(
                         config=CompilerConfig(
@@ -200,10 +489,31 @@ A glob or globs to a directory or a test suite, for example:
                 )
 
             self._log_test_collector_result(test_collector_result)
+            resources_snapshot_recorder = (
+                ResourcesSnapshotRecorder(self._project_root_path)
+                if resources_snapshot or check_snapshot
+                else None
+            )
+            test_result_reporters = [
+                reporter
+                for reporter in [
+                    *reporters,
+                    run_history_recorder,
+                    resources_snapshot_recorder,
+                ]
+                if reporter is not None
+            ]
+            for reporter in test_result_reporters:
+                for broken_test_suite in test_collector_result.broken_test_suites:
+                    reporter.report(broken_test_suite)
 
             testing_summary = TestingSummary(
                 case_results=test_collector_result.broken_test_suites,  # type: ignore | pyright bug?
                 testing_seed=testing_seed,
+                keep_passed=keep_passed_results,
+                slowest_test_cases_capacity=None
+                if keep_passed_results
+                else slowest_tests_to_report_count,
             )
 
             if test_collector_result.test_cases_count > 0:
@@ -213,18 +523,188 @@ A glob or globs to a directory or a test suite, for example:
                     no_progress_bar=no_progress_bar,
                     exit_first=exit_first,
                     slowest_tests_to_report_count=slowest_tests_to_report_count,
+                    reporters=test_result_reporters,
                 )
-                TestScheduler(live_logger, worker=TestRunner.worker).run(
-                    include_paths=include_paths,
-                    test_collector_result=test_collector_result,
-                    # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
-                    fuzz_config=FuzzConfig(max_examples=fuzz_max_examples),
-                    disable_hint_validation=disable_hint_validation,
-                    exit_first=exit_first,
-                )
+                with trace_span("run tests", "scheduling"):
+                    TestScheduler(live_logger, worker=TestRunner.worker).run(
+                        include_paths=include_paths,
+                        test_collector_result=test_collector_result,
+                        # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
+                        fuzz_config=FuzzConfig(
+                            max_examples=fuzz_max_examples,
+                            workers=fuzz_workers,
+                            time_budget=fuzz_time_budget,
+                            shrink_time_limit=fuzz_shrink_time_limit,
+                            invariant_depth=invariant_depth,
+                            invariant_fail_on_revert=invariant_fail_on_revert,
+                            show_output=show_output,
+                            database_path=None
+                            if reproducible_fuzzing
+                            else self._project_root_path / ".protostar" / "fuzz-db",
+                        ),
+                        disable_hint_validation=disable_hint_validation,
+                        exit_first=exit_first,
+                        fast_vm=fast_vm,
+                        profile_path=profile_path,
+                        runner_profile_path=runner_profile_path,
+                        trace_dir=trace_recorder.parts_dir if trace_recorder else None,
+                        report_memory=report_memory,
+                        outputs_spill_dir=outputs_spill_dir,
+                    )
+
+                if profile_path:
+                    self._logger.info(f"Cairo profiles saved to {profile_path}")
+                if runner_profile_path:
+                    summary_path = merge_runner_profiles(runner_profile_path)
+                    self._logger.info(f"Test runner profile saved to {summary_path}")
+                if run_history_recorder and baseline_run_id is not None:
+                    self._log_run_comparison(run_history_recorder, baseline_run_id)
+                if resources_snapshot_recorder:
+                    self._handle_resources_snapshot(
+                        resources_snapshot_recorder.snapshot,
+                        save=resources_snapshot,
+                        check=check_snapshot,
+                        tolerance=snapshot_tolerance,
+                    )
 
             return testing_summary
 
+    @contextmanager
+    def _record_trace(self, trace_file: Optional[Path]):
+        if trace_file is None:
+            yield
+            return
+
+        trace_recorder = TraceRecorder(
+            Path(tempfile.mkdtemp(prefix="protostar-trace-")), process_name="main"
+        )
+        set_trace_recorder(trace_recorder)
+        try:
+            yield
+        finally:
+            set_trace_recorder(None)
+            trace_recorder.flush()
+            merge_trace_parts(trace_recorder.parts_dir, trace_file)
+            shutil.rmtree(trace_recorder.parts_dir, ignore_errors=True)
+            self._logger.info(f"Trace saved to {trace_file}")
+
+    @contextmanager
+    def _report_test_results(
+        self, report_junit: Optional[Path], report_jsonl: Optional[Path]
+    ) -> Iterator[List[TestResultReporter]]:
+        if report_junit is None and report_jsonl is None:
+            yield []
+            return
+
+        outputs_dir = self._project_root_path / ".protostar" / "test-outputs"
+        shutil.rmtree(outputs_dir, ignore_errors=True)
+        # Reporters share the writer, so outputs are written once.
+        outputs_writer = CapturedOutputsWriter(outputs_dir)
+        reporters: List[TestResultReporter] = []
+        try:
+            if report_junit:
+                reporters.append(JUnitXmlReporter(report_junit, outputs_writer))
+            if report_jsonl:
+                reporters.append(JsonLinesReporter(report_jsonl, outputs_writer))
+            yield reporters
+        finally:
+            for reporter in reporters:
+                reporter.close()
+            for report_path in [report_junit, report_jsonl]:
+                if report_path:
+                    self._logger.info(f"Test results saved to {report_path}")
+
+    @contextmanager
+    def _record_run_history(
+        self, record_history: bool
+    ) -> Iterator[Optional[RunHistoryRecorder]]:
+        if not record_history:
+            yield None
+            return
+
+        run_history = RunHistory(
+            self._project_root_path / ".protostar" / RUN_HISTORY_FILE_NAME
+        )
+        try:
+            run_history_recorder = RunHistoryRecorder(
+                run_history,
+                run_id=run_history.add_run(get_git_revision(self._project_root_path)),
+                project_root_path=self._project_root_path,
+            )
+            try:
+                yield run_history_recorder
+            finally:
+                # Results of an interrupted run are recorded too.
+                run_history_recorder.close()
+        finally:
+            run_history.close()
+
+    def _log_run_comparison(
+        self, run_history_recorder: RunHistoryRecorder, baseline_run_id: int
+    ):
+        run_history = run_history_recorder.run_history
+        baseline = run_history.get_test_results(baseline_run_id)
+        current = run_history.get_test_results(run_history_recorder.run_id)
+        self._logger.info(
+            f"Comparison with run {baseline_run_id} "
+            f"({len(set(baseline) & set(current))} common test cases):"
+        )
+        for metric, title, value_formatter in [
+            ("execution_time", "Time", lambda value: f"{value:.2f}s"),
+            ("steps", "Steps", lambda value: f"{value:g}"),
+        ]:
+            deltas = compare_test_results(baseline, current, metric)
+            if not deltas:
+                self._logger.info(f"{title}: no changes")
+                continue
+            self._logger.info(
+                f"{title}:\n"
+                + format_history_deltas_table(
+                    deltas[:COMPARED_TEST_CASES_COUNT], value_formatter
+                )
+            )
+
+    def _handle_resources_snapshot(
+        self,
+        current_snapshot: ResourcesSnapshot,
+        save: bool,
+        check: bool,
+        tolerance: float,
+    ):
+        snapshot_path = self._project_root_path / RESOURCES_SNAPSHOT_FILE_NAME
+        previous_snapshot = (
+            ResourcesSnapshot.load(snapshot_path)
+            if check or snapshot_path.exists()
+            else ResourcesSnapshot()
+        )
+
+        if check:
+            comparison = previous_snapshot.compare(
+                current_snapshot, tolerance=tolerance / 100
+            )
+            if comparison.new_test_ids:
+                self._logger.warning(
+                    f"{len(comparison.new_test_ids)} test case(s) are missing "
+                    f"in the resources snapshot"
+                )
+            if comparison.regressions:
+                raise ProtostarException(
+                    f"Execution resources of {len({diff.test_id for diff in comparison.regressions})} "
+                    f"test case(s) regressed beyond the tolerance of {tolerance:g}%",
+                    details=format_resources_diff_table(comparison.diffs),
+                )
+            if comparison.diffs:
+                self._logger.info(
+                    "Execution resources changed within the tolerance:\n"
+                    + format_resources_diff_table(comparison.diffs)
+                )
+            else:
+                self._logger.info("Execution resources match the snapshot")
+
+        if save:
+            previous_snapshot.updated_with(current_snapshot).save(snapshot_path)
+            self._logger.info(f"Resources snapshot saved to {snapshot_path}")
+
     def _log_test_collector_result(
         self, test_collector_result: TestCollector.Result
     ) -> None:
@@ -1,5 +1,7 @@
 from dataclasses import dataclass
 from enum import Enum
+from pathlib import Path
+from typing import Any, Dict, List, Optional
 
 from starkware.starknet.testing.contract import StarknetContract
 from typing_extensions import Self
@@ -10,12 +12,17 @@ from protostar.utils.abi import has_function_parameters
 class TestMode(Enum):
     STANDARD = 1
     FUZZ = 2
+    INVARIANT = 3
+    PARAMETRIZED = 4
 
     # TODO(mkaput): Remove this in favor of setting mode explicitly by cheatcodes in setup hooks.
     @classmethod
     def infer_from_contract_function(
         cls, function_name: str, contract: StarknetContract
     ) -> Self:
+        if function_name.startswith("invariant_"):
+            return cls.INVARIANT
+
         if has_function_parameters(contract.abi, function_name):
             return cls.FUZZ
 
@@ -27,3 +34,29 @@ class TestConfig:
     mode: TestMode = TestMode.STANDARD
 
     fuzz_max_examples: int = 100
+    fuzz_workers: int = 1
+    fuzz_database_path: Optional[Path] = None
+    fuzz_time_budget: Optional[float] = None
+    fuzz_shrink_time_limit: Optional[float] = None
+    fuzz_show_output: bool = False
+    """
+    Keep outputs of passing fuzz examples, which are dropped by default.
+    """
+
+    invariant_depth: int = 20
+    invariant_fail_on_revert: bool = False
+    """
+    Fail invariant tests when a handler reverts, instead of skipping the reverted call.
+    """
+
+    parameters_rows: Optional[List[Dict[str, Any]]] = None
+    """
+    Explicit arguments of a parametrized test case, one dictionary per row.
+    """
+
+    fast_vm: bool = False
+
+    outputs_spill_dir: Optional[Path] = None
+    """
+    Directory of full captured outputs, which are too long to be kept in memory.
+    """
@@ -0,0 +1,90 @@
+import dataclasses
+import os
+import tracemalloc
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from protostar.starknet.cairo_memory_usage import CairoMemoryUsage
+
+
+@dataclass(frozen=True)
+class TestCaseMemoryUsage:
+    python_peak: Optional[int]
+    """
+    The peak size of Python objects allocated by the test case, in bytes.
+    ``None`` when tracing was started by the user and the peak can't be reset, i.e. before Python 3.9.
+    """
+    rss_delta: Optional[int]
+    """
+    Growth of the resident set size of the worker process, in bytes.
+    ``None`` on platforms other than Linux.
+    """
+    vm_segments: int
+    vm_cells: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return dataclasses.asdict(self)
+
+
+class TestCaseMemoryMeter:
+    """
+    Measures memory used by test cases run one after another in a worker process.
+    Python allocations are traced with ``tracemalloc`` only while a test case runs,
+    because tracing slows down the whole VM. Traces of a tracing session started
+    by the user are never cleared.
+    """
+
+    def __init__(self):
+        self.cairo_memory_usage = CairoMemoryUsage()
+        self._rss_before: Optional[int] = None
+        self._started_tracing = False
+        self._traced_before: Optional[int] = None
+
+    def start(self):
+        self.cairo_memory_usage.reset()
+        self._started_tracing = not tracemalloc.is_tracing()
+        self._traced_before = None
+        if self._started_tracing:
+            tracemalloc.start()
+            self._traced_before = 0
+        elif hasattr(tracemalloc, "reset_peak"):
+            # Python 3.9+
+            tracemalloc.reset_peak()  # pylint: disable=no-member
+            self._traced_before, _ = tracemalloc.get_traced_memory()
+        self._rss_before = get_rss()
+
+    def stop(self) -> TestCaseMemoryUsage:
+        rss_after = get_rss()
+        _, traced_peak = tracemalloc.get_traced_memory()
+        if self._started_tracing:
+            tracemalloc.stop()
+        return TestCaseMemoryUsage(
+            python_peak=traced_peak - self._traced_before
+            if self._traced_before is not None
+            else None,
+            rss_delta=rss_after - self._rss_before
+            if rss_after is not None and self._rss_before is not None
+            else None,
+            vm_segments=self.cairo_memory_usage.segments_count,
+            vm_cells=self.cairo_memory_usage.cells_count,
+        )
+
+
+def get_rss() -> Optional[int]:
+    try:
+        with open("/proc/self/statm", encoding="ascii") as statm:
+            resident_pages = int(statm.read().split()[1])
+    except OSError:
+        return None
+    return resident_pages * os.sysconf("SC_PAGE_SIZE")
+
+
+def format_bytes(size: int) -> str:
+    if abs(size) < 1024:
+        return f"{size}B"
+    value = size / 1024
+    for unit in ["KiB", "MiB"]:
+        if abs(value) < 1024:
+            return f"{value:.1f}{unit}"
+        value /= 1024
+    return f"{value:.1f}GiB"
@@ -0,0 +1,69 @@
+import tracemalloc
+
+from protostar.commands.test.test_memory_usage import (
+    TestCaseMemoryMeter,
+    format_bytes,
+)
+
+
+def test_measuring_python_peak():
+    meter = TestCaseMemoryMeter()
+
+    meter.start()
+    allocated = bytearray(1024 * 1024)
+    del allocated
+    memory_usage = meter.stop()
+
+    assert memory_usage.python_peak >= 1024 * 1024
+    assert not tracemalloc.is_tracing()
+
+
+def test_peak_is_measured_per_test_case():
+    meter = TestCaseMemoryMeter()
+    meter.start()
+    allocated = bytearray(1024 * 1024)
+    del allocated
+    meter.stop()
+
+    meter.start()
+    memory_usage = meter.stop()
+
+    assert memory_usage.python_peak < 1024 * 1024
+
+
+def test_tracing_started_by_user_is_kept():
+    tracemalloc.start()
+    try:
+        users_allocation = bytearray(1024 * 1024)
+        meter = TestCaseMemoryMeter()
+        meter.start()
+        memory_usage = meter.stop()
+
+        assert tracemalloc.is_tracing()
+        traced_size, _ = tracemalloc.get_traced_memory()
+        assert traced_size >= len(users_allocation)
+        if hasattr(tracemalloc, "reset_peak"):
+            assert memory_usage.python_peak is not None
+            assert memory_usage.python_peak < 1024 * 1024
+        else:
+            assert memory_usage.python_peak is None
+    finally:
+        tracemalloc.stop()
+
+
+def test_cairo_memory_usage_is_reset():
+    meter = TestCaseMemoryMeter()
+    meter.cairo_memory_usage.segments_count = 3
+    meter.cairo_memory_usage.cells_count = 10
+
+    meter.start()
+    memory_usage = meter.stop()
+
+    assert (memory_usage.vm_segments, memory_usage.vm_cells) == (0, 0)
+
+
+def test_formatting_bytes():
+    assert format_bytes(512) == "512B"
+    assert format_bytes(1536) == "1.5KiB"
+    assert format_bytes(-3 * 1024 * 1024) == "-3.0MiB"
+    assert format_bytes(5 * 1024**3) == "5.0GiB"
@@ -1,6 +1,10 @@
+import os
+import shutil
+import tempfile
 from contextlib import contextmanager, redirect_stdout
-from typing import Union, Tuple, Dict, Generator
-from io import StringIO
+from io import TextIOBase
+from pathlib import Path
+from typing import Union, Tuple, Dict, Generator, Optional, TextIO
 from dataclasses import dataclass, field
 from copy import deepcopy
 
@@ -10,6 +14,9 @@ Output name is a sequence of atomic strings, like ``"setup"`` or ``"test"``,
 or ``("test", 1)``.
 """
 
+OUTPUT_HEAD_SIZE = 8 * 1024
+OUTPUT_TAIL_SIZE = 8 * 1024
+
 
 def format_output_name(name: OutputName) -> str:
     if isinstance(name, str):
@@ -17,27 +24,165 @@ def format_output_name(name: OutputName) -> str:
     return f"{name[0]}:{name[1]}"
 
 
+class CapturedOutput(TextIOBase):
+    """
+    Keeps only the beginning and the end of an output in memory, so that printing in a loop
+    doesn't blow up test results sent to the main process. Once an output outgrows them,
+    the whole output is written to a temporary file in ``spill_dir``, and the middle is replaced
+    by a note pointing to that file. Outputs which are likely to be dropped are created with
+    ``spill=False``, and their middle is omitted without saving it.
+    """
+
+    def __init__(
+        self,
+        head_size: int = OUTPUT_HEAD_SIZE,
+        tail_size: int = OUTPUT_TAIL_SIZE,
+        spill_dir: Optional[Path] = None,
+        spill: bool = True,
+    ):
+        super().__init__()
+        self._head_size = head_size
+        self._tail_size = tail_size
+        self._spill_dir = spill_dir
+        self._spill = spill
+        self._head = ""
+        self._tail = ""
+        self._size = 0
+        self.spill_path: Optional[str] = None
+        self._spill_file: Optional[TextIO] = None
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, s: str) -> int:
+        written_size = len(s)
+        if (
+            self._spill
+            and self._size + written_size > self._head_size + self._tail_size
+        ):
+            self._write_to_spill_file(s)
+        self._size += written_size
+
+        head_left = self._head_size - len(self._head)
+        if head_left > 0:
+            self._head += s[:head_left]
+            s = s[head_left:]
+        if s:
+            self._tail = (self._tail + s)[-self._tail_size :]
+        return written_size
+
+    def write_unbounded(self, s: str):
+        self._head += s
+        self._size += len(s)
+
+    def flush(self):
+        if self._spill_file is not None:
+            self._spill_file.flush()
+
+    def close(self):
+        """Closes the spill file, which is kept, because results refer to it."""
+        if self._spill_file is not None:
+            self._spill_file.close()
+            self._spill_file = None
+        super().close()
+
+    def discard(self):
+        """Closes and removes the spill file, unless it belongs to the output this one was forked from."""
+        owns_spill_file = self._spill_file is not None
+        self.close()
+        if owns_spill_file and self.spill_path is not None:
+            os.unlink(self.spill_path)
+            self.spill_path = None
+
+    def getvalue(self) -> str:
+        omitted_size = self._size - len(self._head) - len(self._tail)
+        if omitted_size == 0:
+            return self._head + self._tail
+        if self.spill_path is None:
+            return f"{self._head}\n[{omitted_size} characters omitted]\n{self._tail}"
+        return (
+            f"{self._head}\n"
+            f"[{omitted_size} characters omitted, full output saved in {self.spill_path}]\n"
+            f"{self._tail}"
+        )
+
+    def _write_to_spill_file(self, s: str):
+        if self._spill_file is None:
+            previous_spill_path = self.spill_path
+            if self._spill_dir is not None:
+                self._spill_dir.mkdir(parents=True, exist_ok=True)
+            file_descriptor, self.spill_path = tempfile.mkstemp(
+                prefix="protostar-output-", suffix=".txt", dir=self._spill_dir
+            )
+            # pylint: disable=consider-using-with
+            self._spill_file = open(file_descriptor, mode="w", encoding="utf-8")
+            if previous_spill_path is None:
+                # Nothing has been omitted yet.
+                self._spill_file.write(self.getvalue())
+            else:
+                # A forked output continues a copy of the parent's file.
+                with open(previous_spill_path, mode="r", encoding="utf-8") as source:
+                    shutil.copyfileobj(source, self._spill_file)
+        self._spill_file.write(s)
+
+    def __deepcopy__(self, memo) -> "CapturedOutput":
+        self.flush()
+        copy = CapturedOutput(
+            self._head_size, self._tail_size, self._spill_dir, self._spill
+        )
+        copy._head = self._head
+        copy._tail = self._tail
+        copy._size = self._size
+        # The file is copied only if the forked output is written to.
+        copy.spill_path = self.spill_path
+        return copy
+
+
 @dataclass
 class OutputRecorder:
-    captures: Dict[OutputName, StringIO] = field(default_factory=dict)
+    captures: Dict[OutputName, CapturedOutput] = field(default_factory=dict)
     """
     Readonly.
     """
+    spill_dir: Optional[Path] = None
+    """
+    Directory of full outputs which are too long to be kept in memory,
+    the system temporary directory by default.
+    """
 
-    def record(self, name: OutputName) -> StringIO:
+    def record(self, name: OutputName, spill: bool = True) -> CapturedOutput:
         if name in self.captures:
             raise KeyError(f"Output {format_output_name(name)} is already recorded.")
 
-        buffer = StringIO()
+        buffer = CapturedOutput(spill_dir=self.spill_dir, spill=spill)
         self.captures[name] = buffer
         return buffer
 
+    def record_captured(self, name: OutputName, value: str):
+        """
+        Records a value returned by ``get_captures`` of another recorder, e.g. of a forked process,
+        without applying size limits again.
+        """
+        buffer = self.record(name)
+        buffer.write_unbounded(value)
+
+    def drop(self, name: OutputName):
+        buffer = self.captures.pop(name, None)
+        if buffer is not None:
+            buffer.discard()
+
+    def close(self):
+        for buffer in self.captures.values():
+            buffer.close()
+
     def get_captures(self) -> Dict[OutputName, str]:
         return {k: v.getvalue() for k, v in self.captures.items()}
 
     @contextmanager
-    def redirect(self, name: OutputName) -> Generator[None, None, None]:
-        with redirect_stdout(self.record(name)):
+    def redirect(
+        self, name: OutputName, spill: bool = True
+    ) -> Generator[None, None, None]:
+        with redirect_stdout(self.record(name, spill)):
             yield
 
     def fork(self) -> "OutputRecorder":
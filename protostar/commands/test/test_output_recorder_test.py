@@ -1,6 +1,12 @@
+from copy import deepcopy
+from pathlib import Path
+
 import pytest
 from protostar.commands.test.test_output_recorder import (
+    OUTPUT_HEAD_SIZE,
+    OUTPUT_TAIL_SIZE,
     format_output_name,
+    CapturedOutput,
     OutputRecorder,
 )
 
@@ -44,3 +50,77 @@ def test_fork():
     assert "foo" in output_recorder.captures
     assert "bar" not in output_recorder.captures
     assert {"foo": "FOO", "bar": "BAR"} == new_output_recorder.get_captures()
+
+
+def test_long_output_keeps_head_and_tail():
+    output = CapturedOutput(head_size=4, tail_size=4)
+
+    output.write("abc")
+    output.write("def")
+    assert output.getvalue() == "abcdef"
+    assert output.spill_path is None
+
+    output.write("ghijkl")
+    value = output.getvalue()
+    assert value.startswith("abcd\n[4 characters omitted, full output saved in ")
+    assert value.endswith("]\nijkl")
+    output.flush()
+    assert Path(str(output.spill_path)).read_text() == "abcdefghijkl"
+
+
+def test_forked_output_copies_spill_file_on_write():
+    output = CapturedOutput(head_size=2, tail_size=2)
+    output.write("abcde")
+
+    forked_output = deepcopy(output)
+    assert forked_output.spill_path == output.spill_path
+    forked_output.write("f")
+    output.write("g")
+    output.flush()
+    forked_output.flush()
+
+    assert forked_output.spill_path != output.spill_path
+    assert Path(str(output.spill_path)).read_text() == "abcdeg"
+    assert Path(str(forked_output.spill_path)).read_text() == "abcdef"
+
+
+def test_drop():
+    output_recorder = OutputRecorder()
+    output_recorder.record("foo").write("FOO")
+
+    output_recorder.drop("foo")
+
+    assert output_recorder.get_captures() == {}
+
+
+def test_dropping_output_removes_spill_file(tmp_path: Path):
+    output_recorder = OutputRecorder(spill_dir=tmp_path)
+    output = output_recorder.record("foo")
+    output.write("x" * (OUTPUT_HEAD_SIZE + OUTPUT_TAIL_SIZE + 1))
+    assert output.spill_path is not None
+    assert Path(output.spill_path).parent == tmp_path
+
+    output_recorder.drop("foo")
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_dropping_forked_output_keeps_spill_file_of_original(tmp_path: Path):
+    output = CapturedOutput(head_size=2, tail_size=2, spill_dir=tmp_path)
+    output.write("abcde")
+    output_recorder = OutputRecorder(captures={"foo": output})
+
+    forked_output_recorder = output_recorder.fork()
+    forked_output_recorder.drop("foo")
+    output_recorder.close()
+
+    assert Path(str(output.spill_path)).read_text() == "abcde"
+
+
+def test_output_without_spilling():
+    output = CapturedOutput(head_size=2, tail_size=2, spill=False)
+
+    output.write("abcdef")
+
+    assert output.spill_path is None
+    assert output.getvalue() == "ab\n[2 characters omitted]\nef"
@@ -2,6 +2,7 @@ from pathlib import Path
 from typing import Callable, Dict, List
 
 from protostar.commands.test.test_environment_exceptions import ExceptionMetadata
+from protostar.commands.test.test_memory_usage import TestCaseMemoryUsage, format_bytes
 from protostar.commands.test.test_output_recorder import OutputName, format_output_name
 from protostar.protostar_exception import UNEXPECTED_PROTOSTAR_ERROR_MSG
 from protostar.utils.log_color_provider import log_color_provider
@@ -46,7 +47,10 @@ def _format_passed_test_case_result(
             file_path=passed_test_case_result.file_path,
             execution_time=passed_test_case_result.execution_time,
             test_case_name=passed_test_case_result.test_case_name,
+            memory_usage=passed_test_case_result.memory_usage,
             fuzz_runs_count=None,
+            fuzz_time_report=None,
+            fuzz_telemetry=None,
         )
     )
 
@@ -72,6 +76,11 @@ def _format_failed_test_case_result(
     for key, value in failed_test_case_result.exception.execution_info.items():
         info_items.append(f"{key}={log_color_provider.bold(value)}")
 
+    if failed_test_case_result.memory_usage:
+        info_items.extend(
+            _get_formatted_memory_usage(failed_test_case_result.memory_usage)
+        )
+
     if len(info_items) > 0:
         info = ", ".join(info_items)
         first_line_items.append(log_color_provider.colorize("GRAY", f"({info})"))
@@ -114,10 +123,22 @@ def _format_passed_fuzz_test_case_result(
             f"fuzz_runs={log_color_provider.bold(passed_fuzz_test_case_result.fuzz_runs_count)}"
         )
 
+    if passed_fuzz_test_case_result.fuzz_time_report is not None:
+        for (
+            key,
+            value,
+        ) in passed_fuzz_test_case_result.fuzz_time_report.to_execution_info().items():
+            info_items.append(f"{key}={log_color_provider.bold(value)}")
+
     if passed_fuzz_test_case_result.execution_resources:
         if passed_fuzz_test_case_result.execution_resources.n_steps:
+            approximation_mark = (
+                "~"
+                if passed_fuzz_test_case_result.execution_resources.approximate
+                else ""
+            )
             info_items.append(
-                f"steps={log_color_provider.bold(passed_fuzz_test_case_result.execution_resources.n_steps)}"
+                f"steps={approximation_mark}{log_color_provider.bold(passed_fuzz_test_case_result.execution_resources.n_steps)}"
             )
         if passed_fuzz_test_case_result.execution_resources.n_memory_holes:
             formatted_n_memory_holes = log_color_provider.bold(
@@ -132,6 +153,17 @@ def _format_passed_fuzz_test_case_result(
     first_line = " ".join(first_line_elements)
 
     second_line_elements: List[str] = []
+    if passed_fuzz_test_case_result.fuzz_telemetry is not None:
+        for (
+            key,
+            value,
+        ) in passed_fuzz_test_case_result.fuzz_telemetry.to_execution_info().items():
+            second_line_elements.append(
+                log_color_provider.colorize(
+                    "GRAY", f"{key}={log_color_provider.bold(value)}"
+                )
+            )
+
     if passed_fuzz_test_case_result.execution_resources:
         for (
             builtin_name,
@@ -147,6 +179,14 @@ def _format_passed_fuzz_test_case_result(
                     )
                 )
 
+    if passed_fuzz_test_case_result.memory_usage:
+        second_line_elements.extend(
+            log_color_provider.colorize("GRAY", item)
+            for item in _get_formatted_memory_usage(
+                passed_fuzz_test_case_result.memory_usage
+            )
+        )
+
     stdout_elements = _get_formatted_stdout(
         passed_fuzz_test_case_result.captured_stdout
     )
@@ -204,6 +244,22 @@ def _get_formatted_execution_time(execution_time: float) -> str:
     return f"time={log_color_provider.bold(f'{execution_time:.2f}')}s"
 
 
+def _get_formatted_memory_usage(memory_usage: TestCaseMemoryUsage) -> List[str]:
+    items: List[str] = []
+    if memory_usage.python_peak is not None:
+        items.append(
+            f"python_peak={log_color_provider.bold(format_bytes(memory_usage.python_peak))}"
+        )
+    if memory_usage.rss_delta is not None:
+        sign = "+" if memory_usage.rss_delta >= 0 else ""
+        items.append(
+            f"rss_delta={log_color_provider.bold(sign + format_bytes(memory_usage.rss_delta))}"
+        )
+    items.append(f"vm_segments={log_color_provider.bold(memory_usage.vm_segments)}")
+    items.append(f"vm_cells={log_color_provider.bold(memory_usage.vm_cells)}")
+    return items
+
+
 def _get_formatted_stdout(captured_stdout: Dict[OutputName, str]) -> List[str]:
     result: List[str] = []
 
@@ -4,10 +4,13 @@ from typing import Dict, List, Optional
 
 from typing_extensions import Self
 
+from protostar.commands.test.fuzzing.fuzz_telemetry import FuzzTelemetry
+from protostar.commands.test.fuzzing.fuzz_time_budget import FuzzTimeReport
 from protostar.commands.test.starkware.execution_resources_summary import (
     ExecutionResourcesSummary,
 )
 from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_memory_usage import TestCaseMemoryUsage
 from protostar.commands.test.test_output_recorder import OutputName
 
 
@@ -30,16 +33,21 @@ class TimedTestResult:
 @dataclass(frozen=True)
 class PassedTestCaseResult(TestCaseResult, TimedTestResult):
     execution_resources: Optional[ExecutionResourcesSummary]
+    # Not in `TestCaseResult`, because fields with defaults can't precede fields without them.
+    memory_usage: Optional[TestCaseMemoryUsage] = None
 
 
 @dataclass(frozen=True)
 class FailedTestCaseResult(TestCaseResult, TimedTestResult):
     exception: ReportedException
+    memory_usage: Optional[TestCaseMemoryUsage] = None
 
 
 @dataclass(frozen=True)
 class FuzzResult:
     fuzz_runs_count: Optional[int]
+    fuzz_time_report: Optional[FuzzTimeReport]
+    fuzz_telemetry: Optional[FuzzTelemetry]
 
 
 @dataclass(frozen=True)
@@ -54,7 +62,10 @@ class PassedFuzzTestCaseResult(PassedTestCaseResult, FuzzResult):
             captured_stdout=passed_test_case_result.captured_stdout,
             execution_resources=passed_test_case_result.execution_resources,
             execution_time=passed_test_case_result.execution_time,
+            memory_usage=passed_test_case_result.memory_usage,
             fuzz_runs_count=fuzz_result.fuzz_runs_count,
+            fuzz_time_report=fuzz_result.fuzz_time_report,
+            fuzz_telemetry=fuzz_result.fuzz_telemetry,
         )
 
 
@@ -67,6 +78,8 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
         fuzz_result: Optional[FuzzResult],
     ) -> Self:
         fuzz_runs_count = fuzz_result.fuzz_runs_count if fuzz_result else None
+        fuzz_time_report = fuzz_result.fuzz_time_report if fuzz_result else None
+        fuzz_telemetry = fuzz_result.fuzz_telemetry if fuzz_result else None
 
         return cls(
             file_path=failed_test_case_result.file_path,
@@ -74,10 +87,33 @@ class FailedFuzzTestCaseResult(FailedTestCaseResult, FuzzResult):
             captured_stdout=failed_test_case_result.captured_stdout,
             exception=failed_test_case_result.exception,
             execution_time=failed_test_case_result.execution_time,
+            memory_usage=failed_test_case_result.memory_usage,
             fuzz_runs_count=fuzz_runs_count,
+            fuzz_time_report=fuzz_time_report,
+            fuzz_telemetry=fuzz_telemetry,
         )
 
 
+@dataclass(frozen=True)
+class ParametrizedRowResult:
+    row_index: int
+    rows_count: int
+
+    @property
+    def is_last_row(self) -> bool:
+        return self.row_index == self.rows_count - 1
+
+
+@dataclass(frozen=True)
+class PassedParametrizedTestCaseResult(PassedTestCaseResult, ParametrizedRowResult):
+    pass
+
+
+@dataclass(frozen=True)
+class FailedParametrizedTestCaseResult(FailedTestCaseResult, ParametrizedRowResult):
+    pass
+
+
 @dataclass(frozen=True)
 class BrokenTestSuiteResult(TestResult):
     test_case_names: List[str]
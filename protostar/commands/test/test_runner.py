@@ -1,37 +1,51 @@
 import asyncio
+import dataclasses
+import os
 import traceback
+from contextlib import nullcontext
 from dataclasses import dataclass
 from logging import getLogger
-from typing import List, Optional
+from pathlib import Path
+from typing import AsyncIterator, ContextManager, List, Optional
 
 from starkware.starknet.services.api.contract_class import ContractClass
 from starkware.starkware_utils.error_handling import StarkException
 
+from protostar.commands.test.cairo_profiles import write_cairo_profile
 from protostar.commands.test.environments.fuzz_test_execution_environment import (
     FuzzConfig,
 )
 from protostar.commands.test.environments.setup_execution_environment import (
+    SetupCaseExecutionEnvironment,
     SetupExecutionEnvironment,
 )
+from protostar.commands.test.runner_profiler import RunnerPhase, RunnerProfiler
 from protostar.commands.test.starkware.test_execution_state import TestExecutionState
+from protostar.commands.test.test_case_runners.test_case_runner import TestCaseRunner
 from protostar.commands.test.test_case_runners.test_case_runner_factory import (
     TestCaseRunnerFactory,
 )
 from protostar.commands.test.test_config import TestConfig, TestMode
 from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_memory_usage import TestCaseMemoryMeter
 from protostar.commands.test.test_results import (
     BrokenTestSuiteResult,
+    FailedTestCaseResult,
+    TestCaseResult,
     TestResult,
     UnexpectedBrokenTestSuiteResult,
 )
 from protostar.commands.test.test_shared_tests_state import SharedTestsState
 from protostar.commands.test.test_suite import TestSuite, TestCase
 from protostar.protostar_exception import ProtostarException
+from protostar.starknet.cairo_profiler import CairoProfiler
+from protostar.starknet.execution_environment import ExecutionEnvironment
 from protostar.utils.compiler.pass_managers import (
     ProtostarPassMangerFactory,
     TestSuitePassMangerFactory,
 )
 from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
+from protostar.utils.tracing import TraceRecorder, set_trace_recorder, trace_span
 
 logger = getLogger()
 
@@ -44,8 +58,18 @@ class TestRunner:
         fuzz_config: FuzzConfig,
         include_paths: Optional[List[str]] = None,
         disable_hint_validation_in_user_contracts=False,
+        fast_vm: bool = False,
+        profile_path: Optional[Path] = None,
+        runner_profiler: Optional[RunnerProfiler] = None,
+        report_memory: bool = False,
+        outputs_spill_dir: Optional[Path] = None,
     ):
         self.shared_tests_state = shared_tests_state
+        self._fast_vm = fast_vm
+        self._profile_path = profile_path
+        self._runner_profiler = runner_profiler
+        self._report_memory = report_memory
+        self._outputs_spill_dir = outputs_spill_dir
         include_paths = include_paths or []
         # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
         self._fuzz_config = fuzz_config
@@ -73,20 +97,59 @@ class TestRunner:
         disable_hint_validation_in_user_contracts: bool
         # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
         fuzz_config: FuzzConfig
+        fast_vm: bool = False
+        profile_path: Optional[Path] = None
+        runner_profile_path: Optional[Path] = None
+        trace_dir: Optional[Path] = None
+        report_memory: bool = False
+        outputs_spill_dir: Optional[Path] = None
+
+    _worker_loop: Optional[asyncio.AbstractEventLoop] = None
 
     @classmethod
     def worker(cls, args: "TestRunner.WorkerArgs"):
-        asyncio.run(
-            cls(
-                shared_tests_state=args.shared_tests_state,
-                # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
-                fuzz_config=args.fuzz_config,
-                include_paths=args.include_paths,
-                disable_hint_validation_in_user_contracts=args.disable_hint_validation_in_user_contracts,
-            ).run_test_suite(
-                args.test_suite,
-            )
+        runner_profiler = RunnerProfiler() if args.runner_profile_path else None
+        trace_recorder = (
+            TraceRecorder(args.trace_dir, process_name=f"worker {os.getpid()}")
+            if args.trace_dir
+            else None
         )
+        set_trace_recorder(trace_recorder)
+        try:
+            with trace_span(args.test_suite.test_path.name, "test suite"):
+                cls._get_worker_loop().run_until_complete(
+                    cls(
+                        shared_tests_state=args.shared_tests_state,
+                        # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
+                        fuzz_config=args.fuzz_config,
+                        include_paths=args.include_paths,
+                        disable_hint_validation_in_user_contracts=args.disable_hint_validation_in_user_contracts,
+                        fast_vm=args.fast_vm,
+                        profile_path=args.profile_path,
+                        runner_profiler=runner_profiler,
+                        report_memory=args.report_memory,
+                        outputs_spill_dir=args.outputs_spill_dir,
+                    ).run_test_suite(
+                        args.test_suite,
+                    )
+                )
+        finally:
+            set_trace_recorder(None)
+            if trace_recorder:
+                trace_recorder.flush()
+        if runner_profiler and args.runner_profile_path:
+            runner_profiler.dump(args.runner_profile_path)
+
+    @classmethod
+    def _get_worker_loop(cls) -> asyncio.AbstractEventLoop:
+        """
+        Pool processes run many test suites, so each of them uses a single event loop
+        (and its default executor), instead of creating a new one for every test suite.
+        """
+        if cls._worker_loop is None or cls._worker_loop.is_closed():
+            cls._worker_loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(cls._worker_loop)
+        return cls._worker_loop
 
     async def run_test_suite(
         self,
@@ -94,28 +157,43 @@ class TestRunner:
     ):
         test_config = TestConfig(
             # TODO(mkaput): Remove this along with --fuzz-max-examples argument.
-            fuzz_max_examples=self._fuzz_config.max_examples
+            fuzz_max_examples=self._fuzz_config.max_examples,
+            fuzz_workers=self._fuzz_config.workers,
+            fuzz_database_path=self._fuzz_config.database_path,
+            fuzz_time_budget=self._fuzz_config.time_budget,
+            fuzz_shrink_time_limit=self._fuzz_config.shrink_time_limit,
+            fuzz_show_output=self._fuzz_config.show_output,
+            invariant_depth=self._fuzz_config.invariant_depth,
+            invariant_fail_on_revert=self._fuzz_config.invariant_fail_on_revert,
+            fast_vm=self._fast_vm,
+            outputs_spill_dir=self._outputs_spill_dir,
         )
+        # Workers are reused between test suites, so the mode is always set explicitly.
+        ExecutionEnvironment.set_fast_vm(test_config.fast_vm)
+        ExecutionEnvironment.set_runner_profiler(self._runner_profiler)
 
         try:
-            compiled_test = self.tests_compiler.compile_contract(
-                test_suite.test_path,
-                add_debug_info=True,
-            )
+            with self._profile_phase("compile"), trace_span("compile", "setup"):
+                compiled_test = self.tests_compiler.compile_contract(
+                    test_suite.test_path,
+                    add_debug_info=True,
+                )
 
-            execution_state = await self._build_execution_state(
-                test_contract=compiled_test,
-                test_suite=test_suite,
-                test_config=test_config,
-            )
+            with self._profile_phase("setup"):
+                execution_state = await self._build_execution_state(
+                    test_contract=compiled_test,
+                    test_suite=test_suite,
+                    test_config=test_config,
+                )
             if not execution_state:
                 return
-            await self._invoke_test_cases(
-                test_suite=test_suite,
-                execution_state=execution_state,
-            )
+            with self._profile_phase("execution"):
+                await self._invoke_test_cases(
+                    test_suite=test_suite,
+                    execution_state=execution_state,
+                )
         except ProtostarException as ex:
-            self.shared_tests_state.put_result(
+            self._put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -124,7 +202,7 @@ class TestRunner:
             )
 
         except ReportedException as ex:
-            self.shared_tests_state.put_result(
+            self._put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -134,7 +212,7 @@ class TestRunner:
 
         # An unexpected exception in a worker should neither crash nor freeze the whole application
         except BaseException as ex:  # pylint: disable=broad-except
-            self.shared_tests_state.put_result(
+            self._put_result(
                 UnexpectedBrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -143,6 +221,15 @@ class TestRunner:
                 )
             )
 
+    def _profile_phase(self, phase: RunnerPhase) -> ContextManager:
+        if self._runner_profiler is None:
+            return nullcontext()
+        return self._runner_profiler.phase(phase)
+
+    def _put_result(self, test_result: TestResult):
+        with self._profile_phase("ipc"), trace_span("put result", "ipc"):
+            self.shared_tests_state.put_result(test_result)
+
     async def _build_execution_state(
         self,
         test_contract: ContractClass,
@@ -160,11 +247,12 @@ class TestRunner:
 
             if test_suite.setup_fn_name:
                 env = SetupExecutionEnvironment(execution_state)
-                await env.invoke(test_suite.setup_fn_name)
+                with trace_span(test_suite.setup_fn_name, "setup"):
+                    await env.invoke(test_suite.setup_fn_name)
 
             return execution_state
         except StarkException as ex:
-            self.shared_tests_state.put_result(
+            self._put_result(
                 BrokenTestSuiteResult(
                     file_path=test_suite.test_path,
                     test_case_names=test_suite.collect_test_case_names(),
@@ -180,13 +268,12 @@ class TestRunner:
         execution_state: TestExecutionState,
     ) -> None:
         for test_case in test_suite.test_cases:
-            test_result = await self._invoke_test_case(test_case, execution_state)
-            self.shared_tests_state.put_result(test_result)
+            async for test_result in self._invoke_test_case(test_case, execution_state):
+                self._put_result(test_result)
 
-    @staticmethod
     async def _invoke_test_case(
-        test_case: TestCase, initial_state: TestExecutionState
-    ) -> TestResult:
+        self, test_case: TestCase, initial_state: TestExecutionState
+    ) -> AsyncIterator[TestResult]:
         state: TestExecutionState = initial_state.fork()
 
         # TODO(mkaput): Remove this in favor of setting mode explicitly by cheatcodes in setup hooks.
@@ -194,6 +281,68 @@ class TestRunner:
             test_case.test_fn_name, state.contract
         )
 
+        if test_case.setup_fn_name:
+            try:
+                with state.stopwatch.lap(test_case.setup_fn_name), trace_span(
+                    test_case.setup_fn_name, "setup"
+                ):
+                    await SetupCaseExecutionEnvironment(
+                        state, test_case.test_fn_name
+                    ).invoke(test_case.setup_fn_name)
+            except ReportedException as ex:
+                yield FailedTestCaseResult(
+                    file_path=test_case.test_path,
+                    test_case_name=test_case.test_fn_name,
+                    exception=ex,
+                    execution_time=state.stopwatch.total_elapsed,
+                    captured_stdout=state.output_recorder.get_captures(),
+                )
+                return
+
         test_case_runner_factory = TestCaseRunnerFactory(state)
-        test_case_runner = test_case_runner_factory.make(test_case)
-        return await test_case_runner.run()
+
+        # Setup hooks are not profiled, only the test case itself.
+        profiler = CairoProfiler() if self._profile_path else None
+        ExecutionEnvironment.set_profiler(profiler)
+        memory_meter = TestCaseMemoryMeter() if self._report_memory else None
+        ExecutionEnvironment.set_memory_usage(
+            memory_meter.cairo_memory_usage if memory_meter else None
+        )
+        try:
+            if state.config.mode is TestMode.PARAMETRIZED:
+                # Each row is reported separately, as soon as it finishes.
+                rows = test_case_runner_factory.make_parametrized_rows(test_case)
+                for test_case_runner in rows:
+                    with trace_span(test_case_runner.row_name, "test case"):
+                        test_result = await self._run_test_case_runner(
+                            test_case_runner, memory_meter
+                        )
+                    yield test_result
+                return
+
+            test_case_runner = test_case_runner_factory.make(test_case)
+            with trace_span(test_case.test_fn_name, "test case"):
+                test_result = await self._run_test_case_runner(
+                    test_case_runner, memory_meter
+                )
+            yield test_result
+        finally:
+            ExecutionEnvironment.set_profiler(None)
+            ExecutionEnvironment.set_memory_usage(None)
+            # Results hold captured outputs already, only spill files are left open.
+            state.output_recorder.close()
+            if profiler and self._profile_path:
+                write_cairo_profile(profiler, self._profile_path, test_case)
+
+    @staticmethod
+    async def _run_test_case_runner(
+        test_case_runner: TestCaseRunner, memory_meter: Optional[TestCaseMemoryMeter]
+    ) -> TestCaseResult:
+        if memory_meter is None:
+            return await test_case_runner.run()
+        memory_meter.start()
+        try:
+            test_result = await test_case_runner.run()
+        finally:
+            memory_usage = memory_meter.stop()
+        return dataclasses.replace(test_result, memory_usage=memory_usage)
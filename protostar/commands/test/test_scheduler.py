@@ -1,6 +1,7 @@
 import multiprocessing
 import signal
-from typing import TYPE_CHECKING, Callable, List
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, List, Optional
 
 from protostar.commands.test.environments.fuzz_test_execution_environment import (
     FuzzConfig,
@@ -34,6 +35,12 @@ class TestScheduler:
         include_paths: List[str],
         disable_hint_validation: bool,
         exit_first: bool,
+        fast_vm: bool = False,
+        profile_path: Optional[Path] = None,
+        runner_profile_path: Optional[Path] = None,
+        trace_dir: Optional[Path] = None,
+        report_memory: bool = False,
+        outputs_spill_dir: Optional[Path] = None,
     ):
         with multiprocessing.Manager() as manager:
             shared_tests_state = SharedTestsState(
@@ -47,6 +54,12 @@ class TestScheduler:
                     fuzz_config=fuzz_config,
                     include_paths=include_paths,
                     disable_hint_validation_in_user_contracts=disable_hint_validation,
+                    fast_vm=fast_vm,
+                    profile_path=profile_path,
+                    runner_profile_path=runner_profile_path,
+                    trace_dir=trace_dir,
+                    report_memory=report_memory,
+                    outputs_spill_dir=outputs_spill_dir,
                 )
                 for test_suite in test_collector_result.test_suites
             ]
@@ -1,3 +1,4 @@
+import hashlib
 from dataclasses import dataclass
 from pathlib import Path
 from typing import List, Optional
@@ -18,3 +19,12 @@ class TestSuite:
 
     def collect_test_case_names(self) -> List[str]:
         return [tc.test_fn_name for tc in self.test_cases]
+
+
+def get_test_suite_dir_name(test_path: Path) -> str:
+    """
+    Returns a name of a directory for files of the test suite, e.g. ``test_main-0123456789``.
+    Test suites with the same file name in different directories don't collide.
+    """
+    test_path_digest = hashlib.sha1(test_path.as_posix().encode()).hexdigest()[:10]
+    return f"{test_path.stem}-{test_path_digest}"
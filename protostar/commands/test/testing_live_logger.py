@@ -1,11 +1,16 @@
 import queue
 from logging import Logger
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, List, Optional, cast
 
 from tqdm import tqdm as bar
 
+from protostar.commands.test.reporters.test_result_reporter import TestResultReporter
 from protostar.commands.test.test_result_formatter import format_test_result
-from protostar.commands.test.test_results import BrokenTestSuiteResult, TestResult
+from protostar.commands.test.test_results import (
+    BrokenTestSuiteResult,
+    ParametrizedRowResult,
+    TestResult,
+)
 from protostar.commands.test.test_shared_tests_state import SharedTestsState
 from protostar.commands.test.testing_summary import TestingSummary
 
@@ -22,19 +27,27 @@ class TestingLiveLogger:
         no_progress_bar: bool,
         exit_first: bool,
         slowest_tests_to_report_count: int,
+        reporters: Optional[List[TestResultReporter]] = None,
     ) -> None:
         self._logger = logger
         self._no_progress_bar = no_progress_bar
         self.testing_summary = testing_summary
         self.exit_first = exit_first
         self.slowest_tests_to_report_count = slowest_tests_to_report_count
+        self._reporters = reporters or []
+        self._parametrized_rows_count = 0
+        """
+        Rows of parametrized test cases are reported as separate results,
+        but the collector counts each parametrized test case once.
+        """
 
     def log_testing_summary(
         self, test_collector_result: "TestCollector.Result"
     ) -> None:
         self.testing_summary.log(
             logger=self._logger,
-            collected_test_cases_count=test_collector_result.test_cases_count,
+            collected_test_cases_count=test_collector_result.test_cases_count
+            + self._parametrized_rows_count,
             collected_test_suites_count=len(test_collector_result.test_suites),
             slowest_test_cases_to_report_count=self.slowest_tests_to_report_count,
         )
@@ -60,6 +73,8 @@ class TestingLiveLogger:
                         test_result: TestResult = shared_tests_state.get_result()
 
                         self.testing_summary.extend([test_result])
+                        for reporter in self._reporters:
+                            reporter.report(test_result)
 
                         cast(Any, progress_bar).colour = (
                             "RED"
@@ -77,7 +92,13 @@ class TestingLiveLogger:
                             tests_left_n = 0
                             return
 
-                        if isinstance(test_result, BrokenTestSuiteResult):
+                        if (
+                            isinstance(test_result, ParametrizedRowResult)
+                            and not test_result.is_last_row
+                        ):
+                            # The last row completes the parametrized test case.
+                            self._parametrized_rows_count += 1
+                        elif isinstance(test_result, BrokenTestSuiteResult):
                             tests_in_case_count = len(test_result.test_case_names)
                             progress_bar.update(tests_in_case_count)
                             tests_left_n -= tests_in_case_count
@@ -1,42 +1,114 @@
-from collections import defaultdict
+import heapq
+import itertools
+from dataclasses import dataclass
 from logging import Logger
 from pathlib import Path
-from typing import Dict, List, Union
+from typing import Dict, List, Optional, Tuple
 
 from protostar.commands.test.test_results import (
     BrokenTestSuiteResult,
     FailedTestCaseResult,
     PassedTestCaseResult,
+    TestCaseResult,
     TestResult,
+    TimedTestResult,
 )
 from protostar.commands.test.testing_seed import TestingSeed
 from protostar.protostar_exception import ProtostarExceptionSilent
 from protostar.utils.log_color_provider import LogColorProvider, log_color_provider
 
 
+@dataclass(frozen=True)
+class SlowTestCase:
+    file_path: Path
+    test_case_name: str
+    execution_time: float
+
+
+class TestSuiteStatus:
+    # Ordered by precedence, e.g. a test suite with a failed and a passed test case has failed.
+    PASSED = 0
+    FAILED = 1
+    BROKEN = 2
+
+
 class TestingSummary:
+    """
+    Aggregates results as they arrive. Failed test cases and broken test suites are kept
+    in full, but passing test cases are only counted if ``keep_passed`` is ``False``,
+    and only ``slowest_test_cases_capacity`` slowest test cases are remembered if it is set.
+    Rows of parametrized test cases are counted as separate test cases.
+    """
+
     def __init__(
-        self, case_results: List[TestResult], testing_seed: TestingSeed
+        self,
+        case_results: List[TestResult],
+        testing_seed: TestingSeed,
+        keep_passed: bool = True,
+        slowest_test_cases_capacity: Optional[int] = None,
     ) -> None:
         self.testing_seed = testing_seed
-        self.case_results = []
-        self.test_suites_mapping: Dict[Path, List[TestResult]] = defaultdict(list)
         self.passed: List[PassedTestCaseResult] = []
         self.failed: List[FailedTestCaseResult] = []
         self.broken: List[BrokenTestSuiteResult] = []
+        self.passed_count = 0
+        self._keep_passed = keep_passed
+        self._slowest_test_cases_capacity = slowest_test_cases_capacity
+        self._slowest_test_cases: List[Tuple[float, int, SlowTestCase]] = []
+        """
+        Min-heap, so that the fastest of remembered test cases is replaced first.
+        """
+        self._arrival_counter = itertools.count()
+        self._test_suites_statuses: Dict[Path, int] = {}
         self.extend(case_results)
 
     def extend(self, case_results: List[TestResult]):
-        self.case_results += case_results
         for case_result in case_results:
-            self.test_suites_mapping[case_result.file_path].append(case_result)
-
             if isinstance(case_result, PassedTestCaseResult):
-                self.passed.append(case_result)
+                self.passed_count += 1
+                if self._keep_passed:
+                    self.passed.append(case_result)
+                self._update_test_suite_status(
+                    case_result.file_path, TestSuiteStatus.PASSED
+                )
             if isinstance(case_result, FailedTestCaseResult):
                 self.failed.append(case_result)
+                self._update_test_suite_status(
+                    case_result.file_path, TestSuiteStatus.FAILED
+                )
             if isinstance(case_result, BrokenTestSuiteResult):
                 self.broken.append(case_result)
+                self._update_test_suite_status(
+                    case_result.file_path, TestSuiteStatus.BROKEN
+                )
+            if isinstance(case_result, TimedTestResult) and isinstance(
+                case_result, TestCaseResult
+            ):
+                self._remember_if_slow(case_result)
+
+    def _update_test_suite_status(self, file_path: Path, status: int):
+        self._test_suites_statuses[file_path] = max(
+            status, self._test_suites_statuses.get(file_path, status)
+        )
+
+    def _remember_if_slow(self, case_result: TestCaseResult):
+        assert isinstance(case_result, TimedTestResult)
+        # Arrival order breaks ties, so that earlier test cases are reported first.
+        entry = (
+            case_result.execution_time,
+            -next(self._arrival_counter),
+            SlowTestCase(
+                file_path=case_result.file_path,
+                test_case_name=case_result.test_case_name,
+                execution_time=case_result.execution_time,
+            ),
+        )
+        if self._slowest_test_cases_capacity is None or (
+            len(self._slowest_test_cases) < self._slowest_test_cases_capacity
+        ):
+            heapq.heappush(self._slowest_test_cases, entry)
+        elif self._slowest_test_cases and entry > self._slowest_test_cases[0]:
+            heapq.heapreplace(self._slowest_test_cases, entry)
 
     def log(
         self,
@@ -69,7 +141,7 @@ class TestingSummary:
         logger: Logger,
         slowest_tests_to_report_count: int,
     ):
-        if slowest_tests_to_report_count and (len(self.failed) + len(self.passed)) > 0:
+        if slowest_tests_to_report_count and self._slowest_test_cases:
             logger.info(log_color_provider.bold("Slowest test cases:"))
             print(
                 self._format_slow_test_cases_list(slowest_tests_to_report_count),
@@ -82,7 +154,7 @@ class TestingSummary:
 
     def _get_test_cases_summary(self, collected_test_cases_count: int) -> str:
         failed_test_cases_count = len(self.failed)
-        passed_test_cases_count = len(self.passed)
+        passed_test_cases_count = self.passed_count
 
         return ", ".join(
             self._get_preprocessed_core_testing_summary(
@@ -93,23 +165,11 @@ class TestingSummary:
         )
 
     def _get_test_suites_summary(self, collected_test_suites_count: int) -> str:
-        passed_test_suites_count = 0
-        failed_test_suites_count = 0
-        broken_test_suites_count = 0
-        total_test_suites_count = len(self.test_suites_mapping)
-        for suit_case_results in self.test_suites_mapping.values():
-            partial_summary = TestingSummary(suit_case_results, self.testing_seed)
-
-            if len(partial_summary.broken) > 0:
-                broken_test_suites_count += 1
-                continue
-
-            if len(partial_summary.failed) > 0:
-                failed_test_suites_count += 1
-                continue
-
-            if len(partial_summary.passed) > 0:
-                passed_test_suites_count += 1
+        statuses = list(self._test_suites_statuses.values())
+        passed_test_suites_count = statuses.count(TestSuiteStatus.PASSED)
+        failed_test_suites_count = statuses.count(TestSuiteStatus.FAILED)
+        broken_test_suites_count = statuses.count(TestSuiteStatus.BROKEN)
+        total_test_suites_count = len(statuses)
 
         test_suites_result: List[str] = []
 
@@ -171,15 +231,11 @@ class TestingSummary:
 
         return test_suites_result
 
-    def _get_slowest_test_cases_list(
-        self,
-        failed_and_passed_list: List[Union[PassedTestCaseResult, FailedTestCaseResult]],
-        count: int,
-    ) -> List[Union[PassedTestCaseResult, FailedTestCaseResult]]:
-        lst = sorted(
-            failed_and_passed_list, key=lambda x: x.execution_time, reverse=True
-        )
-        return lst[: min(count, len(lst))]
+    def _get_slowest_test_cases_list(self, count: int) -> List[SlowTestCase]:
+        return [
+            slow_test_case
+            for _, _, slow_test_case in heapq.nlargest(count, self._slowest_test_cases)
+        ]
 
     def _format_slow_test_cases_list(
         self,
@@ -187,7 +243,7 @@ class TestingSummary:
         local_log_color_provider: LogColorProvider = log_color_provider,
     ) -> str:
 
-        slowest_test_cases = self._get_slowest_test_cases_list(self.failed + self.passed, count)  # type: ignore
+        slowest_test_cases = self._get_slowest_test_cases_list(count)
 
         rows: List[List[str]] = []
         for i, test_case in enumerate(slowest_test_cases, 1):
@@ -0,0 +1,97 @@
+from pathlib import Path
+
+from protostar.commands.test.test_environment_exceptions import ReportedException
+from protostar.commands.test.test_results import (
+    BrokenTestSuiteResult,
+    FailedTestCaseResult,
+    PassedParametrizedTestCaseResult,
+    PassedTestCaseResult,
+)
+from protostar.commands.test.testing_seed import TestingSeed
+from protostar.commands.test.testing_summary import TestingSummary
+from protostar.utils.log_color_provider import LogColorProvider
+
+
+def make_passed_result(file_name: str, test_case_name: str, execution_time: float):
+    return PassedTestCaseResult(
+        file_path=Path(file_name),
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=execution_time,
+        execution_resources=None,
+    )
+
+
+def make_failed_result(file_name: str, test_case_name: str, execution_time: float):
+    return FailedTestCaseResult(
+        file_path=Path(file_name),
+        test_case_name=test_case_name,
+        captured_stdout={},
+        execution_time=execution_time,
+        exception=ReportedException(),
+    )
+
+
+def make_log_color_provider() -> LogColorProvider:
+    log_color_provider = LogColorProvider()
+    log_color_provider.is_ci_mode = True
+    return log_color_provider
+
+
+def test_compact_summary_counts_passed_test_cases_without_keeping_them():
+    summary = TestingSummary(
+        [], TestingSeed(1), keep_passed=False, slowest_test_cases_capacity=2
+    )
+
+    summary.extend(
+        [
+            make_passed_result("test_a.cairo", "test_1", 0.3),
+            make_passed_result("test_a.cairo", "test_2", 0.1),
+            make_failed_result("test_b.cairo", "test_3", 0.2),
+            make_passed_result("test_b.cairo", "test_4", 0.4),
+            PassedParametrizedTestCaseResult(
+                file_path=Path("test_c.cairo"),
+                test_case_name="test_5",
+                captured_stdout={},
+                execution_time=0.05,
+                execution_resources=None,
+                row_index=0,
+                rows_count=2,
+            ),
+            BrokenTestSuiteResult(
+                file_path=Path("test_d.cairo"),
+                test_case_names=["test_6"],
+                exception=ValueError(),
+            ),
+        ]
+    )
+
+    assert summary.passed == []
+    assert summary.passed_count == 4
+    assert len(summary.failed) == 1
+    assert len(summary.broken) == 1
+    assert "1 broken, 1 failed, 2 passed, 4 total" in summary._get_test_suites_summary(
+        4
+    )
+    slowest = summary._format_slow_test_cases_list(5, make_log_color_provider())
+    assert [row.split()[2] for row in slowest.split("\n")] == ["test_4", "test_1"]
+
+
+def test_slowest_test_cases_keep_arrival_order_of_equal_times():
+    summary = TestingSummary([], TestingSeed(1))
+
+    summary.extend(
+        [
+            make_passed_result("test_a.cairo", "test_1", 0.1),
+            make_passed_result("test_a.cairo", "test_2", 0.1),
+            make_passed_result("test_a.cairo", "test_3", 0.2),
+        ]
+    )
+
+    slowest = summary._format_slow_test_cases_list(3, make_log_color_provider())
+    assert [row.split()[2] for row in slowest.split("\n")] == [
+        "test_3",
+        "test_1",
+        "test_2",
+    ]
+    assert len(summary.passed) == 3
@@ -16,6 +16,7 @@ from protostar.commands import (
     UpdateCommand,
     UpgradeCommand,
     FormatCommand,
+    HistoryCommand,
 )
 from protostar.commands.init.project_creator import (
     AdaptedProjectCreator,
@@ -165,6 +166,11 @@ def build_di_container(script_root: Path, start_time: float = 0):
             log_color_provider=log_color_provider,
         ),
         FormatCommand(project_root_path, logger),
+        HistoryCommand(
+            project_root_path,
+            log_color_provider=log_color_provider,
+            logger=logger,
+        ),
     ]
     protostar_toml_version_checker = ProtostarTOMLVersionChecker(
         protostar_toml_reader=protostar_toml_reader, version_manager=version_manager
@@ -46,12 +46,13 @@ class MigratorCallCheatcode(Cheatcode):
         inputs: Optional[CairoOrPythonData] = None,
     ):
         try:
-            return asyncio.run(
-                self._gateway_facade.call(
+            return asyncio.run_coroutine_threadsafe(
+                coro=self._gateway_facade.call(
                     address=contract_address,
                     function_name=function_name,
                     inputs=inputs,
-                )
-            )
+                ),
+                loop=self.loop,
+            ).result()
         except (UnknownFunctionException, ContractNotFoundException) as err:
             raise CheatcodeException(self, err.message) from err
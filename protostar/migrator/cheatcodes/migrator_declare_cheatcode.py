@@ -66,14 +66,15 @@ class MigratorDeclareCheatcode(Cheatcode):
         )
 
         try:
-            response = asyncio.run(
-                self._gateway_facade.declare(
+            response = asyncio.run_coroutine_threadsafe(
+                coro=self._gateway_facade.declare(
                     compiled_contract_path=Path(contract_path_str),
                     token=self._config.token,
                     wait_for_acceptance=validated_config.wait_for_acceptance,
                     signer=self._config.signer,
-                )
-            )
+                ),
+                loop=self.loop,
+            ).result()
 
             return DeclaredContract(
                 class_hash=response.class_hash,
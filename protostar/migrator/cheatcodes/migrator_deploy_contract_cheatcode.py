@@ -83,14 +83,15 @@ class MigratorDeployContractCheatcode(Cheatcode):
         compiled_contract_path = self._get_path_to_compiled_contract(
             contract_identifier
         )
-        response = asyncio.run(
-            self._gateway_facade.deploy(
+        response = asyncio.run_coroutine_threadsafe(
+            coro=self._gateway_facade.deploy(
                 compiled_contract_path=compiled_contract_path,
                 inputs=constructor_args,
                 token=self._config.token,
                 wait_for_acceptance=validated_config.wait_for_acceptance,
-            )
-        )
+            ),
+            loop=self.loop,
+        ).result()
         return DeployedContract(contract_address=response.address)
 
     def _get_path_to_compiled_contract(self, contract_identifier: str) -> Path:
@@ -83,8 +83,8 @@ class MigratorInvokeCheatcode(Cheatcode):
                 "Please either provide CLI credentials or a custom signer in invoke call.",
             )
         try:
-            return asyncio.run(
-                self._gateway_facade.invoke(
+            return asyncio.run_coroutine_threadsafe(
+                coro=self._gateway_facade.invoke(
                     contract_address=contract_address,
                     function_name=function_name,
                     max_fee=max_fee,
@@ -92,7 +92,8 @@ class MigratorInvokeCheatcode(Cheatcode):
                     auto_estimate_fee=auto_estimate_fee,
                     signer=signer,
                     account_address=account_address,
-                )
-            )
+                ),
+                loop=self.loop,
+            ).result()
         except (UnknownFunctionException, ContractNotFoundException) as err:
             raise CheatcodeException(self, err.message) from err
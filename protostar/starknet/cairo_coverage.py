@@ -0,0 +1,27 @@
+from typing import Dict, Set, Tuple
+
+BranchEdge = Tuple[int, int]
+
+
+class CairoCoverage:
+    """
+    Branch edges, i.e. pairs of PC offsets connected by a jump, call or return, executed
+    by Cairo programs since the last reset. Edges are grouped by the class hash of executed
+    contract, because PCs of different programs overlap.
+    """
+
+    def __init__(self):
+        self._edges: Dict[bytes, Set[BranchEdge]] = {}
+
+    def reset(self):
+        self._edges = {}
+
+    def get_program_edges(self, class_hash: bytes) -> Set[BranchEdge]:
+        """
+        Returns a set, which the VM running the program identified by ``class_hash`` fills in.
+        """
+        return self._edges.setdefault(class_hash, set())
+
+    @property
+    def edges_count(self) -> int:
+        return sum(len(edges) for edges in self._edges.values())
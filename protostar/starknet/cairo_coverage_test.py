@@ -0,0 +1,22 @@
+from protostar.starknet.cairo_coverage import CairoCoverage
+
+
+def test_edges_are_counted_per_program():
+    coverage = CairoCoverage()
+
+    coverage.get_program_edges(b"a").update({(0, 4), (4, 0)})
+    coverage.get_program_edges(b"b").add((0, 4))
+    coverage.get_program_edges(b"a").add((0, 4))
+
+    assert coverage.edges_count == 3
+
+
+def test_reset():
+    coverage = CairoCoverage()
+    edges = coverage.get_program_edges(b"a")
+    edges.add((0, 4))
+
+    coverage.reset()
+
+    assert coverage.edges_count == 0
+    assert coverage.get_program_edges(b"a") is not edges
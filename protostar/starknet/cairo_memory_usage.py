@@ -0,0 +1,35 @@
+from starkware.cairo.lang.vm.cairo_runner import CairoRunner
+
+
+class CairoMemoryUsage:
+    """
+    Memory segments allocated and memory cells written by Cairo programs since the last reset,
+    summed over all contract calls, including calls of other contracts.
+    """
+
+    def __init__(self):
+        self.segments_count = 0
+        self.cells_count = 0
+
+    def reset(self):
+        self.segments_count = 0
+        self.cells_count = 0
+
+    def add(self, other: "CairoMemoryUsage"):
+        self.segments_count += other.segments_count
+        self.cells_count += other.cells_count
+
+    def subtract(self, other: "CairoMemoryUsage") -> "CairoMemoryUsage":
+        difference = CairoMemoryUsage()
+        difference.segments_count = self.segments_count - other.segments_count
+        difference.cells_count = self.cells_count - other.cells_count
+        return difference
+
+    def copy(self) -> "CairoMemoryUsage":
+        memory_usage = CairoMemoryUsage()
+        memory_usage.add(self)
+        return memory_usage
+
+    def record_runner(self, runner: CairoRunner):
+        self.segments_count += runner.segments.n_segments
+        self.cells_count += len(runner.memory.data)
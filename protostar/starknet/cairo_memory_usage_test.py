@@ -0,0 +1,46 @@
+from types import SimpleNamespace
+from typing import Any
+
+from protostar.starknet.cairo_memory_usage import CairoMemoryUsage
+
+
+def make_runner(n_segments: int, n_cells: int) -> Any:
+    return SimpleNamespace(
+        segments=SimpleNamespace(n_segments=n_segments),
+        memory=SimpleNamespace(data={address: 0 for address in range(n_cells)}),
+    )
+
+
+def test_usage_is_summed_over_runs():
+    memory_usage = CairoMemoryUsage()
+
+    memory_usage.record_runner(make_runner(n_segments=4, n_cells=10))
+    memory_usage.record_runner(make_runner(n_segments=3, n_cells=5))
+
+    assert memory_usage.segments_count == 7
+    assert memory_usage.cells_count == 15
+
+
+def test_reset():
+    memory_usage = CairoMemoryUsage()
+    memory_usage.record_runner(make_runner(n_segments=4, n_cells=10))
+
+    memory_usage.reset()
+
+    assert (memory_usage.segments_count, memory_usage.cells_count) == (0, 0)
+
+
+def test_merging_usage_counted_in_forked_process():
+    memory_usage = CairoMemoryUsage()
+    memory_usage.record_runner(make_runner(n_segments=4, n_cells=10))
+    memory_usage_before_fork = memory_usage.copy()
+
+    memory_usage.record_runner(make_runner(n_segments=3, n_cells=5))
+    difference = memory_usage.subtract(memory_usage_before_fork)
+    memory_usage_before_fork.add(difference)
+
+    assert (difference.segments_count, difference.cells_count) == (3, 5)
+    assert (
+        memory_usage_before_fork.segments_count,
+        memory_usage_before_fork.cells_count,
+    ) == (7, 15)
@@ -0,0 +1,195 @@
+from bisect import bisect_right
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from starkware.cairo.lang.compiler.identifier_definition import FunctionDefinition
+from starkware.cairo.lang.compiler.instruction import Instruction
+from starkware.cairo.lang.compiler.program import Program
+
+Frame = str
+Stack = Tuple[Frame, ...]
+"""Function names, starting from the outermost call."""
+
+CallSites = Tuple[int, ...]
+"""PC offsets of ``call`` instructions, which led to the currently executed function."""
+
+
+class CairoFunctionLocator:
+    """
+    Maps PC offsets of a program to names of functions containing them.
+    """
+
+    def __init__(self, program: Program, label: Optional[str] = None):
+        functions = sorted(
+            (definition.pc, str(name))
+            for name, definition in program.identifiers.as_dict().items()
+            if isinstance(definition, FunctionDefinition)
+        )
+        self._pcs = [pc for pc, _ in functions]
+        main_scope_prefix = f"{program.main_scope}."
+        self._names = [
+            _label_frame(
+                name[len(main_scope_prefix) :]
+                if name.startswith(main_scope_prefix)
+                else name,
+                label,
+            )
+            for _, name in functions
+        ]
+        self._label = label
+
+    def locate(self, pc: int) -> Frame:
+        index = bisect_right(self._pcs, pc) - 1
+        if index < 0:
+            return _label_frame(f"pc={pc}", self._label)
+        return self._names[index]
+
+
+class CairoProgramProfile:
+    """
+    Step counts of a single run of a Cairo program, filled in by the VM.
+    Steps are counted per executed PC and the call sites which led to it,
+    and are mapped to functions only when the run is finished.
+    """
+
+    def __init__(self, locator: CairoFunctionLocator, caller_stack: Stack):
+        self.locator = locator
+        self.caller_stack = caller_stack
+        self.steps: Dict[Tuple[CallSites, int], int] = {}
+        self.call_sites: CallSites = ()
+        self.current_pc = 0
+
+    def record_instruction(self, pc: int, instruction: Instruction):
+        key = (self.call_sites, pc)
+        self.steps[key] = self.steps.get(key, 0) + 1
+
+        if instruction.opcode is Instruction.Opcode.CALL:
+            self.call_sites = (*self.call_sites, pc)
+        elif instruction.opcode is Instruction.Opcode.RET and self.call_sites:
+            self.call_sites = self.call_sites[:-1]
+
+    def get_current_stack(self) -> Stack:
+        return self.get_stack(self.call_sites, self.current_pc)
+
+    def get_stack(self, call_sites: CallSites, pc: int) -> Stack:
+        return (
+            *self.caller_stack,
+            *(self.locator.locate(call_site) for call_site in call_sites),
+            self.locator.locate(pc),
+        )
+
+
+@dataclass(frozen=True)
+class FunctionSteps:
+    name: Frame
+    inclusive: int
+    """Steps executed by the function and all functions it called, including other contracts."""
+    exclusive: int
+    """Steps executed by the function itself."""
+
+
+class CairoProfiler:
+    """
+    Counts VM steps of all Cairo programs run while profiling, e.g. by a single test case.
+
+    A contract called from another one is run by a separate VM. Its steps are attributed to
+    the stack of the caller at the moment of the call, so the counts are aggregated across
+    nested contract calls. Functions of called contracts are prefixed with a short class hash.
+    """
+
+    def __init__(self):
+        self.samples: Dict[Stack, int] = {}
+        self._running: List[CairoProgramProfile] = []
+        self._root_class_hash: Optional[bytes] = None
+        self._locators: Dict[bytes, CairoFunctionLocator] = {}
+
+    def start_program(self, program: Program, class_hash: bytes) -> CairoProgramProfile:
+        if self._root_class_hash is None:
+            self._root_class_hash = class_hash
+
+        locator = self._locators.get(class_hash)
+        if locator is None:
+            label = (
+                None
+                if class_hash == self._root_class_hash
+                else f"0x{class_hash.hex()[:8]}"
+            )
+            locator = CairoFunctionLocator(program, label)
+            self._locators[class_hash] = locator
+
+        program_profile = CairoProgramProfile(
+            locator,
+            caller_stack=self._running[-1].get_current_stack() if self._running else (),
+        )
+        self._running.append(program_profile)
+        return program_profile
+
+    def finish_program(self, program_profile: CairoProgramProfile):
+        assert self._running and self._running[-1] is program_profile
+        self._running.pop()
+
+        for (call_sites, pc), steps in program_profile.steps.items():
+            stack = program_profile.get_stack(call_sites, pc)
+            self.samples[stack] = self.samples.get(stack, 0) + steps
+
+    def add_samples(self, samples: Dict[Stack, int]):
+        for stack, steps in samples.items():
+            self.samples[stack] = self.samples.get(stack, 0) + steps
+
+    def get_samples_since(self, samples_before: Dict[Stack, int]) -> Dict[Stack, int]:
+        """
+        Returns steps counted after ``samples_before`` were copied, e.g. in a forked process.
+        """
+        return {
+            stack: steps - samples_before.get(stack, 0)
+            for stack, steps in self.samples.items()
+            if steps != samples_before.get(stack, 0)
+        }
+
+    @property
+    def total_steps(self) -> int:
+        return sum(self.samples.values())
+
+    def get_functions_steps(self) -> List[FunctionSteps]:
+        """
+        Returns functions sorted by exclusive and then inclusive steps, in descending order.
+        A recursive function is counted once per stack in its inclusive steps.
+        """
+        inclusive: Dict[Frame, int] = {}
+        exclusive: Dict[Frame, int] = {}
+        for stack, steps in self.samples.items():
+            exclusive[stack[-1]] = exclusive.get(stack[-1], 0) + steps
+            for frame in set(stack):
+                inclusive[frame] = inclusive.get(frame, 0) + steps
+
+        return sorted(
+            (
+                FunctionSteps(
+                    name=name,
+                    inclusive=inclusive_steps,
+                    exclusive=exclusive.get(name, 0),
+                )
+                for name, inclusive_steps in inclusive.items()
+            ),
+            key=lambda function: (
+                -function.exclusive,
+                -function.inclusive,
+                function.name,
+            ),
+        )
+
+    def to_collapsed_stacks(self) -> str:
+        """
+        Formats samples in the collapsed stack format, which is the input of flame graph tools,
+        e.g. ``__wrappers__.test_transfer;test_transfer;transfer 42``.
+        """
+        return "".join(
+            f"{';'.join(stack)} {steps}\n"
+            for stack, steps in sorted(self.samples.items())
+        )
+
+
+def _label_frame(name: str, label: Optional[str]) -> Frame:
+    if label is None:
+        return name
+    return f"{label}:{name}"
@@ -0,0 +1,84 @@
+from types import SimpleNamespace
+from typing import Any, Dict
+
+from starkware.cairo.lang.compiler.identifier_definition import FunctionDefinition
+from starkware.cairo.lang.compiler.instruction import Instruction
+from starkware.cairo.lang.compiler.scoped_name import ScopedName
+
+from protostar.starknet.cairo_profiler import CairoProfiler, FunctionSteps
+
+CALL = SimpleNamespace(opcode=Instruction.Opcode.CALL)
+RET = SimpleNamespace(opcode=Instruction.Opcode.RET)
+NOP = SimpleNamespace(opcode=Instruction.Opcode.NOP)
+
+
+def make_program(functions: Dict[str, int]) -> Any:
+    definitions = {
+        ScopedName.from_string(f"__main__.{name}"): FunctionDefinition(
+            pc=pc, decorators=[]
+        )
+        for name, pc in functions.items()
+    }
+    return SimpleNamespace(
+        main_scope=ScopedName.from_string("__main__"),
+        identifiers=SimpleNamespace(as_dict=lambda: definitions),
+    )
+
+
+def test_steps_are_attributed_to_call_stacks():
+    profiler = CairoProfiler()
+    program_profile = profiler.start_program(
+        make_program({"main": 0, "helper": 10}), b"\x01" * 32
+    )
+
+    program_profile.record_instruction(0, NOP)
+    program_profile.record_instruction(1, CALL)
+    program_profile.record_instruction(10, NOP)
+    program_profile.record_instruction(11, RET)
+    program_profile.record_instruction(3, RET)
+    profiler.finish_program(program_profile)
+
+    assert profiler.samples == {("main",): 3, ("main", "helper"): 2}
+    assert profiler.total_steps == 5
+    assert profiler.get_functions_steps() == [
+        FunctionSteps(name="main", inclusive=5, exclusive=3),
+        FunctionSteps(name="helper", inclusive=2, exclusive=2),
+    ]
+    assert profiler.to_collapsed_stacks() == "main 3\nmain;helper 2\n"
+
+
+def test_called_contracts_are_nested_in_caller_stack():
+    profiler = CairoProfiler()
+    caller_profile = profiler.start_program(make_program({"main": 0}), b"\x01" * 32)
+    caller_profile.record_instruction(0, NOP)
+    caller_profile.current_pc = 1
+
+    callee_profile = profiler.start_program(make_program({"transfer": 0}), b"\xab" * 32)
+    callee_profile.record_instruction(0, NOP)
+    callee_profile.record_instruction(1, NOP)
+    profiler.finish_program(callee_profile)
+
+    caller_profile.record_instruction(1, RET)
+    profiler.finish_program(caller_profile)
+
+    assert profiler.samples == {
+        ("main",): 2,
+        ("main", "0xabababab:transfer"): 2,
+    }
+    assert profiler.get_functions_steps()[0] == FunctionSteps(
+        name="main", inclusive=4, exclusive=2
+    )
+
+
+def test_merging_samples_counted_in_forked_process():
+    profiler = CairoProfiler()
+    profiler.samples = {("main",): 3}
+    samples_before_fork = dict(profiler.samples)
+
+    profiler.samples = {("main",): 5, ("main", "helper"): 2}
+    samples = profiler.get_samples_since(samples_before_fork)
+    profiler.samples = samples_before_fork
+    profiler.add_samples(samples)
+
+    assert samples == {("main",): 2, ("main", "helper"): 2}
+    assert profiler.samples == {("main",): 5, ("main", "helper"): 2}
@@ -0,0 +1,55 @@
+import pytest
+from starkware.cairo.lang.compiler.cairo_compile import compile_cairo
+from starkware.cairo.lang.vm.vm_exceptions import VmException
+from starkware.crypto.signature.signature import FIELD_PRIME
+
+from protostar.starknet.cheatable_cairo_function_runner import (
+    CheatableCairoFunctionRunner,
+)
+
+PROGRAM_CODE = """
+func passing():
+    %{
+        vm_enter_scope({"value": 1})
+        vm_exit_scope()
+    %}
+    return ()
+end
+
+func failing():
+    %{
+        vm_enter_scope({"value": 2})
+        raise ValueError("failure")
+    %}
+    return ()
+end
+"""
+
+
+def assert_no_values_bound(runner: CheatableCairoFunctionRunner):
+    for exec_scope in runner.vm.exec_scopes:
+        assert "memory" not in exec_scope
+        assert "vm_enter_scope" not in exec_scope
+
+
+def test_values_bound_to_exec_scopes_are_removed_after_run():
+    runner = CheatableCairoFunctionRunner(
+        compile_cairo(PROGRAM_CODE, prime=FIELD_PRIME)
+    )
+
+    runner.run("passing")
+
+    assert_no_values_bound(runner)
+
+
+def test_values_bound_to_exec_scopes_are_removed_after_failed_run():
+    runner = CheatableCairoFunctionRunner(
+        compile_cairo(PROGRAM_CODE, prime=FIELD_PRIME)
+    )
+
+    with pytest.raises(VmException):
+        runner.run("failing")
+
+    assert len(runner.vm.exec_scopes) == 2
+    assert runner.vm.exec_scopes[-1]["value"] == 2
+    assert_no_values_bound(runner)
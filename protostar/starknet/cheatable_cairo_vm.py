@@ -1,52 +1,135 @@
+from types import CodeType
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Set
+
+from starkware.cairo.lang.compiler.instruction import Instruction
 from starkware.cairo.lang.vm.vm_core import VirtualMachine
+
+from protostar.starknet.cairo_coverage import BranchEdge
+from protostar.starknet.cairo_profiler import CairoProgramProfile
 from protostar.starknet.delayed_builder import DelayedBuilder
 
+InstructionExecutor = Callable[["CheatableVirtualMachine", Instruction], None]
+
 
 class CheatableVirtualMachine(VirtualMachine):
     """
     `VirtualMachine` with modified `step` function that builds cheatcodes created with `DelayedBuilder`.
+    A `DelayedBuilder` is resolved only when the executed hint refers to its name.
+
+    Values that do not change during the run (static locals, builtin runners, `memory` and `vm_*`
+    functions) are bound to each exec scope once, when the scope is entered, instead of being
+    added to and removed from the scope around every executed hint. They refer to the VM,
+    so `unbind_scopes` must be called once the run finishes, even if it fails.
+
+    When `fast_vm` is set, the VM neither records the trace nor accessed addresses. Cairo
+    tracebacks are reconstructed from the fp chain, so errors are reported as usual, but the
+    number of steps has to be read from `current_step` and memory holes cannot be computed.
+
+    When `coverage_edges` is set, the VM adds to it a `(from_pc, to_pc)` pair of offsets for every
+    executed instruction which doesn't simply advance the PC (jumps, calls and returns).
+
+    When `profile` is set, the VM counts executed instructions per PC and call stack in it.
+
+    These modes are set by `configure`, which picks the function executing instructions once,
+    so that disabled modes cost nothing per step.
     """
 
+    fast_vm: bool = False
+    coverage_edges: Optional[Set[BranchEdge]] = None
+    profile: Optional[CairoProgramProfile] = None
+
+    _scope_locals: Optional[Dict[str, Any]] = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._hint_referenced_names: Dict[CodeType, FrozenSet[str]] = {}
+        self._scopes_delayed_builder_names: List[Set[str]] = []
+        self._built_names: Set[str] = set()
+        self._scope_locals = {
+            "memory": self.validated_memory,
+            "vm_load_program": self.load_program,
+            "vm_enter_scope": self.enter_scope,
+            "vm_exit_scope": self.exit_scope,
+            **self.static_locals,
+            **self.builtin_runners,
+        }
+        for exec_scope in self.exec_scopes:
+            self._bind_scope(exec_scope)
+        # An unbound function, a bound method would make a reference cycle.
+        self._execute_instruction: InstructionExecutor = VirtualMachine.run_instruction
+
+    def configure(
+        self,
+        fast_vm: bool = False,
+        coverage_edges: Optional[Set[BranchEdge]] = None,
+        profile: Optional[CairoProgramProfile] = None,
+    ):
+        self.fast_vm = fast_vm
+        self.coverage_edges = coverage_edges
+        self.profile = profile
+
+        execute_instruction: InstructionExecutor = (
+            CheatableVirtualMachine._run_instruction_fast
+            if fast_vm
+            else VirtualMachine.run_instruction
+        )
+        if coverage_edges is not None:
+            execute_instruction = _with_coverage(execute_instruction, coverage_edges)
+        if profile is not None:
+            # Contracts called from hints are attributed to the PC of the hinted instruction.
+            profile.current_pc = self.run_context.pc.offset
+            execute_instruction = _with_profile(execute_instruction, profile)
+        self._execute_instruction = execute_instruction
+
+    def enter_scope(self, new_scope_locals: Optional[dict] = None):
+        super().enter_scope(new_scope_locals)
+        # The main scope is entered by the base constructor, before `_scope_locals` are known.
+        if self._scope_locals is not None:
+            self._bind_scope(self.exec_scopes[-1])
+
+    def exit_scope(self):
+        exited_scope = self.exec_scopes[-1]
+        super().exit_scope()
+        self._scopes_delayed_builder_names.pop()
+        self._unbind_scope(exited_scope)
+
+    def unbind_scopes(self):
+        """
+        Removes values bound to exec scopes and built cheatcodes, which would otherwise make
+        reference cycles between the VM and its scopes. There are memory leaks in 'exec_scopes'.
+        """
+        for exec_scope in self.exec_scopes:
+            self._unbind_scope(exec_scope)
+
     # pylint: disable=C0103,W0212
     def step(self):
         self.skip_instruction_execution = False
         # Execute hints.
         for hint_index, hint in enumerate(self.hints.get(self.run_context.pc, [])):
             exec_locals = self.exec_scopes[-1]
-            exec_locals["memory"] = memory = self.validated_memory
             exec_locals["ap"] = ap = self.run_context.ap
             exec_locals["fp"] = fp = self.run_context.fp
             exec_locals["pc"] = pc = self.run_context.pc
             exec_locals["current_step"] = self.current_step
-            exec_locals["ids"] = hint.consts(pc, ap, fp, memory)
-
-            exec_locals["vm_load_program"] = self.load_program
-            exec_locals["vm_enter_scope"] = self.enter_scope
-            exec_locals["vm_exit_scope"] = self.exit_scope
-            exec_locals.update(self.static_locals)
-            exec_locals.update(self.builtin_runners)
+            exec_locals["ids"] = hint.consts(pc, ap, fp, self.validated_memory)
 
             # --- MODIFICATIONS START ---
-            for name, value in exec_locals.items():
-                if isinstance(value, DelayedBuilder):
-                    exec_locals[name] = value.internal_build(exec_locals)
+            delayed_builder_names = self._scopes_delayed_builder_names[-1]
+            if delayed_builder_names:
+                for name in delayed_builder_names & self._get_hint_referenced_names(
+                    hint.compiled
+                ):
+                    delayed_builder_names.discard(name)
+                    value = exec_locals.get(name)
+                    if isinstance(value, DelayedBuilder):
+                        exec_locals[name] = value.internal_build(exec_locals)
+                        self._built_names.add(name)
             # --- MODIFICATIONS END ---
 
             self.exec_hint(hint.compiled, exec_locals, hint_index=hint_index)
 
-            # There are memory leaks in 'exec_scopes'.
-            # So, we clear some fields in order to reduce the problem.
-            for name in self.builtin_runners:
-                del exec_locals[name]
-
-            for name in self.static_locals:
-                del exec_locals[name]
-
-            del exec_locals["vm_exit_scope"]
-            del exec_locals["vm_enter_scope"]
-            del exec_locals["vm_load_program"]
+            # 'ids' keeps a reference to the memory snapshot of this hint, don't leak it.
             del exec_locals["ids"]
-            del exec_locals["memory"]
 
             if self.skip_instruction_execution:
                 return
@@ -55,4 +138,93 @@ class CheatableVirtualMachine(VirtualMachine):
         instruction = self.decode_current_instruction()
 
         # Run.
-        self.run_instruction(instruction)
+        self._execute_instruction(self, instruction)
+
+    def run_instruction(self, instruction):
+        self._execute_instruction(self, instruction)
+
+    def _run_instruction_fast(self, instruction: Instruction):
+        try:
+            # Compute operands.
+            operands, _operands_mem_addresses = self.compute_operands(instruction)
+        except Exception as exc:
+            raise self.as_vm_exception(exc) from None
+
+        try:
+            # Opcode assertions.
+            self.opcode_assertions(instruction, operands)
+        except Exception as exc:
+            raise self.as_vm_exception(exc) from None
+
+        # --- MODIFICATIONS START ---
+        # Writing to trace and collecting accessed addresses are skipped.
+        # --- MODIFICATIONS END ---
+
+        try:
+            # Update registers.
+            self.update_registers(instruction, operands)
+        except Exception as exc:
+            raise self.as_vm_exception(exc) from None
+
+        self.current_step += 1
+
+    def _bind_scope(self, exec_scope: Dict[str, Any]):
+        assert self._scope_locals is not None
+        exec_scope.update(self._scope_locals)
+        self._scopes_delayed_builder_names.append(
+            {
+                name
+                for name, value in exec_scope.items()
+                if isinstance(value, DelayedBuilder)
+            }
+        )
+
+    def _unbind_scope(self, exec_scope: Dict[str, Any]):
+        assert self._scope_locals is not None
+        for name in [*self._scope_locals, *self._built_names]:
+            exec_scope.pop(name, None)
+
+    def _get_hint_referenced_names(self, code: CodeType) -> FrozenSet[str]:
+        names = self._hint_referenced_names.get(code)
+        if names is None:
+            names = get_referenced_names(code)
+            self._hint_referenced_names[code] = names
+        return names
+
+
+def _with_coverage(
+    execute_instruction: InstructionExecutor, coverage_edges: Set[BranchEdge]
+) -> InstructionExecutor:
+    def run_instruction(vm: CheatableVirtualMachine, instruction: Instruction):
+        if instruction.pc_update is Instruction.PcUpdate.REGULAR:
+            execute_instruction(vm, instruction)
+            return
+
+        from_pc = vm.run_context.pc
+        execute_instruction(vm, instruction)
+        coverage_edges.add((from_pc.offset, vm.run_context.pc.offset))
+
+    return run_instruction
+
+
+def _with_profile(
+    execute_instruction: InstructionExecutor, profile: CairoProgramProfile
+) -> InstructionExecutor:
+    def run_instruction(vm: CheatableVirtualMachine, instruction: Instruction):
+        profile.record_instruction(vm.run_context.pc.offset, instruction)
+        execute_instruction(vm, instruction)
+        profile.current_pc = vm.run_context.pc.offset
+
+    return run_instruction
+
+
+def get_referenced_names(code: CodeType) -> FrozenSet[str]:
+    """
+    Returns names that compiled hint code (including nested functions and comprehensions) may
+    load. The result is a superset, because it also includes attribute names.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, CodeType):
+            names |= get_referenced_names(const)
+    return frozenset(names)
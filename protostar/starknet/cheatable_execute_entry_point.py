@@ -1,5 +1,6 @@
 import asyncio
 import logging
+from contextlib import nullcontext
 from typing import TYPE_CHECKING, Any, Dict, Optional, Tuple, cast
 
 from starkware.cairo.common.cairo_function_runner import CairoFunctionRunner
@@ -27,6 +28,9 @@ from starkware.starkware_utils.error_handling import (
     wrap_with_stark_exception,
 )
 
+from protostar.starknet.cairo_coverage import CairoCoverage
+from protostar.starknet.cairo_memory_usage import CairoMemoryUsage
+from protostar.starknet.cairo_profiler import CairoProfiler
 from protostar.starknet.cheatable_cairo_function_runner import (
     CheatableCairoFunctionRunner,
 )
@@ -34,6 +38,7 @@ from protostar.starknet.cheatable_syscall_handler import CheatableSysCallHandler
 from protostar.starknet.cheatcode import Cheatcode
 
 if TYPE_CHECKING:
+    from protostar.commands.test.runner_profiler import RunnerProfiler
     from protostar.starknet.cheatable_state import CheatableCarriedState
     from protostar.starknet.cheatcode_factory import CheatcodeFactory
 
@@ -44,6 +49,17 @@ logger = logging.getLogger(__name__)
 # pylint: disable=too-many-statements
 class CheatableExecuteEntryPoint(ExecuteEntryPoint):
     cheatcode_factory: Optional["CheatcodeFactory"] = None
+    # Trusted mode for contracts compiled from project sources. Skips the secure run
+    # verification and doesn't track the trace nor memory holes.
+    fast_vm: bool = False
+    # Collects branch edges executed by all contracts, used to guide fuzzing.
+    coverage: Optional[CairoCoverage] = None
+    # Counts VM steps of all contracts per function, used by `protostar test --profile`.
+    profiler: Optional[CairoProfiler] = None
+    # Counts memory segments and cells of all contracts, used by `protostar test --report-memory`.
+    memory_usage: Optional[CairoMemoryUsage] = None
+    # Profiles executor threads running contract calls, used by `protostar test --profile-runner`.
+    runner_profiler: Optional["RunnerProfiler"] = None
 
     def _run(
         self,
@@ -51,6 +67,20 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
         general_config: StarknetGeneralConfig,
         loop: asyncio.AbstractEventLoop,
         tx_execution_context: TransactionExecutionContext,
+    ) -> Tuple[CairoFunctionRunner, syscall_utils.BusinessLogicSysCallHandler]:
+        # `ExecuteEntryPoint.execute` calls this method in an executor thread.
+        runner_profiler = CheatableExecuteEntryPoint.runner_profiler
+        with runner_profiler.profile_thread() if runner_profiler else nullcontext():
+            return self._run_entry_point(
+                state, general_config, loop, tx_execution_context
+            )
+
+    def _run_entry_point(
+        self,
+        state: "CheatableCarriedState",
+        general_config: StarknetGeneralConfig,
+        loop: asyncio.AbstractEventLoop,
+        tx_execution_context: TransactionExecutionContext,
     ) -> Tuple[CairoFunctionRunner, syscall_utils.BusinessLogicSysCallHandler]:
         """
         Runs the selected entry point with the given calldata in the code of the contract deployed
@@ -70,9 +100,15 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
         )
 
         # Run the specified contract entry point with given calldata.
+        coverage = CheatableExecuteEntryPoint.coverage
         with wrap_with_stark_exception(code=StarknetErrorCode.SECURITY_ERROR):
             runner = CheatableCairoFunctionRunner(  # <-- MODIFICATION
-                program=contract_class.program, layout="all"
+                program=contract_class.program,
+                layout="all",
+                fast_vm=CheatableExecuteEntryPoint.fast_vm,
+                coverage_edges=(
+                    coverage.get_program_edges(class_hash) if coverage else None
+                ),
             )
         os_context = os_utils.prepare_os_context(runner=runner)
 
@@ -118,12 +154,12 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
             cheatcode_factory is not None
         ), "Tried to use CheatableExecuteEntryPoint without cheatcodes."
 
-        cheatcodes = cheatcode_factory.build_cheatcodes(
-            syscall_dependencies=syscall_dependencies,
-            internal_calls=syscall_handler.internal_calls,
+        hint_locals.update(
+            cheatcode_factory.build_delayed_cheatcodes(
+                syscall_dependencies=syscall_dependencies,
+                internal_calls=syscall_handler.internal_calls,
+            )
         )
-        for cheatcode in cheatcodes:
-            hint_locals[cheatcode.name] = cheatcode.build()
 
         for custom_hint_local in cheatcode_factory.build_hint_locals():
             hint_locals[custom_hint_local.name] = custom_hint_local.build()
@@ -136,6 +172,15 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
             self.calldata,
         ]
 
+        # Profiling starts right before the run, so that it is always finished below.
+        profiler = CheatableExecuteEntryPoint.profiler
+        program_profile = (
+            profiler.start_program(contract_class.program, class_hash)
+            if profiler
+            else None
+        )
+        runner.profile = program_profile
+
         try:
             runner.run_from_entrypoint(
                 entry_point.offset,
@@ -148,7 +193,7 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
                     "__usort_max_size": 2**20,
                 },
                 run_resources=tx_execution_context.run_resources,
-                verify_secure=True,
+                verify_secure=not CheatableExecuteEntryPoint.fast_vm,
             )
         # --- MODIFICATIONS END ---
 
@@ -185,6 +230,11 @@ class CheatableExecuteEntryPoint(ExecuteEntryPoint):
                 code=StarknetErrorCode.UNEXPECTED_FAILURE,
                 message="Got an unexpected exception during the execution of the transaction.",
             )
+        finally:
+            if profiler and program_profile:
+                profiler.finish_program(program_profile)
+            if CheatableExecuteEntryPoint.memory_usage:
+                CheatableExecuteEntryPoint.memory_usage.record_runner(runner)
 
         # Complete handler validations.
         os_utils.validate_and_process_os_context(
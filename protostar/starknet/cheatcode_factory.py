@@ -1,13 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import Any, Dict, List, Optional
 
 from starkware.starknet.business_logic.execution.objects import CallInfo
 
 from protostar.starknet.cheatcode import Cheatcode
+from protostar.starknet.delayed_builder import DelayedBuilder
 from protostar.starknet.hint_local import HintLocal
 
 
 class CheatcodeFactory(ABC):
+    _cheatcode_names: Optional[List[str]] = None
+
     @abstractmethod
     def build_cheatcodes(
         self,
@@ -19,3 +22,42 @@ class CheatcodeFactory(ABC):
     @abstractmethod
     def build_hint_locals(self) -> List[HintLocal]:
         ...
+
+    def build_delayed_cheatcodes(
+        self,
+        syscall_dependencies: Cheatcode.SyscallDependencies,
+        internal_calls: List[CallInfo],
+    ) -> Dict[str, Any]:
+        """
+        Returns cheatcode hint locals, wrapped in ``DelayedBuilder``s.
+
+        Each cheatcode is a ``BusinessLogicSysCallHandler``, which is costly to construct,
+        and most contract calls never use any cheatcode. Therefore, cheatcodes are built
+        (all together, as they may depend on each other) only when some hint refers to one of them.
+        Cheatcode names are learned from the first, eager, build.
+        """
+        if self._cheatcode_names is None:
+            cheatcodes = self.build_cheatcodes(syscall_dependencies, internal_calls)
+            self._cheatcode_names = [cheatcode.name for cheatcode in cheatcodes]
+            return {cheatcode.name: cheatcode.build() for cheatcode in cheatcodes}
+
+        built_cheatcodes: Dict[str, Cheatcode] = {}
+
+        def build_cheatcode(name: str, exec_locals: Dict) -> Any:
+            if not built_cheatcodes:
+                for cheatcode in self.build_cheatcodes(
+                    syscall_dependencies, internal_calls
+                ):
+                    built_cheatcodes[cheatcode.name] = cheatcode
+
+            built = built_cheatcodes[name].build()
+            if isinstance(built, DelayedBuilder):
+                return built.internal_build(exec_locals)
+            return built
+
+        return {
+            name: DelayedBuilder(
+                lambda exec_locals, name=name: build_cheatcode(name, exec_locals)
+            )
+            for name in self._cheatcode_names
+        }
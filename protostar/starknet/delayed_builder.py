@@ -7,6 +7,8 @@ class DelayedBuilder:
     Callable[[exec_locals], Any]
 
     This callable's job is to create a cheatcode with any exec_locals needed.
+    It is called right before executing the first hint that refers to the hint local
+    holding the builder, and the result replaces the builder in the hint scope.
     """
 
     def __init__(self, callable_to_delay: Callable[..., Any]) -> None:
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TypeVar, Generic
+from typing import TYPE_CHECKING, Generic, Optional, TypeVar
 
 from starkware.starknet.testing.objects import StarknetTransactionExecutionInfo
 from starkware.starkware_utils.error_handling import StarkException
@@ -7,12 +7,18 @@ from starkware.starkware_utils.error_handling import StarkException
 from protostar.commands.test.test_environment_exceptions import (
     StarknetRevertableException,
 )
+from protostar.starknet.cairo_coverage import CairoCoverage
+from protostar.starknet.cairo_memory_usage import CairoMemoryUsage
+from protostar.starknet.cairo_profiler import CairoProfiler
 from protostar.starknet.cheatable_execute_entry_point import (
     CheatableExecuteEntryPoint,
 )
 from protostar.starknet.cheatcode_factory import CheatcodeFactory
 from protostar.starknet.execution_state import ExecutionState
 
+if TYPE_CHECKING:
+    from protostar.commands.test.runner_profiler import RunnerProfiler
+
 InvokeResultT = TypeVar("InvokeResultT")
 
 
@@ -44,3 +50,23 @@ class ExecutionEnvironment(ABC, Generic[InvokeResultT]):
     @staticmethod
     def set_cheatcodes(cheatcode_factory: CheatcodeFactory):
         CheatableExecuteEntryPoint.cheatcode_factory = cheatcode_factory
+
+    @staticmethod
+    def set_fast_vm(fast_vm: bool):
+        CheatableExecuteEntryPoint.fast_vm = fast_vm
+
+    @staticmethod
+    def set_coverage(coverage: Optional[CairoCoverage]):
+        CheatableExecuteEntryPoint.coverage = coverage
+
+    @staticmethod
+    def set_profiler(profiler: Optional[CairoProfiler]):
+        CheatableExecuteEntryPoint.profiler = profiler
+
+    @staticmethod
+    def set_memory_usage(memory_usage: Optional[CairoMemoryUsage]):
+        CheatableExecuteEntryPoint.memory_usage = memory_usage
+
+    @staticmethod
+    def set_runner_profiler(runner_profiler: Optional["RunnerProfiler"]):
+        CheatableExecuteEntryPoint.runner_profiler = runner_profiler
@@ -1,7 +1,9 @@
 from typing import Dict
 
 from starkware.cairo.lang.compiler.ast.cairo_types import CairoType
+from starkware.cairo.lang.compiler.identifier_definition import StructDefinition
 from starkware.starknet.public.abi import AbiType
+from starkware.starknet.public.abi_structs import struct_definition_from_abi_entry
 from starkware.starknet.testing.contract_utils import parse_arguments
 
 
@@ -27,6 +29,14 @@ def get_function_parameters(contract_abi: AbiType, name: str) -> Dict[str, Cairo
     return dict(zip(names, types))
 
 
+def get_abi_structs(contract_abi: AbiType) -> Dict[str, StructDefinition]:
+    return {
+        item["name"]: struct_definition_from_abi_entry(abi_entry=item)
+        for item in contract_abi
+        if item["type"] == "struct"
+    }
+
+
 def find_abi_item(contract_abi: AbiType, name: str) -> Dict:
     for item in contract_abi:
         if item["name"] == name:
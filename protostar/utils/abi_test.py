@@ -1,9 +1,11 @@
 import pytest
 from starkware.cairo.lang.compiler.ast.cairo_types import TypeFelt
+from starkware.cairo.lang.compiler.identifier_definition import MemberDefinition
 from starkware.starknet.compiler.compile import compile_starknet_codes
 from starkware.starknet.public.abi import AbiType
 
 from protostar.utils.abi import (
+    get_abi_structs,
     get_function_parameters,
     has_function_parameters,
     AbiItemNotFoundException,
@@ -29,6 +31,11 @@ end
 func test_fuzz{syscall_ptr : felt*, range_check_ptr}(a, b : felt):
     return ()
 end
+
+@external
+func test_fuzz_point{syscall_ptr : felt*, range_check_ptr}(point : Point):
+    return ()
+end
 """
     abi = compile_starknet_codes([(code, "")]).abi
     assert abi is not None
@@ -69,3 +76,13 @@ def test_get_function_parameters_raises_when_function_not_found(abi: AbiType):
 def test_get_function_parameters_raises_when_asked_for_struct(abi: AbiType):
     with pytest.raises(AbiItemNotFoundException):
         get_function_parameters(abi, "Point")
+
+
+def test_get_abi_structs(abi: AbiType):
+    structs = get_abi_structs(abi)
+
+    assert list(structs) == ["Point"]
+    assert structs["Point"].members == {
+        "x": MemberDefinition(offset=0, cairo_type=TypeFelt()),
+        "y": MemberDefinition(offset=1, cairo_type=TypeFelt()),
+    }
@@ -0,0 +1,84 @@
+import gzip
+from typing import Dict, List, Mapping, Tuple
+
+
+def encode_pprof(
+    samples: Mapping[Tuple[str, ...], int],
+    sample_type: str,
+    unit: str,
+) -> bytes:
+    """
+    Encodes samples, keyed by stacks of function names starting from the outermost call,
+    as a gzipped ``profile.proto`` message, which is read by ``pprof`` and compatible tools.
+
+    Only the subset of the format needed for function-level profiles is written,
+    so no protobuf library is required.
+    """
+    strings: Dict[str, int] = {"": 0}
+
+    def string_index(value: str) -> int:
+        if value not in strings:
+            strings[value] = len(strings)
+        return strings[value]
+
+    function_ids: Dict[str, int] = {}
+
+    def function_id(name: str) -> int:
+        if name not in function_ids:
+            function_ids[name] = len(function_ids) + 1
+        return function_ids[name]
+
+    sample_messages: List[bytes] = []
+    for stack, value in samples.items():
+        # pprof expects the leaf location first.
+        location_ids = [function_id(name) for name in reversed(stack)]
+        sample_messages.append(
+            _packed_varints_field(1, location_ids) + _packed_varints_field(2, [value])
+        )
+
+    value_type = _varint_field(1, string_index(sample_type)) + _varint_field(
+        2, string_index(unit)
+    )
+
+    profile = bytearray(_bytes_field(1, value_type))
+    for sample_message in sample_messages:
+        profile += _bytes_field(2, sample_message)
+    for name, identifier in function_ids.items():
+        # Each function has exactly one location with the same identifier.
+        line = _varint_field(1, identifier)
+        profile += _bytes_field(4, _varint_field(1, identifier) + _bytes_field(4, line))
+        profile += _bytes_field(
+            5,
+            _varint_field(1, identifier)
+            + _varint_field(2, string_index(name))
+            + _varint_field(3, string_index(name)),
+        )
+    for value in strings:
+        profile += _bytes_field(6, value.encode())
+
+    return gzip.compress(bytes(profile))
+
+
+def _varint(value: int) -> bytes:
+    assert value >= 0
+    result = bytearray()
+    while True:
+        byte = value & 0x7F
+        value >>= 7
+        if value:
+            result.append(byte | 0x80)
+        else:
+            result.append(byte)
+            return bytes(result)
+
+
+def _varint_field(field_number: int, value: int) -> bytes:
+    return _varint(field_number << 3) + _varint(value)
+
+
+def _bytes_field(field_number: int, value: bytes) -> bytes:
+    return _varint(field_number << 3 | 2) + _varint(len(value)) + value
+
+
+def _packed_varints_field(field_number: int, values: List[int]) -> bytes:
+    return _bytes_field(field_number, b"".join(_varint(value) for value in values))
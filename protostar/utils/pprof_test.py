@@ -0,0 +1,54 @@
+import gzip
+from typing import List, Tuple, Union
+
+from protostar.utils.pprof import encode_pprof
+
+Field = Tuple[int, Union[int, bytes]]
+
+
+def read_varint(data: bytes, offset: int) -> Tuple[int, int]:
+    value = 0
+    shift = 0
+    while True:
+        byte = data[offset]
+        offset += 1
+        value |= (byte & 0x7F) << shift
+        shift += 7
+        if not byte & 0x80:
+            return value, offset
+
+
+def read_fields(data: bytes) -> List[Field]:
+    fields: List[Field] = []
+    offset = 0
+    while offset < len(data):
+        key, offset = read_varint(data, offset)
+        if key & 7 == 0:
+            value, offset = read_varint(data, offset)
+            fields.append((key >> 3, value))
+        else:
+            length, offset = read_varint(data, offset)
+            fields.append((key >> 3, data[offset : offset + length]))
+            offset += length
+    return fields
+
+
+def test_encode_pprof():
+    profile = read_fields(
+        gzip.decompress(
+            encode_pprof({("main", "helper"): 3, ("main",): 300}, "steps", "count")
+        )
+    )
+
+    string_table = [value for field, value in profile if field == 6]
+    assert string_table == [b"", b"steps", b"count", b"helper", b"main"]
+
+    samples = [read_fields(value) for field, value in profile if field == 2]  # type: ignore
+    # Leaf locations go first.
+    assert samples == [
+        [(1, b"\x01\x02"), (2, b"\x03")],
+        [(1, b"\x02"), (2, b"\xac\x02")],
+    ]
+
+    functions = [read_fields(value) for field, value in profile if field == 5]  # type: ignore
+    assert functions == [[(1, 1), (2, 3), (3, 3)], [(1, 2), (2, 4), (3, 4)]]
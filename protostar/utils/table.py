@@ -0,0 +1,38 @@
+from typing import List, Optional
+
+from protostar.utils.log_color_provider import (
+    LogColorProvider,
+    SupportedColorName,
+    log_color_provider,
+)
+
+
+def format_table(
+    header: List[str],
+    rows: List[List[str]],
+    left_aligned_columns_count: int = 1,
+    rows_colors: Optional[List[SupportedColorName]] = None,
+    local_log_color_provider: LogColorProvider = log_color_provider,
+) -> str:
+    """
+    Formats a table with a bold header and columns separated by two spaces. The first
+    ``left_aligned_columns_count`` columns are aligned to the left, and the rest, usually
+    numbers, to the right.
+    """
+    column_widths = [max(map(len, column)) for column in zip(header, *rows)]
+
+    def format_row(row: List[str]) -> str:
+        return "  ".join(
+            value.ljust(width)
+            if index < left_aligned_columns_count
+            else value.rjust(width)
+            for index, (value, width) in enumerate(zip(row, column_widths))
+        ).rstrip()
+
+    lines = [local_log_color_provider.bold(format_row(header))]
+    for index, row in enumerate(rows):
+        line = format_row(row)
+        if rows_colors is not None:
+            line = local_log_color_provider.colorize(rows_colors[index], line)
+        lines.append(line)
+    return "\n".join(lines)
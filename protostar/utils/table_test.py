@@ -0,0 +1,20 @@
+from protostar.utils.log_color_provider import LogColorProvider
+from protostar.utils.table import format_table
+
+
+def test_formatting_table():
+    color_provider = LogColorProvider()
+    color_provider.is_ci_mode = True
+
+    table = format_table(
+        ["name", "kind", "count"],
+        [["a", "long kind", "1"], ["longer name", "x", "1000"]],
+        left_aligned_columns_count=2,
+        local_log_color_provider=color_provider,
+    )
+
+    assert table.splitlines() == [
+        "name         kind       count",
+        "a            long kind      1",
+        "longer name  x           1000",
+    ]
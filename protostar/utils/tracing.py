@@ -0,0 +1,165 @@
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+from pathlib import Path
+from typing import Any, ContextManager, Dict, List, Optional
+
+TraceEvent = Dict[str, Any]
+
+
+class TraceRecorder:
+    """
+    Records spans in the Chrome Trace Event format, which is read by Perfetto and ``chrome://tracing``.
+
+    Each process records its own events and flushes them to a separate file in ``parts_dir``,
+    so that processes don't have to communicate. Timestamps come from the wall clock,
+    which makes spans of different processes comparable.
+    """
+
+    def __init__(self, parts_dir: Path, process_name: str):
+        self.parts_dir = parts_dir
+        self._events: List[TraceEvent] = []
+        self._pid = os.getpid()
+        self._set_process_name(process_name)
+
+    @contextmanager
+    def span(self, name: str, category: str, **args: Any):
+        start = _now_us()
+        try:
+            yield
+        finally:
+            self.record_span(name, category, start, _now_us(), **args)
+
+    def record_span(
+        self, name: str, category: str, start_us: int, end_us: int, **args: Any
+    ):
+        event: TraceEvent = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": start_us,
+            "dur": end_us - start_us,
+            "pid": self._pid,
+            "tid": threading.get_ident(),
+        }
+        if args:
+            event["args"] = {key: str(value) for key, value in args.items()}
+        self._events.append(event)
+
+    def fork_process(self, process_name: str):
+        """Starts recording a process forked from the current one, without events of the parent."""
+        self._events = []
+        self._pid = os.getpid()
+        self._set_process_name(process_name)
+
+    def flush(self):
+        if not self._events:
+            return
+        self.parts_dir.mkdir(parents=True, exist_ok=True)
+        events, self._events = self._events, []
+        with open(
+            self.parts_dir / f"{self._pid}.jsonl", mode="a", encoding="utf-8"
+        ) as part_file:
+            for event in events:
+                part_file.write(json.dumps(event) + "\n")
+
+    def _set_process_name(self, process_name: str):
+        self._events.append(
+            {
+                "name": "process_name",
+                "ph": "M",
+                "pid": self._pid,
+                "tid": 0,
+                "args": {"name": process_name},
+            }
+        )
+
+
+class TraceBatch:
+    """
+    Records a single span for every ``batch_size`` consecutive items, e.g. fuzz examples,
+    which would clutter the trace if recorded separately.
+    """
+
+    def __init__(
+        self,
+        recorder: Optional[TraceRecorder],
+        name: str,
+        category: str,
+        batch_size: int,
+    ):
+        self._recorder = recorder
+        self._name = name
+        self._category = category
+        self._batch_size = batch_size
+        self._batch_start_us: Optional[int] = None
+        self._batch_end_us = 0
+        self._items_count = 0
+        self._batch_first_item = 0
+
+    @contextmanager
+    def item(self):
+        if self._recorder is None:
+            yield
+            return
+
+        if self._batch_start_us is None:
+            self._batch_start_us = _now_us()
+            self._batch_first_item = self._items_count
+        try:
+            yield
+        finally:
+            self._items_count += 1
+            self._batch_end_us = _now_us()
+            if self._items_count - self._batch_first_item >= self._batch_size:
+                self.finish()
+
+    def finish(self):
+        if self._recorder is None or self._batch_start_us is None:
+            return
+        self._recorder.record_span(
+            self._name,
+            self._category,
+            self._batch_start_us,
+            self._batch_end_us,
+            first=self._batch_first_item,
+            count=self._items_count - self._batch_first_item,
+        )
+        self._batch_start_us = None
+
+
+_current_recorder: Optional[TraceRecorder] = None
+
+
+def set_trace_recorder(recorder: Optional[TraceRecorder]):
+    global _current_recorder  # pylint: disable=global-statement
+    _current_recorder = recorder
+
+
+def get_trace_recorder() -> Optional[TraceRecorder]:
+    return _current_recorder
+
+
+def trace_span(name: str, category: str, **args: Any) -> ContextManager:
+    if _current_recorder is None:
+        return nullcontext()
+    return _current_recorder.span(name, category, **args)
+
+
+def merge_trace_parts(parts_dir: Path, trace_file: Path):
+    """Writes events of all processes to a single JSON file, which can be opened in Perfetto."""
+    events: List[TraceEvent] = []
+    for part_path in sorted(parts_dir.glob("*.jsonl")):
+        with open(part_path, mode="r", encoding="utf-8") as part_file:
+            events.extend(json.loads(line) for line in part_file if line.strip())
+    trace_file.parent.mkdir(parents=True, exist_ok=True)
+    trace_file.write_text(
+        json.dumps({"traceEvents": events, "displayTimeUnit": "ms"}),
+        encoding="utf-8",
+    )
+
+
+def _now_us() -> int:
+    return time.time_ns() // 1000
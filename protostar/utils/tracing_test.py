@@ -0,0 +1,81 @@
+import json
+from pathlib import Path
+
+from protostar.utils.tracing import (
+    TraceBatch,
+    TraceRecorder,
+    merge_trace_parts,
+    set_trace_recorder,
+    trace_span,
+)
+
+
+def load_trace_events(trace_file: Path):
+    return json.loads(trace_file.read_text(encoding="utf-8"))["traceEvents"]
+
+
+def test_recording_spans(tmp_path: Path):
+    recorder = TraceRecorder(tmp_path / "parts", process_name="main")
+
+    with recorder.span("outer", "test suite", path="test_main.cairo"):
+        with recorder.span("inner", "test case"):
+            pass
+    recorder.flush()
+    merge_trace_parts(tmp_path / "parts", tmp_path / "trace.json")
+
+    [metadata, inner, outer] = load_trace_events(tmp_path / "trace.json")
+    assert metadata["ph"] == "M"
+    assert metadata["args"] == {"name": "main"}
+    assert (inner["name"], inner["cat"], inner["ph"]) == ("inner", "test case", "X")
+    assert outer["args"] == {"path": "test_main.cairo"}
+    assert outer["ts"] <= inner["ts"]
+    assert inner["ts"] + inner["dur"] <= outer["ts"] + outer["dur"]
+
+
+def test_trace_span_does_nothing_without_recorder(tmp_path: Path):
+    recorder = TraceRecorder(tmp_path / "parts", process_name="main")
+    set_trace_recorder(recorder)
+    try:
+        with trace_span("recorded", "test case"):
+            pass
+    finally:
+        set_trace_recorder(None)
+    with trace_span("not recorded", "test case"):
+        pass
+    recorder.flush()
+    merge_trace_parts(tmp_path / "parts", tmp_path / "trace.json")
+
+    names = [event["name"] for event in load_trace_events(tmp_path / "trace.json")]
+    assert names == ["process_name", "recorded"]
+
+
+def test_batching_items(tmp_path: Path):
+    recorder = TraceRecorder(tmp_path / "parts", process_name="main")
+    batch = TraceBatch(recorder, name="fuzz examples", category="fuzz", batch_size=2)
+
+    for _ in range(5):
+        with batch.item():
+            pass
+    batch.finish()
+    recorder.flush()
+    merge_trace_parts(tmp_path / "parts", tmp_path / "trace.json")
+
+    spans = load_trace_events(tmp_path / "trace.json")[1:]
+    assert [span["args"] for span in spans] == [
+        {"first": "0", "count": "2"},
+        {"first": "2", "count": "2"},
+        {"first": "4", "count": "1"},
+    ]
+
+
+def test_forked_process_drops_events_of_parent(tmp_path: Path):
+    recorder = TraceRecorder(tmp_path / "parts", process_name="worker")
+    with recorder.span("before fork", "test case"):
+        pass
+
+    recorder.fork_process("fuzz partition 1")
+    recorder.flush()
+    merge_trace_parts(tmp_path / "parts", tmp_path / "trace.json")
+
+    [metadata] = load_trace_events(tmp_path / "trace.json")
+    assert metadata["args"] == {"name": "fuzz partition 1"}
@@ -5,3 +5,5 @@ from pathlib import Path
 ROUNDS_NUMBER = 15  # Times each function is expected to run
 THRESHOLD = 2.145  # A measure which each function run must not exceed
 BENCHMARKS_PATH = Path(__file__).parent.parent.parent / ".benchmarks"
+# Kept apart from pytest-benchmark runs, which `statistical_test.py` expects exactly two of.
+MACRO_BENCHMARKS_PATH = Path(__file__).parent.parent.parent / ".benchmarks-macro"
@@ -0,0 +1,178 @@
+"""
+Runs macro benchmarks and compares them with a stored baseline, e.g.
+``python -m tests.benchmarks.macro_benchmark_runner --save-baseline`` on the base branch
+and ``python -m tests.benchmarks.macro_benchmark_runner --compare`` after a change.
+
+Results are saved in the same shape as pytest-benchmark JSON files, so they are compared
+with the t-test from ``statistical_test.py``.
+"""
+import argparse
+import asyncio
+import json
+import platform
+import re
+import statistics
+import sys
+import tempfile
+from pathlib import Path
+from time import perf_counter
+from typing import List, Optional
+
+from tests.benchmarks.constants import (
+    MACRO_BENCHMARKS_PATH,
+    ROUNDS_NUMBER,
+    THRESHOLD,
+)
+from tests.benchmarks.macro_benchmarks import MacroBenchmark, get_macro_benchmarks
+from tests.benchmarks.statistical_test import calc_t_student_measure
+
+DEFAULT_BASELINE_PATH = MACRO_BENCHMARKS_PATH / "baseline.json"
+DEFAULT_OUTPUT_PATH = MACRO_BENCHMARKS_PATH / "latest.json"
+
+
+async def measure(benchmark: MacroBenchmark, rounds: int) -> dict:
+    """Returns times of a single operation, measured in ``rounds`` rounds after a warm-up round."""
+    with tempfile.TemporaryDirectory() as workdir:
+        await benchmark.setup(Path(workdir))
+        try:
+            await benchmark.run_round()
+            operation_times: List[float] = []
+            operations_count = 0
+            for _ in range(rounds):
+                start = perf_counter()
+                round_operations_count = await benchmark.run_round()
+                elapsed = perf_counter() - start
+                operation_times.append(elapsed / round_operations_count)
+                operations_count += round_operations_count
+        finally:
+            await benchmark.teardown()
+
+    mean = statistics.mean(operation_times)
+    return {
+        "name": benchmark.name,
+        "unit": benchmark.unit,
+        "operations": operations_count,
+        "stats": {
+            "min": min(operation_times),
+            "max": max(operation_times),
+            "mean": mean,
+            "median": statistics.median(operation_times),
+            "stddev": statistics.stdev(operation_times) if rounds > 1 else 0.0,
+            "rounds": rounds,
+            "iterations": 1,
+            "ops": 1 / mean if mean else 0.0,
+        },
+    }
+
+
+def run_benchmarks(rounds: int, name_filter: Optional[re.Pattern]) -> dict:
+    results = []
+    for benchmark in get_macro_benchmarks():
+        if name_filter and not name_filter.search(benchmark.name):
+            continue
+        print(f"Running {benchmark.name}...", flush=True)
+        results.append(asyncio.run(measure(benchmark, rounds)))
+    return {
+        "machine_info": {
+            "python_version": platform.python_version(),
+            "platform": platform.platform(),
+            "processor": platform.processor(),
+        },
+        "benchmarks": results,
+    }
+
+
+def compare(baseline: dict, current: dict) -> bool:
+    """Prints a comparison table and returns ``False`` if any benchmark got significantly slower."""
+    baseline_benchmarks = {
+        benchmark["name"]: benchmark for benchmark in baseline["benchmarks"]
+    }
+    rows = [["benchmark", "baseline", "current", "change", "t", ""]]
+    any_regressed = False
+    for benchmark in current["benchmarks"]:
+        before = baseline_benchmarks.get(benchmark["name"])
+        unit = benchmark["unit"]
+        after_mean = benchmark["stats"]["mean"]
+        if before is None:
+            rows.append(
+                [benchmark["name"], "-", _format_time(after_mean, unit), "", "", "new"]
+            )
+            continue
+
+        before_mean = before["stats"]["mean"]
+        # A positive measure means the benchmark got faster.
+        measure_value = calc_t_student_measure(before, benchmark)
+        regressed = measure_value < -THRESHOLD
+        improved = measure_value > THRESHOLD
+        any_regressed = any_regressed or regressed
+        rows.append(
+            [
+                benchmark["name"],
+                _format_time(before_mean, unit),
+                _format_time(after_mean, unit),
+                f"{(after_mean - before_mean) / before_mean:+.1%}",
+                f"{measure_value:.2f}",
+                "slower" if regressed else "faster" if improved else "",
+            ]
+        )
+
+    column_widths = [max(map(len, column)) for column in zip(*rows)]
+    for row in rows:
+        print(
+            "  ".join(
+                value.ljust(width) for value, width in zip(row, column_widths)
+            ).rstrip()
+        )
+    return not any_regressed
+
+
+def _format_time(seconds: float, unit: str) -> str:
+    for scale, suffix in [(1, "s"), (1e-3, "ms"), (1e-6, "us")]:
+        if seconds >= scale:
+            return f"{seconds / scale:.2f}{suffix}/{unit}"
+    return f"{seconds / 1e-9:.0f}ns/{unit}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rounds", type=int, default=ROUNDS_NUMBER)
+    parser.add_argument(
+        "--filter", type=re.compile, help="Run only benchmarks matching the regexp."
+    )
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--output", type=Path, default=DEFAULT_OUTPUT_PATH)
+    parser.add_argument(
+        "--save-baseline",
+        action="store_true",
+        help="Save results as the baseline instead of the output file.",
+    )
+    parser.add_argument(
+        "--compare",
+        action="store_true",
+        help="Compare results with the baseline and fail if any benchmark got slower.",
+    )
+    args = parser.parse_args()
+
+    if args.compare and args.rounds != ROUNDS_NUMBER:
+        print(
+            f"Warning: the t-test threshold ({THRESHOLD}) assumes {ROUNDS_NUMBER} rounds",
+            file=sys.stderr,
+        )
+
+    baseline = (
+        json.loads(args.baseline.read_text(encoding="utf-8")) if args.compare else None
+    )
+    results = run_benchmarks(args.rounds, args.filter)
+    output_path: Path = args.baseline if args.save_baseline else args.output
+    output_path.parent.mkdir(parents=True, exist_ok=True)
+    output_path.write_text(json.dumps(results, indent=2), encoding="utf-8")
+    print(f"Results saved to {output_path}")
+
+    if baseline is not None:
+        if not compare(baseline, results):
+            sys.exit("Performance assessment: degraded")
+        print("Performance assessment: not degraded")
+
+
+if __name__ == "__main__":
+    main()
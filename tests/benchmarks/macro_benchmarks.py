@@ -0,0 +1,541 @@
+"""
+Macro benchmarks of Protostar's own hot paths, run by ``macro_benchmark_runner.py``.
+
+Each benchmark prepares its inputs once and then measures rounds of the same operation.
+A round reports how many operations it performed, so results are comparable as time per
+operation, e.g. per collected test suite or per fuzz example.
+"""
+import multiprocessing
+from abc import ABC, abstractmethod
+from multiprocessing.managers import SyncManager
+from pathlib import Path
+from string import Template
+from typing import List, Optional
+
+from protostar.commands.test.starkware.test_execution_state import TestExecutionState
+from protostar.commands.test.test_collector import TestCollector
+from protostar.commands.test.test_results import (
+    PassedFuzzTestCaseResult,
+    PassedTestCaseResult,
+    TestResult,
+)
+from protostar.commands.test.test_runner import TestRunner
+from protostar.commands.test.test_shared_tests_state import SharedTestsState
+from protostar.commands.test.test_suite import TestCase, TestSuite
+from protostar.utils.compiler.pass_managers import TestCollectorPassManagerFactory
+from protostar.utils.starknet_compilation import CompilerConfig, StarknetCompiler
+from tests.benchmarks.test_benchmark import (
+    build_test_suite,
+    get_test_starknet_compiler,
+    prepare_suite,
+)
+
+SCRIPT_DIRECTORY = Path(__file__).parent
+BASIC_CONTRACT_PATH = (SCRIPT_DIRECTORY / "basic.cairo").absolute()
+
+IMPLICIT_ARGS = "{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}"
+
+TEST_SUITE_TEMPLATE = Template(
+    """
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.math import assert_not_zero, assert_lt
+
+@external
+func test_first${implicit_args}():
+    let var1 = 1
+    assert_not_zero(var1)
+    return ()
+end
+
+@external
+func test_second${implicit_args}():
+    let var1 = 1
+    let var2 = var1 + 3
+    assert_lt(var1, var2)
+    return ()
+end
+
+@external
+func test_third${implicit_args}():
+    return ()
+end
+"""
+)
+
+TOKEN_MODULE_TEMPLATE = Template(
+    """
+@storage_var
+func ${prefix}_balances(account : felt) -> (balance : felt):
+end
+
+@storage_var
+func ${prefix}_allowances(owner : felt, spender : felt) -> (allowance : felt):
+end
+
+@storage_var
+func ${prefix}_total_supply() -> (total_supply : felt):
+end
+
+@event
+func ${prefix}_transfer_called(sender : felt, recipient : felt, amount : felt):
+end
+
+@view
+func ${prefix}_balance_of${implicit_args}(account : felt) -> (balance : felt):
+    let (balance) = ${prefix}_balances.read(account)
+    return (balance)
+end
+
+@view
+func ${prefix}_allowance${implicit_args}(owner : felt, spender : felt) -> (allowance : felt):
+    let (allowance) = ${prefix}_allowances.read(owner, spender)
+    return (allowance)
+end
+
+@external
+func ${prefix}_mint${implicit_args}(recipient : felt, amount : felt):
+    assert_not_zero(recipient)
+    let (total_supply) = ${prefix}_total_supply.read()
+    ${prefix}_total_supply.write(total_supply + amount)
+    let (balance) = ${prefix}_balances.read(recipient)
+    ${prefix}_balances.write(recipient, balance + amount)
+    return ()
+end
+
+@external
+func ${prefix}_transfer${implicit_args}(recipient : felt, amount : felt) -> (success : felt):
+    let (sender) = get_caller_address()
+    ${prefix}_transfer_internal(sender, recipient, amount)
+    return (1)
+end
+
+@external
+func ${prefix}_transfer_from${implicit_args}(
+        sender : felt, recipient : felt, amount : felt) -> (success : felt):
+    alloc_locals
+    let (caller) = get_caller_address()
+    let (allowance) = ${prefix}_allowances.read(sender, caller)
+    assert_le(amount, allowance)
+    ${prefix}_allowances.write(sender, caller, allowance - amount)
+    ${prefix}_transfer_internal(sender, recipient, amount)
+    return (1)
+end
+
+@external
+func ${prefix}_approve${implicit_args}(spender : felt, amount : felt) -> (success : felt):
+    let (caller) = get_caller_address()
+    assert_not_zero(spender)
+    ${prefix}_allowances.write(caller, spender, amount)
+    return (1)
+end
+
+@external
+func ${prefix}_increase_allowance${implicit_args}(
+        spender : felt, added_value : felt) -> (success : felt):
+    let (caller) = get_caller_address()
+    let (allowance) = ${prefix}_allowances.read(caller, spender)
+    ${prefix}_allowances.write(caller, spender, allowance + added_value)
+    return (1)
+end
+
+@external
+func ${prefix}_decrease_allowance${implicit_args}(
+        spender : felt, subtracted_value : felt) -> (success : felt):
+    let (caller) = get_caller_address()
+    let (allowance) = ${prefix}_allowances.read(caller, spender)
+    assert_le(subtracted_value, allowance)
+    ${prefix}_allowances.write(caller, spender, allowance - subtracted_value)
+    return (1)
+end
+
+func ${prefix}_transfer_internal${implicit_args}(
+        sender : felt, recipient : felt, amount : felt):
+    assert_not_zero(sender)
+    assert_not_zero(recipient)
+    let (sender_balance) = ${prefix}_balances.read(sender)
+    assert_le(amount, sender_balance)
+    ${prefix}_balances.write(sender, sender_balance - amount)
+    let (recipient_balance) = ${prefix}_balances.read(recipient)
+    ${prefix}_balances.write(recipient, recipient_balance + amount)
+    ${prefix}_transfer_called.emit(sender, recipient, amount)
+    return ()
+end
+"""
+)
+
+
+class MacroBenchmark(ABC):
+    name: str
+    unit: str
+    """What a single operation is, e.g. ``suite`` or ``call``."""
+
+    async def setup(self, workdir: Path):
+        pass
+
+    @abstractmethod
+    async def run_round(self) -> int:
+        """Runs a single measured round and returns the number of performed operations."""
+
+    async def teardown(self):
+        pass
+
+
+class CollectingTestSuitesBenchmark(MacroBenchmark):
+    name = "collect_1k_suites"
+    unit = "suite"
+
+    def __init__(self, suites_count: int = 1000, suites_per_directory: int = 50):
+        self._suites_count = suites_count
+        self._suites_per_directory = suites_per_directory
+        self._workdir: Optional[Path] = None
+
+    async def setup(self, workdir: Path):
+        self._workdir = workdir
+        source = TEST_SUITE_TEMPLATE.substitute(implicit_args=IMPLICIT_ARGS)
+        for index in range(self._suites_count):
+            directory = workdir / f"dir_{index // self._suites_per_directory}"
+            directory.mkdir(exist_ok=True)
+            (directory / f"test_suite_{index}.cairo").write_text(
+                source, encoding="utf-8"
+            )
+
+    async def run_round(self) -> int:
+        assert self._workdir
+        test_collector = TestCollector(
+            StarknetCompiler(
+                config=CompilerConfig(disable_hint_validation=True, include_paths=[]),
+                pass_manager_factory=TestCollectorPassManagerFactory,
+            )
+        )
+        result = test_collector.collect(targets=[str(self._workdir)])
+        assert len(result.test_suites) == self._suites_count
+        return self._suites_count
+
+
+class CompilingLargeContractBenchmark(MacroBenchmark):
+    """
+    Compiles a contract of a size similar to an OpenZeppelin ERC20 preset together with
+    its libraries, made of several token modules.
+    """
+
+    name = "compile_erc20_sized_contract"
+    unit = "contract"
+
+    def __init__(self, token_modules_count: int = 6):
+        self._token_modules_count = token_modules_count
+        self._contract_path: Optional[Path] = None
+
+    async def setup(self, workdir: Path):
+        modules = "".join(
+            TOKEN_MODULE_TEMPLATE.substitute(
+                prefix=f"token_{index}", implicit_args=IMPLICIT_ARGS
+            )
+            for index in range(self._token_modules_count)
+        )
+        self._contract_path = workdir / "large_contract.cairo"
+        self._contract_path.write_text(
+            "%lang starknet\n"
+            "from starkware.cairo.common.cairo_builtins import HashBuiltin\n"
+            "from starkware.cairo.common.math import assert_not_zero, assert_le\n"
+            "from starkware.starknet.common.syscalls import get_caller_address\n"
+            + modules,
+            encoding="utf-8",
+        )
+
+    async def run_round(self) -> int:
+        assert self._contract_path
+        get_test_starknet_compiler().compile_contract(
+            self._contract_path, add_debug_info=True
+        )
+        return 1
+
+
+class TestSuiteBenchmark(MacroBenchmark, ABC):
+    """Runs a test suite built from ``source_code`` in a single worker, without the scheduler."""
+
+    def __init__(self):
+        self._manager: Optional[SyncManager] = None
+        self._runner: Optional[TestRunner] = None
+        self._test_suite: Optional[TestSuite] = None
+        self.execution_state: Optional[TestExecutionState] = None
+
+    @property
+    @abstractmethod
+    def source_code(self) -> str:
+        ...
+
+    @property
+    @abstractmethod
+    def case_names(self) -> List[str]:
+        ...
+
+    async def setup(self, workdir: Path):
+        contract_class, self._test_suite = build_test_suite(
+            source_code=self.source_code,
+            case_names=self.case_names,
+            file_path=workdir / "benchmark_test.cairo",
+            setup_fn_name="__setup__" if "func __setup__" in self.source_code else None,
+        )
+        # pylint: disable=consider-using-with
+        self._manager = multiprocessing.Manager()
+        self._runner, _, self.execution_state = await prepare_suite(
+            self._manager, self._test_suite, contract_class
+        )
+        assert self.execution_state, "Test suite is broken"
+
+    async def run_test_case(self) -> PassedTestCaseResult:
+        assert self._runner and self._test_suite and self.execution_state
+        test_case: TestCase = self._test_suite.test_cases[0]
+        results: List[TestResult] = []
+        # pylint: disable=protected-access
+        async for result in self._runner._invoke_test_case(
+            test_case, self.execution_state
+        ):
+            results.append(result)
+        [result] = results
+        assert isinstance(result, PassedTestCaseResult), result
+        return result
+
+    async def teardown(self):
+        if self._manager:
+            self._manager.shutdown()
+
+
+class ForkingStateBenchmark(TestSuiteBenchmark):
+    """Forks the state after ``__setup__`` deployed ``contracts_count`` contracts."""
+
+    unit = "fork"
+
+    def __init__(self, contracts_count: int):
+        super().__init__()
+        self._contracts_count = contracts_count
+        self.name = f"fork_state[contracts={contracts_count}]"
+
+    @property
+    def source_code(self) -> str:
+        return Template(
+            """
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+
+@external
+func __setup__${implicit_args}():
+    %{ for _ in range($contracts_count): deploy_contract("$contract_path") %}
+    return ()
+end
+
+@external
+func test_nothing${implicit_args}():
+    return ()
+end
+"""
+        ).substitute(
+            implicit_args=IMPLICIT_ARGS,
+            contracts_count=self._contracts_count,
+            contract_path=BASIC_CONTRACT_PATH,
+        )
+
+    @property
+    def case_names(self) -> List[str]:
+        return ["test_nothing"]
+
+    async def run_round(self) -> int:
+        assert self.execution_state
+        forks_count = 10
+        for _ in range(forks_count):
+            self.execution_state.fork()
+        return forks_count
+
+
+class CallingEntryPointBenchmark(TestSuiteBenchmark):
+    """Calls a view function of a deployed contract, to measure the overhead of a single call."""
+
+    name = "entry_point_call"
+    unit = "call"
+    calls_count = 100
+
+    @property
+    def source_code(self) -> str:
+        return Template(
+            """
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+
+@contract_interface
+namespace IBasicContract:
+    func get_balance() -> (res : felt):
+    end
+end
+
+@external
+func __setup__${implicit_args}():
+    %{ context.contract_address = deploy_contract("$contract_path").contract_address %}
+    return ()
+end
+
+func call_get_balance${implicit_args}(contract_address : felt, calls_left : felt):
+    if calls_left == 0:
+        return ()
+    end
+    IBasicContract.get_balance(contract_address)
+    return call_get_balance(contract_address, calls_left - 1)
+end
+
+@external
+func test_calls${implicit_args}():
+    alloc_locals
+    local contract_address : felt
+    %{ ids.contract_address = context.contract_address %}
+    call_get_balance(contract_address, $calls_count)
+    return ()
+end
+"""
+        ).substitute(
+            implicit_args=IMPLICIT_ARGS,
+            contract_path=BASIC_CONTRACT_PATH,
+            calls_count=self.calls_count,
+        )
+
+    @property
+    def case_names(self) -> List[str]:
+        return ["test_calls"]
+
+    async def run_round(self) -> int:
+        await self.run_test_case()
+        return self.calls_count
+
+
+class ReadingStorageBenchmark(TestSuiteBenchmark):
+    name = "storage_read"
+    unit = "read"
+    reads_count = 1000
+
+    @property
+    def source_code(self) -> str:
+        return Template(
+            """
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+
+@storage_var
+func balance() -> (res : felt):
+end
+
+func read_balance${implicit_args}(reads_left : felt):
+    if reads_left == 0:
+        return ()
+    end
+    let (res) = balance.read()
+    return read_balance(reads_left - 1)
+end
+
+@external
+func test_reads${implicit_args}():
+    balance.write(42)
+    read_balance($reads_count)
+    return ()
+end
+"""
+        ).substitute(implicit_args=IMPLICIT_ARGS, reads_count=self.reads_count)
+
+    @property
+    def case_names(self) -> List[str]:
+        return ["test_reads"]
+
+    async def run_round(self) -> int:
+        await self.run_test_case()
+        return self.reads_count
+
+
+class FuzzingBenchmark(TestSuiteBenchmark):
+    name = "fuzz_examples"
+    unit = "example"
+
+    @property
+    def source_code(self) -> str:
+        return Template(
+            """
+%lang starknet
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.math_cmp import is_le
+
+@external
+func test_fuzz${implicit_args}(a : felt, b : felt):
+    let (is_a_le_b) = is_le(a, b)
+    let c = a + b + is_a_le_b
+    return ()
+end
+"""
+        ).substitute(implicit_args=IMPLICIT_ARGS)
+
+    @property
+    def case_names(self) -> List[str]:
+        return ["test_fuzz"]
+
+    async def run_round(self) -> int:
+        result = await self.run_test_case()
+        assert isinstance(result, PassedFuzzTestCaseResult)
+        assert result.fuzz_runs_count
+        return result.fuzz_runs_count
+
+
+class SchedulerIpcBenchmark(MacroBenchmark):
+    """Sends test results from a worker process to the main process through the shared queue."""
+
+    name = "scheduler_ipc"
+    unit = "result"
+    results_count = 1000
+
+    def __init__(self):
+        self._manager: Optional[SyncManager] = None
+        self._shared_tests_state: Optional[SharedTestsState] = None
+
+    async def setup(self, workdir: Path):
+        # pylint: disable=consider-using-with
+        self._manager = multiprocessing.Manager()
+        self._shared_tests_state = SharedTestsState(
+            test_collector_result=TestCollector.Result(test_suites=[]),
+            manager=self._manager,
+        )
+
+    async def run_round(self) -> int:
+        assert self._shared_tests_state
+        producer = multiprocessing.Process(
+            target=_put_passed_results,
+            args=(self._shared_tests_state, self.results_count),
+        )
+        producer.start()
+        for _ in range(self.results_count):
+            self._shared_tests_state.get_result()
+        producer.join()
+        return self.results_count
+
+    async def teardown(self):
+        if self._manager:
+            self._manager.shutdown()
+
+
+def _put_passed_results(shared_tests_state: SharedTestsState, results_count: int):
+    for index in range(results_count):
+        shared_tests_state.put_result(
+            PassedTestCaseResult(
+                file_path=Path("tests") / "test_main.cairo",
+                test_case_name=f"test_case_{index}",
+                captured_stdout={},
+                execution_resources=None,
+                execution_time=0.01,
+            )
+        )
+
+
+def get_macro_benchmarks() -> List[MacroBenchmark]:
+    return [
+        CollectingTestSuitesBenchmark(),
+        CompilingLargeContractBenchmark(),
+        *[ForkingStateBenchmark(contracts_count) for contracts_count in [1, 10, 100]],
+        CallingEntryPointBenchmark(),
+        FuzzingBenchmark(),
+        ReadingStorageBenchmark(),
+        SchedulerIpcBenchmark(),
+    ]
@@ -6,7 +6,14 @@ def test_fuzzing(protostar, copy_fixture):
     copy_fixture("test_fuzz.cairo", "./tests")
 
     result = protostar(
-        ["--no-color", "test", "--seed", "12345678", "tests/test_fuzz.cairo"],
+        [
+            "--no-color",
+            "test",
+            "--seed",
+            "12345678",
+            "--show-output",
+            "tests/test_fuzz.cairo",
+        ],
         ignore_exit_code=True,
     )
 
@@ -0,0 +1,52 @@
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+
+@storage_var
+func counter() -> (res : felt):
+end
+
+@external
+func __setup__{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}():
+    counter.write(10)
+    return ()
+end
+
+@external
+func setup_add():
+    %{ parametrize([(1, 2, 3), (0, 0, 0), dict(a=5, b=1, expected=7)]) %}
+    return ()
+end
+
+@external
+func test_add{syscall_ptr : felt*, range_check_ptr}(a : felt, b : felt, expected : felt):
+    assert a + b = expected
+    return ()
+end
+
+@external
+func setup_rows_share_setup_state():
+    %{ parametrize([1, 2]) %}
+    return ()
+end
+
+@external
+func test_rows_share_setup_state{
+    syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr
+}(value : felt):
+    let (res) = counter.read()
+    assert res = 10
+    counter.write(res + value)
+    return ()
+end
+
+@external
+func setup_wrong_row_size():
+    %{ parametrize([(1, 2)]) %}
+    return ()
+end
+
+@external
+func test_wrong_row_size{syscall_ptr : felt*, range_check_ptr}(a : felt, b : felt, c : felt):
+    return ()
+end
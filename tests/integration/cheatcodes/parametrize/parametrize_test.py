@@ -0,0 +1,28 @@
+from pathlib import Path
+
+from tests.integration.conftest import (
+    RunCairoTestRunnerFixture,
+    assert_cairo_test_cases,
+)
+
+
+async def test_parametrize_cheatcode(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "parametrize_test.cairo"
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[
+            "test_add[a=1, b=2, expected=3]",
+            "test_add[a=0, b=0, expected=0]",
+            "test_rows_share_setup_state[value=1]",
+            "test_rows_share_setup_state[value=2]",
+        ],
+        expected_failed_test_cases_names=[
+            "test_add[a=5, b=1, expected=7]",
+            "test_wrong_row_size",
+        ],
+    )
@@ -95,6 +95,9 @@ class RunCairoTestRunnerFixture(Protocol):
         disable_hint_validation=False,
         cairo_path: Optional[List[Path]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        invariant_fail_on_revert=False,
+        project_root_path: Optional[Path] = None,
+        profile_runner=False,
     ) -> TestingSummary:
         ...
 
@@ -117,6 +120,9 @@ def run_cairo_test_runner_fixture(
         disable_hint_validation=False,
         cairo_path: Optional[List[Path]] = None,
         ignored_test_cases: Optional[List[str]] = None,
+        invariant_fail_on_revert=False,
+        project_root_path: Optional[Path] = None,
+        profile_runner=False,
     ) -> TestingSummary:
 
         protostar_directory_mock = mocker.MagicMock()
@@ -135,7 +141,7 @@ def run_cairo_test_runner_fixture(
             ]
 
         return await TestCommand(
-            project_root_path=Path(),
+            project_root_path=project_root_path or Path(),
             protostar_directory=protostar_directory_mock,
             project_cairo_path_builder=project_cairo_path_builder,
             logger=getLogger(),
@@ -147,6 +153,8 @@ def run_cairo_test_runner_fixture(
             fuzz_max_examples=fuzz_max_examples,
             disable_hint_validation=disable_hint_validation,
             cairo_path=cairo_path or [],
+            invariant_fail_on_revert=invariant_fail_on_revert,
+            profile_runner=profile_runner,
         )
 
     return run_cairo_test_runner
@@ -88,3 +88,34 @@ async def test_max_fuzz_runs_less_or_equal_than_specified(
     assert isinstance(testing_summary.passed[0], PassedFuzzTestCaseResult)
     assert testing_summary.passed[0].fuzz_runs_count is not None
     assert testing_summary.passed[0].fuzz_runs_count <= fuzz_max_examples
+
+
+async def test_reverted_handler_calls_are_skipped(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "invariant_handler_revert_test.cairo",
+        fuzz_max_examples=10,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["invariant_balance_is_not_negative"],
+        expected_failed_test_cases_names=[],
+    )
+
+
+async def test_reverted_handler_calls_fail_with_invariant_fail_on_revert(
+    run_cairo_test_runner: RunCairoTestRunnerFixture,
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "invariant_handler_revert_test.cairo",
+        fuzz_max_examples=10,
+        invariant_fail_on_revert=True,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=[],
+        expected_failed_test_cases_names=["invariant_balance_is_not_negative"],
+    )
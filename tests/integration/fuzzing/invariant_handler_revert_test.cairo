@@ -0,0 +1,34 @@
+%lang starknet
+
+from starkware.cairo.common.cairo_builtins import HashBuiltin
+from starkware.cairo.common.math import assert_nn
+
+@storage_var
+func balance() -> (res : felt):
+end
+
+@external
+func __setup__{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}():
+    balance.write(100)
+    return ()
+end
+
+@external
+func handler_withdraw{syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr}(
+    amount : felt
+):
+    let (res) = balance.read()
+    balance.write(res - amount)
+    # Reverts after the write, which must not change the state.
+    assert_nn(res - amount)
+    return ()
+end
+
+@external
+func invariant_balance_is_not_negative{
+    syscall_ptr : felt*, pedersen_ptr : HashBuiltin*, range_check_ptr
+}():
+    let (res) = balance.read()
+    assert_nn(res)
+    return ()
+end
@@ -0,0 +1,15 @@
+%lang starknet
+
+@external
+func test_loop():
+    loop(100)
+    return ()
+end
+
+func loop(n : felt):
+    if n == 0:
+        return ()
+    end
+    loop(n - 1)
+    return ()
+end
@@ -0,0 +1,30 @@
+import pstats
+from pathlib import Path
+
+from tests.integration.conftest import (
+    RunCairoTestRunnerFixture,
+    assert_cairo_test_cases,
+)
+
+
+async def test_cairo_vm_is_profiled(
+    run_cairo_test_runner: RunCairoTestRunnerFixture, tmp_path: Path
+):
+    testing_summary = await run_cairo_test_runner(
+        Path(__file__).parent / "runner_profiler_test.cairo",
+        project_root_path=tmp_path,
+        profile_runner=True,
+    )
+
+    assert_cairo_test_cases(
+        testing_summary,
+        expected_passed_test_cases_names=["test_loop"],
+        expected_failed_test_cases_names=[],
+    )
+    stats = pstats.Stats(
+        str(tmp_path / ".protostar" / "profile-runner" / "runner-execution.pstats")
+    )
+    profiled_function_names = {
+        function_name for _, _, function_name in stats.stats  # type: ignore
+    }
+    assert "run_instruction" in profiled_function_names